@@ -1,5 +1,6 @@
 # global
 import copy
+import contextvars
 import re
 import warnings
 import logging
@@ -583,11 +584,15 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = []
-array_decimal_values_stack = []
-warning_level_stack = []
-nan_policy_stack = []
-dynamic_backend_stack = []
+array_significant_figures_stack = ivy.utils.context.ContextStack(
+    "array_significant_figures_stack"
+)
+array_decimal_values_stack = ivy.utils.context.ContextStack(
+    "array_decimal_values_stack"
+)
+warning_level_stack = ivy.utils.context.ContextStack("warning_level_stack")
+nan_policy_stack = ivy.utils.context.ContextStack("nan_policy_stack")
+dynamic_backend_stack = ivy.utils.context.ContextStack("dynamic_backend_stack")
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
 
@@ -1489,17 +1494,44 @@ class LoggingMode:
             logging.getLogger().setLevel(self.logging_mode_stack[-1])
 
 
+# the global modes are local to each thread and asyncio task, with the values set
+# during the import of ivy as the defaults, while the remaining global props are
+# functions like ivy.default_dtype. The promotion table follows the precise mode.
+_unset = object()
+_context_props = {
+    name: contextvars.ContextVar(f"ivy.{name}")
+    for name in GLOBAL_PROPS + ["promotion_table"]
+    if name in globals() and not callable(globals()[name])
+}
+
+
+def _context_prop(name, var):
+    def fget(self):
+        value = var.get(_unset)
+        return self.__dict__[name] if value is _unset else value
+
+    return property(fget)
+
+
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
-        previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
+        # the code object's filename avoids the source lookup of getframeinfo,
+        # which is costly since this runs on every global mode update
+        filename = inspect.currentframe().f_back.f_code.co_filename
         internal = internal and _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
                 f"Property: {name} is read only! Please use the setter: set_{name}()"
                 " for setting its value!"
             )
-        self.__dict__[name] = value
+        if name in _context_props:
+            _context_props[name].set(value)
+        else:
+            self.__dict__[name] = value
+
+
+for _name, _var in _context_props.items():
+    setattr(IvyWithGlobalProps, _name, _context_prop(_name, _var))
 
 
 if (
@@ -3,11 +3,10 @@
 # global
 import colorama
 
-try:
-    # noinspection PyPackageRequirements
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
+from ivy.utils.dynamic_import import lazy_import
+
+# noinspection PyPackageRequirements
+h5py = lazy_import("h5py")
 
 # local
 from .wrapping import add_ivy_container_instance_methods  # noqa
@@ -9,15 +9,17 @@ import copy
 import termcolor
 import numpy as np
 import json
+import contextvars
+import concurrent.futures
+import queue
+import threading
 
 from ivy.utils.exceptions import IvyBackendException, IvyException
+from ivy.utils.dynamic_import import lazy_import
 
-
-try:
-    # noinspection PyPackageRequirements
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
+# noinspection PyPackageRequirements
+h5py = lazy_import("h5py")
+shared_memory = lazy_import("ivy.utils.shared_memory")
 import pickle
 import random
 from operator import mul
@@ -47,6 +49,158 @@ def _repr(x):
         return str(x)
 
 
+def _collect_hdf5_datasets(h5_obj, dict_out, datasets, alphabetical_keys=True):
+    # fill dict_out with the nested dicts of the groups of h5_obj, and collect the
+    # (dict, key, dataset) entries of its datasets to be read into the dicts
+    items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
+    for key, value in items:
+        if isinstance(value, h5py.Group):
+            dict_out[key] = {}
+            _collect_hdf5_datasets(value, dict_out[key], datasets, alphabetical_keys)
+        elif isinstance(value, h5py.Dataset):
+            datasets.append((dict_out, key, value))
+        else:
+            raise ivy.utils.exceptions.IvyException(
+                "Item found inside h5_obj which was neither a Group nor a Dataset."
+            )
+
+
+def _write_hdf5_rows(
+    h5_obj, key, value_as_np, starting_index, min_size=0, growth_factor=1, **kwargs
+):
+    """
+    Write the rows of value_as_np into the dataset at key of h5_obj from
+    starting_index onwards, with a single slice assignment.
+
+    The dataset is created with at least ``min_size`` rows and the given dataset
+    ``kwargs`` if it doesn't exist yet. If it is too small, it is resized to fit the
+    rows, or to ``growth_factor`` times its size if that is larger, so that appending
+    batches one after another only resizes the dataset a logarithmic number of times.
+    """
+    end = starting_index + value_as_np.shape[0]
+    if key not in h5_obj:
+        shape = [max(min_size, end)] + list(value_as_np.shape[1:])
+        h5_obj.create_dataset(
+            key,
+            shape,
+            dtype=value_as_np.dtype,
+            maxshape=[None for _ in shape],
+            **kwargs,
+        )
+    dataset = h5_obj[key]
+    if end > dataset.shape[0]:
+        dataset.resize(max(end, int(dataset.shape[0] * growth_factor)), axis=0)
+    dataset[starting_index:end] = value_as_np
+
+
+def _read_hdf5_dataset(dataset, slice_obj=slice(None), lazy=False):
+    """
+    Read a slice of an h5py dataset into a numpy array.
+
+    With ``lazy``, contiguous datasets of a file on disk are memory mapped, so that
+    only the accessed pages are read. Chunked datasets sliced along their first axis
+    are read one row of chunks at a time directly into the output array, so that each
+    chunk is only read and decompressed once.
+    """
+    if (
+        lazy
+        and dataset.chunks is None
+        and dataset.shape
+        and dataset.dtype.kind not in "OSUV"
+        and dataset.file.driver == "sec2"
+    ):
+        offset = dataset.id.get_offset()
+        if offset is not None:
+            return np.memmap(
+                dataset.file.filename,
+                dtype=dataset.dtype,
+                mode="c",
+                offset=offset,
+                shape=dataset.shape,
+            )[slice_obj]
+    if (
+        dataset.chunks is None
+        or not isinstance(slice_obj, slice)
+        or slice_obj.step not in (None, 1)
+    ):
+        return dataset[slice_obj]
+    start, stop, _ = slice_obj.indices(dataset.shape[0])
+    stop = max(start, stop)
+    out = np.empty((stop - start, *dataset.shape[1:]), dtype=dataset.dtype)
+    rows = dataset.chunks[0]
+    for chunk_start in range(start - start % rows, stop, rows):
+        lo, hi = max(chunk_start, start), min(chunk_start + rows, stop)
+        dataset.read_direct(
+            out, source_sel=np.s_[lo:hi], dest_sel=np.s_[lo - start : hi - start]
+        )
+    return out
+
+
+def _flatten_container(cont, key_chain, nodes, leaves, key_chains):
+    # append the sub-containers of cont to nodes in pre-order, as the container they
+    # were taken from along with their (key, node index, leaf index) entries, and
+    # their leaves to leaves, along with their key-chains
+    entries = []
+    nodes.append((cont, entries))
+    for key, value in cont.items():
+        kc = key if key_chain == "" else f"{key_chain}/{key}"
+        # checking the type rather than the instance skips the __class__ lookup,
+        # which is slow for ivy arrays
+        if issubclass(type(value), ivy.Container):
+            entries.append((key, len(nodes), None))
+            _flatten_container(value, kc, nodes, leaves, key_chains)
+        else:
+            entries.append((key, None, len(leaves)))
+            leaves.append(value)
+            key_chains.append(kc)
+
+
+def _cont_template(config, templates):
+    # an empty container built with config, whose attributes are copied by the
+    # containers built with _cont_from_items rather than going through __init__
+    template = templates.get(id(config))
+    if template is None:
+        for other_config, other_template in templates.values():
+            if other_config == config:
+                template = other_template
+                break
+        else:
+            template = ivy.Container(**config)
+        templates[id(config)] = (config, template)
+        return template
+    return template[1]
+
+
+def _cont_from_items(items, template, dict_types):
+    # equivalent to ivy.Container(dict(items), **template._config), given the dict
+    # types of ivy.container_types()
+    ret = dict.__new__(ivy.Container)
+    ret.__dict__.update(
+        template.__dict__,
+        _config_in=dict(template._config_in),
+        _config=dict(template._config),
+    )
+    if ret._alphabetical_keys:
+        items = sorted(items, key=lambda item: item[0])
+    for key, value in items:
+        value_type = type(value)
+        if (
+            issubclass(value_type, dict_types)
+            and (
+                not issubclass(value_type, ivy.Container)
+                or ret._rebuild_child_containers
+            )
+        ) or issubclass(value_type, ret._types_to_iteratively_nest):
+            value = ivy.Container(value, **ret._config)
+        if isinstance(key, str) and (
+            "/" in key or "." in key or key in ("_backend", "dynamic_backend")
+        ):
+            ret[key] = value
+        else:
+            dict.__setitem__(ret, key, value)
+    return ret
+
+
 # noinspection PyMissingConstructor
 
 
@@ -714,6 +868,10 @@ class ContainerBase(dict, abc.ABC):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
+        if key_chains is None and not prune_unapplied and key_chain == "":
+            ret = _cont_multi_map_flat(func, containers, config, map_nests)
+            if ret is not None:
+                return ret
         return_dict = {}
 
         for key in keys:
@@ -1138,7 +1296,12 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
+        num_workers=None,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1156,6 +1319,13 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to memory map the contiguous datasets of the file rather than
+            reading them, so that their data is only read from disk once accessed.
+            Chunked datasets are always read. Default is ``False``.
+        num_workers
+            The number of threads to read the datasets with. Default is ``None``, which
+            reads the datasets one after another.
 
         Returns
         -------
@@ -1168,27 +1338,62 @@ class ContainerBase(dict, abc.ABC):
                 "files from disk into a container."
             ),
         )
-        container_dict = {}
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, "r")
-        else:
-            h5_obj = h5_obj_or_filepath
-        items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
-        for key, value in items:
-            if isinstance(value, h5py.Group):
-                container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
-                )
-            elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
-            else:
-                raise ivy.utils.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
+            with h5py.File(h5_obj_or_filepath, "r") as h5_obj:
+                return ivy.Container.cont_from_disk_as_hdf5(
+                    h5_obj,
+                    slice_obj,
+                    alphabetical_keys,
+                    ivyh,
+                    lazy=lazy,
+                    num_workers=num_workers,
                 )
+        ivyh_ = ivy.default(ivyh, ivy)
+        container_dict = {}
+        datasets = []
+
+        def _read(dataset):
+            # the dataset is read straight into a numpy array, which the backend
+            # then wraps without another copy where it can
+            return ivyh_.asarray(_read_hdf5_dataset(dataset, slice_obj, lazy))
+
+        _collect_hdf5_datasets(
+            h5_obj_or_filepath, container_dict, datasets, alphabetical_keys
+        )
+        if num_workers and num_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+                # each read runs in a copy of the caller's context, so that the
+                # context-local global modes of ivy apply to it
+                futures = [
+                    executor.submit(contextvars.copy_context().run, _read, d)
+                    for _, _, d in datasets
+                ]
+                arrays = [future.result() for future in futures]
+        else:
+            arrays = [_read(d) for _, _, d in datasets]
+        for (dict_out, key, _), array in zip(datasets, arrays):
+            dict_out[key] = array
         return ivy.Container(container_dict, ivyh=ivyh)
 
+    @staticmethod
+    def cont_hdf5_writer(h5_obj_or_filepath, **kwargs):
+        """
+        Open a writer appending containers to an hdf5 file batch by batch.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath for where to save the containers to disk, or h5 object.
+        kwargs
+            Keyword arguments of ContainerHDF5Writer, for the starting index, mode,
+            chunking, compression and background writing.
+
+        Returns
+        -------
+            The ContainerHDF5Writer, which should be closed once done appending.
+        """
+        return ContainerHDF5Writer(h5_obj_or_filepath, **kwargs)
+
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
         """
@@ -1233,6 +1438,43 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath) as json_data_file:
             return ivy.Container(json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_shared_memory(handle, ivyh=None):
+        """
+        Load container object from the shared memory handle created by
+        ``cont_to_shared_memory``, typically in another process.
+
+        The arrays of the container view the shared memory rather than copying it for
+        the backends which can wrap numpy arrays without a copy, such as numpy and
+        torch. The handle can only be loaded once.
+
+        Parameters
+        ----------
+        handle
+            The shared memory handle of the container.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from shared memory
+
+        Examples
+        --------
+        >>> def worker(q):
+        ...     q.put(ivy.Container(a=ivy.arange(3)).cont_to_shared_memory())
+        >>> q = ivy.multiprocessing().Queue()
+        >>> p = ivy.multiprocessing().Process(target=worker, args=(q,))
+        >>> p.start()
+        >>> x = ivy.Container.cont_from_shared_memory(q.get())
+        >>> p.join()
+        """
+        ivyh_ = ivy.default(ivyh, ivy)
+        return ivy.Container(
+            shared_memory.from_shared_memory(handle), ivyh=ivyh
+        ).cont_map(lambda x, _: ivyh_.asarray(x) if isinstance(x, np.ndarray) else x)
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """
@@ -2035,9 +2277,11 @@ class ContainerBase(dict, abc.ABC):
             ),
         )
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, mode)
-        else:
-            h5_obj = h5_obj_or_filepath
+            with h5py.File(h5_obj_or_filepath, mode) as h5_obj:
+                return self.cont_to_disk_as_hdf5(
+                    h5_obj, starting_index, mode, max_batch_size
+                )
+        h5_obj = h5_obj_or_filepath
         for key, value in self.items():
             if isinstance(value, ivy.Container):
                 if key not in h5_obj.keys():
@@ -2048,26 +2292,13 @@ class ContainerBase(dict, abc.ABC):
                     h5_group, starting_index, mode, max_batch_size
                 )
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
-                value_shape = value_as_np.shape
-                this_batch_size = value_shape[0]
-                max_bs = (
-                    starting_index + this_batch_size
-                    if not max_batch_size
-                    else max_batch_size
+                _write_hdf5_rows(
+                    h5_obj,
+                    key,
+                    self._cont_ivy.to_numpy(value),
+                    starting_index,
+                    ivy.default(max_batch_size, 0),
                 )
-                if key not in h5_obj.keys():
-                    dataset_shape = [max_bs] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
-                    h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
-                    )
-                space_left = max_bs - starting_index
-                amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
@@ -2111,6 +2342,29 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath, "w+") as json_data_file:
             json.dump(self.cont_to_jsonable().cont_to_dict(), json_data_file, indent=4)
 
+    def cont_to_shared_memory(self):
+        """
+        Copy the arrays of the container into a new shared memory block, to send the
+        container to another process without pickling its arrays.
+
+        Only the returned handle, holding the keys, the layout of the arrays in the
+        block and the other leaves of the container, is pickled when putting it in a
+        multiprocessing queue. It must be loaded with ``cont_from_shared_memory``, or
+        released with its ``release`` method, to free the shared memory.
+
+        Returns
+        -------
+        ret
+            The shared memory handle of the container.
+        """
+        return shared_memory.to_shared_memory(
+            self.cont_map(
+                lambda x, _: (
+                    self._cont_ivy.to_numpy(x) if self._cont_ivy.is_array(x) else x
+                )
+            )
+        )
+
     def cont_to_nested_list(self):
         return_list = []
         for key, value in self.items():
@@ -2183,7 +2437,7 @@ class ContainerBase(dict, abc.ABC):
                 kc = key
             else:
                 kc = f"{key_chain}/{key}" if key_chain != "" else key
-            if isinstance(value, ivy.Container) and (not include_empty or value):
+            if issubclass(type(value), ivy.Container) and (not include_empty or value):
                 yield from value.cont_to_iterator(kc, leaf_keys_only, include_empty)
             else:
                 yield kc, value
@@ -2202,7 +2456,7 @@ class ContainerBase(dict, abc.ABC):
 
         """
         for key, value in self.items():
-            if isinstance(value, ivy.Container) and (not include_empty or value):
+            if issubclass(type(value), ivy.Container) and (not include_empty or value):
                 # noinspection PyCompatibility
                 yield from value.cont_to_iterator_values(include_empty)
             else:
@@ -2232,7 +2486,7 @@ class ContainerBase(dict, abc.ABC):
                 kc = key
             else:
                 kc = f"{key_chain}/{key}" if key_chain != "" else key
-            if isinstance(value, ivy.Container) and (not include_empty or value):
+            if issubclass(type(value), ivy.Container) and (not include_empty or value):
                 # noinspection PyCompatibility
                 yield from value.cont_to_iterator_keys(
                     kc, leaf_keys_only, include_empty
@@ -2265,14 +2519,23 @@ class ContainerBase(dict, abc.ABC):
         -------
             Container.
         """
-        new_dict = {}
-        for key, value in self.items():
-            if isinstance(value, ivy.Container):
-                new_value = value.cont_from_flat_list(flat_list)
-            else:
-                new_value = flat_list.pop(0)
-            new_dict[key] = new_value
-        return ivy.Container(new_dict, **self._config)
+        return self.cont_flatten()[1].unflatten(list(flat_list))
+
+    def cont_flatten(self):
+        """
+        Flatten the container into the list of its leaves and its tree definition.
+
+        Returns
+        -------
+        ret
+            The leaves of the container, in the order of ``cont_to_flat_list``, and
+            the ``ContainerTreeDef`` rebuilding the container from leaves.
+        """
+        nodes = []
+        leaves = []
+        key_chains = []
+        _flatten_container(self, "", nodes, leaves, key_chains)
+        return leaves, ContainerTreeDef(nodes, key_chains)
 
     def cont_has_key(self, query_key):
         """
@@ -3231,6 +3494,18 @@ class ContainerBase(dict, abc.ABC):
         -------
             New container following the function mapped to each sub-array.
         """
+        if (
+            key_chains is None
+            and not prune_unapplied
+            and not map_sequences
+            and not inplace
+            and key_chain == ""
+        ):
+            # map over the flat leaves, and rebuild the container in one pass
+            leaves, treedef = self.cont_flatten()
+            return treedef.unflatten(
+                [func(v, kc) for v, kc in zip(leaves, treedef.key_chains)]
+            )
         return_dict = self if inplace else {}
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
@@ -4284,3 +4559,291 @@ class ContainerBase(dict, abc.ABC):
     @property
     def dynamic_backend(self):
         return self._dynamic_backend
+
+
+class ContainerHDF5Writer:
+    """
+    Append containers to an hdf5 file batch by batch, for example to log rollouts or
+    features during training.
+
+    Each leaf of an appended container is written to the dataset at its key chain
+    with a single slice assignment, after the rows already written to it. Datasets
+    grow geometrically as batches are appended, and are trimmed to the rows written
+    when the writer is closed. With ``background``, the batches are written from a
+    separate thread, so that appending only converts the leaves to numpy arrays.
+
+    Example
+    -------
+        with ivy.Container.cont_hdf5_writer("rollouts.hdf5", background=True) as w:
+            for batch in batches:
+                w.append(batch)
+    """
+
+    def __init__(
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        chunks=True,
+        compression=None,
+        compression_opts=None,
+        growth_factor=2,
+        background=False,
+        max_queue_size=8,
+    ):
+        """
+        Open a writer appending containers to an hdf5 file.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath for where to save the containers to disk, or h5 object.
+        starting_index
+            Batch index at which to start writing to the datasets. Default is ``0``.
+        mode
+            H5 read/write mode for opening the file, ['r+', 'w', 'w-', 'a'],
+            default is 'a'.
+        chunks
+            The chunk shape of the datasets created, or ``True`` for h5py to choose
+            it. Default is ``True``.
+        compression
+            The compression filter of the datasets created, e.g. 'gzip' or 'lzf'.
+            Default is ``None``.
+        compression_opts
+            The options of the compression filter. Default is ``None``.
+        growth_factor
+            The factor by which to grow the datasets once they are full. Default is
+            ``2``.
+        background
+            Whether to write the batches from a background thread. Default is
+            ``False``.
+        max_queue_size
+            The maximum number of batches waiting to be written by the background
+            thread, after which appending blocks. Default is ``8``.
+        """
+        ivy.utils.assertions.check_exists(
+            h5py,
+            message=(
+                "You must install python package h5py in order to save "
+                "containers to disk as hdf5 files."
+            ),
+        )
+        if type(h5_obj_or_filepath) is str:
+            self._h5_obj = h5py.File(h5_obj_or_filepath, mode)
+            self._owns_file = True
+        else:
+            self._h5_obj = h5_obj_or_filepath
+            self._owns_file = False
+        self._starting_index = starting_index
+        self._dataset_kwargs = dict(
+            chunks=chunks, compression=compression, compression_opts=compression_opts
+        )
+        self._growth_factor = growth_factor
+        # number of rows written, and the size the dataset had before, per key chain
+        self._rows = {}
+        self._initial_sizes = {}
+        self._error = None
+        self._queue = None
+        if background:
+            self._queue = queue.Queue(max_queue_size)
+            self._thread = threading.Thread(target=self._write_from_queue, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, container):
+        """
+        Append a batch to the datasets of the file.
+
+        Parameters
+        ----------
+        container
+            The container to append, with the batch along the first axis of each
+            leaf.
+        """
+        self._raise_error()
+        batch = [
+            (kc, container.cont_ivy.to_numpy(value))
+            for kc, value in container.cont_to_iterator()
+        ]
+        if self._queue is None:
+            self._write(batch)
+        else:
+            # the arrays are copied, as the caller may update them inplace
+            # before the background thread writes them
+            self._queue.put([(kc, np.array(value)) for kc, value in batch])
+
+    def flush(self):
+        """Wait for the appended batches to be written, and flush them to disk."""
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+        self._h5_obj.flush()
+
+    def close(self):
+        """Write the remaining batches, trim the datasets and close the file."""
+        if self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+        try:
+            self._raise_error()
+        finally:
+            for kc, rows in self._rows.items():
+                size = max(rows, self._initial_sizes[kc])
+                if self._h5_obj[kc].shape[0] > size:
+                    self._h5_obj[kc].resize(size, axis=0)
+            self._rows = {}
+            if self._owns_file:
+                self._h5_obj.close()
+
+    def _write(self, batch):
+        for kc, value in batch:
+            if kc not in self._rows:
+                self._rows[kc] = self._starting_index
+                self._initial_sizes[kc] = (
+                    self._h5_obj[kc].shape[0] if kc in self._h5_obj else 0
+                )
+            _write_hdf5_rows(
+                self._h5_obj,
+                kc,
+                value,
+                self._rows[kc],
+                growth_factor=self._growth_factor,
+                **self._dataset_kwargs,
+            )
+            self._rows[kc] += value.shape[0]
+
+    def _write_from_queue(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                if self._error is None:
+                    self._write(batch)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+def _cont_multi_map_flat(func, containers, config, map_nests):
+    # cont_multi_map over the flat leaves of containers with identical structures,
+    # returning None if the structures differ or if any input isn't a container, as
+    # cont_multi_map then calls func on whole sub-containers
+    flat = []
+    treedef = None
+    for cont in containers:
+        if not isinstance(cont, ivy.Container):
+            return None
+        leaves, cont_treedef = cont.cont_flatten()
+        if treedef is None:
+            treedef = cont_treedef
+        elif cont_treedef != treedef:
+            return None
+        flat.append(leaves)
+    ret = []
+    for values, kc in zip(zip(*flat), treedef.key_chains):
+        values = list(values)
+        if map_nests and any(isinstance(x, (list, tuple)) for x in values):
+            ret.append(
+                ivy.nested_multi_map(lambda x, _: func(x, None), values, to_ivy=False)
+            )
+        else:
+            ret.append(func(values, kc))
+    # as cont_multi_map, leaving out the sub-containers which end up empty
+    return treedef.unflatten(ret, config=config, prune_empty=True)
+
+
+class ContainerTreeDef:
+    """
+    The structure of a container, rebuilding it from a flat list of its leaves.
+
+    Returned by ``Container.cont_flatten`` along with the leaves of the container, in
+    the order of ``cont_to_flat_list``. Holding on to the tree definition allows
+    mapping functions over the flat leaves and rebuilding containers of the same
+    structure without traversing the nested dicts again.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1.]), b={"c": ivy.array([2.])})
+    >>> leaves, treedef = x.cont_flatten()
+    >>> treedef.key_chains
+    ['a', 'b/c']
+    >>> y = treedef.unflatten([leaf * 2 for leaf in leaves])
+    """
+
+    def __init__(self, nodes, key_chains):
+        self._nodes = nodes
+        self.key_chains = key_chains
+        self.structure = tuple(tuple(entries) for _, entries in nodes)
+
+    @property
+    def num_leaves(self):
+        return len(self.key_chains)
+
+    def __eq__(self, other):
+        return isinstance(other, ContainerTreeDef) and self.structure == other.structure
+
+    def __hash__(self):
+        return hash(self.structure)
+
+    def __repr__(self):
+        return f"ContainerTreeDef(key_chains={self.key_chains})"
+
+    def unflatten(self, leaves, config=None, prune_empty=False):
+        """
+        Build a container with this structure from a flat list of leaves.
+
+        Parameters
+        ----------
+        leaves
+            The leaves of the container, in the order of ``key_chains``.
+        config
+            The configuration of all the sub-containers. Default is ``None``, which
+            uses the configuration of each sub-container of the flattened container.
+        prune_empty
+            Whether to leave out the sub-containers which are empty. Default is
+            ``False``.
+
+        Returns
+        -------
+        ret
+            The container built from the leaves.
+        """
+        ivy.utils.assertions.check_equal(
+            len(leaves),
+            self.num_leaves,
+            message=(
+                f"expected {self.num_leaves} leaves to unflatten, but got {len(leaves)}"
+            ),
+            as_array=False,
+        )
+        templates = {}
+        dict_types = tuple([dict] + ivy.container_types())
+        built = [None] * len(self._nodes)
+        # children follow their parents in the nodes, so are built before them
+        for i in range(len(self._nodes) - 1, -1, -1):
+            cont, entries = self._nodes[i]
+            items = []
+            for key, child, leaf in entries:
+                if child is None:
+                    items.append((key, leaves[leaf]))
+                elif not prune_empty or built[child]:
+                    items.append((key, built[child]))
+            built[i] = _cont_from_items(
+                items,
+                _cont_template(cont._config if config is None else config, templates),
+                dict_types,
+            )
+        return built[0]
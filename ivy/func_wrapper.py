@@ -222,6 +222,20 @@ def try_array_function_override(func, overloaded_args, types, args, kwargs):
     )
 
 
+# scalar types which never need to be traversed when scanning function arguments
+_FLAT_SCALAR_TYPES = (type(None), bool, int, float, complex, str)
+
+
+def _is_flat_arg(x):
+    return isinstance(x, (*_FLAT_SCALAR_TYPES, ivy.Array, ivy.NativeArray))
+
+
+def _args_are_flat(args, kwargs):
+    # cheap check for the common case of arrays and scalars only, in which case the
+    # arguments contain no nests or containers which would need to be traversed
+    return all(map(_is_flat_arg, args)) and all(map(_is_flat_arg, kwargs.values()))
+
+
 def _get_first_array(*args, **kwargs):
     # ToDo: make this more efficient, with function ivy.nested_nth_index_where
     array_fn = ivy.is_array if "array_fn" not in kwargs else kwargs["array_fn"]
@@ -442,6 +456,15 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
         """
         if not ivy.array_mode:
             return fn(*args, **kwargs)
+        if _args_are_flat(args, kwargs):
+            # unwrap the arrays directly, leaving the out argument untouched
+            return fn(
+                *[x.data if isinstance(x, ivy.Array) else x for x in args],
+                **{
+                    k: v.data if k != "out" and isinstance(v, ivy.Array) else v
+                    for k, v in kwargs.items()
+                },
+            )
         # check if kwargs contains an out argument, and if so, remove it
         has_out = False
         out = None
@@ -949,18 +972,23 @@ def handle_nestable(fn: Callable) -> Callable:
         """
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
-        # the passed arguments.
-        if hasattr(ivy.Container, f"_static_{fn_name}"):
-            cont_fn = getattr(ivy.Container, f"_static_{fn_name}")
-        else:
+        # the passed arguments. Flat arrays and scalars can't contain containers, so
+        # the nest traversal is skipped for them.
+        if (
+            ivy.nestable_mode
+            and not _args_are_flat(args, kwargs)
+            and (
+                ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
+                or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            )
+        ):
+            if hasattr(ivy.Container, f"_static_{fn_name}"):
+                cont_fn = getattr(ivy.Container, f"_static_{fn_name}")
+            else:
 
-            def cont_fn(*args, **kwargs):
-                return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
+                def cont_fn(*args, **kwargs):
+                    return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
 
-        if ivy.nestable_mode and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
-        ):
             return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
@@ -1063,6 +1091,207 @@ def temp_asarray_wrapper(fn: Callable) -> Callable:
     return _temp_asarray_wrapper
 
 
+# Fused Dispatch #
+# ---------------#
+
+# wrappers which can be resolved by the fused dispatcher when all the arguments
+# are flat, i.e. ivy arrays, native arrays of the current backend or scalars
+_FUSABLE_WRAPPERS = frozenset(
+    {
+        "handle_device",
+        "infer_dtype",
+        "handle_array_function",
+        "outputs_to_ivy_arrays",
+        "inputs_to_native_arrays",
+        "handle_out_argument",
+        "handle_array_like_without_promotion",
+        "handle_nestable",
+        "handle_backend_invalid",
+        "handle_exceptions",
+    }
+)
+
+
+def _array_like_positions(fn):
+    # positional indices which handle_array_like_without_promotion would try to
+    # convert into arrays, mirroring the annotation check in the wrapper itself
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    positions = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            positions.append(i)
+    return tuple(positions)
+
+
+def _fuse_wrappers(fn: Callable, wrapped_fn: Callable, wrappers) -> Callable:
+    """
+    Collapse the wrapper chain `wrapped_fn` built around `fn` into a single dispatcher.
+
+    The arguments are scanned once. If they are all flat, i.e. `ivy.Array` instances
+    holding native arrays of the current backend, native arrays or scalars, the
+    stages in `wrappers` are applied inline before calling `fn` directly. Any other
+    input (nests, containers, `out` arrays, soft device mode, ...) falls back to the
+    full wrapper chain, which keeps the original semantics.
+
+    Parameters
+    ----------
+    fn
+        the unwrapped backend implementation.
+    wrapped_fn
+        `fn` wrapped with all the decorators listed in `wrappers`.
+    wrappers
+        the names of the decorators applied to produce `wrapped_fn`.
+
+    Returns
+    -------
+    ret
+        the fused dispatcher, exposing the full wrapper chain as `__wrapped__`.
+    """
+    wrappers = frozenset(wrappers)
+    handles_out = "handle_out_argument" in wrappers
+    handles_device = "handle_device" in wrappers
+    to_native = "inputs_to_native_arrays" in wrappers
+    to_ivy = "outputs_to_ivy_arrays" in wrappers
+    infers_dtype = "infer_dtype" in wrappers
+    array_like_positions = (
+        _array_like_positions(fn)
+        if "handle_array_like_without_promotion" in wrappers
+        else ()
+    )
+
+    def _is_flat(x, native_array):
+        if type(x) is ivy.Array:
+            return isinstance(x._data, native_array)
+        return isinstance(x, (*_FLAT_SCALAR_TYPES, native_array))
+
+    @functools.wraps(fn)
+    def _fused_call(*args, **kwargs):
+        native_array = ivy.NativeArray
+        if handles_out:
+            kwargs["out"] = None
+        if to_native:
+            args = [x._data if type(x) is ivy.Array else x for x in args]
+            kwargs = {
+                k: v._data if type(v) is ivy.Array else v for k, v in kwargs.items()
+            }
+        if infers_dtype:
+            dtype = kwargs.pop("dtype", None)
+            if not ivy.exists(dtype):
+                arr = next(
+                    (
+                        x
+                        for x in (*args, *kwargs.values())
+                        if isinstance(x, (ivy.Array, native_array))
+                    ),
+                    None,
+                )
+            else:
+                arr = None
+            dtype = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
+            ivy.utils.assertions._check_jax_x64_flag(dtype)
+            kwargs["dtype"] = dtype
+        if handles_device:
+            devices = {
+                ivy.dev(x)
+                for x in (*args, *kwargs.values())
+                if isinstance(x, native_array)
+            }
+            if len(devices) > 1:
+                raise ivy.utils.exceptions.IvyException(
+                    "Expected all input arrays to be on the same device, "
+                    f"but found at least two devices - {tuple(devices)}, "
+                    "set `ivy.set_soft_device_mode(True)` to handle this problem."
+                )
+            dst_dev = None
+            if kwargs.get("device", None) is not None:
+                dst_dev = ivy.as_native_dev(kwargs["device"])
+            elif devices:
+                dst_dev = next(iter(devices))
+            with ivy.DefaultDevice(ivy.default_device(dst_dev)):
+                ret = ivy.handle_soft_device_variable(*args, fn=fn, **kwargs)
+        else:
+            ret = fn(*args, **kwargs)
+        if to_ivy:
+            if isinstance(ret, native_array):
+                return ivy.Array(ret)
+            return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+        return ret
+
+    if "handle_exceptions" in wrappers:
+        _fused_call = ivy.handle_exceptions(_fused_call)
+
+    @functools.wraps(wrapped_fn)
+    def _fused_dispatcher(*args, **kwargs):
+        native_array = ivy.NativeArray
+        if ((to_native or to_ivy) and not ivy.array_mode) or (
+            handles_device and ivy.soft_device_mode
+        ):
+            return wrapped_fn(*args, **kwargs)
+        for x in args:
+            if not _is_flat(x, native_array):
+                return wrapped_fn(*args, **kwargs)
+        for k, v in kwargs.items():
+            if not _is_flat(v, native_array) or (k == "out" and v is not None):
+                return wrapped_fn(*args, **kwargs)
+        for i in array_like_positions:
+            if i < len(args) and isinstance(args[i], _FLAT_SCALAR_TYPES):
+                return wrapped_fn(*args, **kwargs)
+        return _fused_call(*args, **kwargs)
+
+    _fused_dispatcher.fused_wrappers = tuple(
+        attr for attr in FN_DECORATORS if attr in wrappers
+    )
+    return _fused_dispatcher
+
+
+def _autocast_input(x, dtype, low_precision):
+    if ivy.is_ivy_container(x):
+        return x.cont_map(lambda v, _: _autocast_input(v, dtype, low_precision))
+    if not ivy.is_array(x):
+        return x
+    x_dtype = ivy.dtype(x)
+    # float64 inputs are left as they are, as they were asked for explicitly
+    if low_precision:
+        cast = x_dtype != dtype and x_dtype in ("float32", "float16", "bfloat16")
+    else:
+        cast = x_dtype in ("float16", "bfloat16")
+    return ivy.astype(x, dtype) if cast else x
+
+
+def _handle_autocast(fn: Callable, low_precision: bool) -> Callable:
+    """
+    Cast the float inputs of `fn` under autocast, to the autocast dtype if
+    `low_precision`, otherwise to float32.
+    """
+
+    @functools.wraps(fn)
+    def _autocast(*args, **kwargs):
+        autocast_dtype_stack = ivy.autocast_dtype_stack
+        if not autocast_dtype_stack:
+            return fn(*args, **kwargs)
+        dtype = autocast_dtype_stack[-1] if low_precision else "float32"
+        args = [_autocast_input(x, dtype, low_precision) for x in args]
+        kwargs = {
+            k: _autocast_input(v, dtype, low_precision) if k != "out" else v
+            for k, v in kwargs.items()
+        }
+        return fn(*args, **kwargs)
+
+    _autocast._autocast_wrapped = True
+    return _autocast
+
+
 # Functions #
 
 
@@ -1135,6 +1364,8 @@ def _wrap_function(
             add_wrappers = backend_wrappers.get("to_add")
             skip_wrappers = backend_wrappers.get("to_skip")
 
+        unwrapped_fn = to_wrap
+        applied_wrappers = []
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 if partial_mixed and attr == "handle_partial_mixed_function":
@@ -1142,8 +1373,19 @@ def _wrap_function(
                     to_wrap = handle_partial_mixed_function(to_wrap)
                 if attr not in skip_wrappers:
                     to_wrap = getattr(ivy, attr)(to_wrap)
+                    applied_wrappers.append(attr)
             if attr in add_wrappers:
                 to_wrap = getattr(ivy, attr)(to_wrap)
+                applied_wrappers.append(attr)
+
+        # collapse the wrapper chain into a single dispatcher whenever every
+        # applied wrapper can be resolved with one scan over the arguments
+        if (
+            applied_wrappers
+            and not mixed_fn
+            and set(applied_wrappers).issubset(_FUSABLE_WRAPPERS)
+        ):
+            to_wrap = _fuse_wrappers(unwrapped_fn, to_wrap, applied_wrappers)
 
         # we should remove the all the decorators
         # after handle_mixed_fuction in FN_DECORATORS
@@ -1157,6 +1399,13 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+
+        # the autocast casts go around the whole chain, so that the nested calls of
+        # the wrapped function, such as for containers, don't cast again
+        if (
+            key in ivy.autocast_low_precision_fns or key in ivy.autocast_float32_fns
+        ) and not hasattr(to_wrap, "_autocast_wrapped"):
+            to_wrap = _handle_autocast(to_wrap, key in ivy.autocast_low_precision_fns)
     return to_wrap
 
 
@@ -1603,10 +1852,15 @@ def handle_backend_invalid(fn: Callable) -> Callable:
             backend matches the argument backend.
             If not, it raises an InvalidBackendException
         """
-        array_indices = ivy.nested_argwhere(
-            [args, kwargs], lambda x: isinstance(x, ivy.Array)
-        )
-        array_vals = ivy.multi_index_nest([args, kwargs], array_indices)
+        if _args_are_flat(args, kwargs):
+            array_vals = [
+                x for x in (*args, *kwargs.values()) if isinstance(x, ivy.Array)
+            ]
+        else:
+            array_indices = ivy.nested_argwhere(
+                [args, kwargs], lambda x: isinstance(x, ivy.Array)
+            )
+            array_vals = ivy.multi_index_nest([args, kwargs], array_indices)
 
         def func(x):
             target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
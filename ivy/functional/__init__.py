@@ -1,4 +1,13 @@
+from importlib import import_module as _import_module
+
 from .ivy import experimental
 from .ivy.experimental import *
 from . import ivy
 from .ivy import *
+
+
+def __getattr__(name):
+    # the backends and frontends are only imported once they are first accessed
+    if name in ("backends", "frontends"):
+        return _import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,10 @@
+from importlib import import_module as _import_module
+from importlib.util import find_spec as _find_spec
+
+
+def __getattr__(name):
+    # each backend is only imported once it is first accessed, for example through
+    # `ivy.functional.backends.torch`, rather than importing all of them upfront
+    if not name.startswith("_") and _find_spec(f"{__name__}.{name}") is not None:
+        return _import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,6 +10,8 @@ from typing import Optional, Callable, Sequence, Union, Tuple
 # local
 import ivy
 from ivy.functional.ivy.gradients import (
+    _handle_checkpoint_nests,
+    _handle_loss_scaling,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_variables_and_indices,
@@ -68,6 +70,7 @@ def _forward_fn(
     return ret_values
 
 
+@_handle_loss_scaling
 def execute_with_gradients(
     func,
     xs: JaxArray,
@@ -169,3 +172,8 @@ def grad(func: Callable, argnums: Union[int, Tuple[int]] = 0):
         return ivy.to_ivy(jax.grad(grad_fn, argnums)(ivy.to_native(x_in)))
 
     return callback_fn
+
+
+@_handle_checkpoint_nests
+def checkpoint(func: Callable, /):
+    return jax.checkpoint(func)
@@ -2,6 +2,7 @@
 
 
 # global
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -455,3 +456,122 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def scaled_dot_product_attention_v_0p4p31_and_above(
+    query: JaxArray,
+    key: JaxArray,
+    value: JaxArray,
+    /,
+    *,
+    scale: Optional[float] = None,
+    mask: Optional[JaxArray] = None,
+    dropout_p: Optional[float] = 0.0,
+    is_causal: Optional[bool] = False,
+    training: Optional[bool] = False,
+    out: Optional[JaxArray] = None,
+) -> JaxArray:
+    batch_shape = query.shape[:-2]
+    num_queries, num_keys = query.shape[-2], key.shape[-2]
+    # jax attends over inputs of shape (batch, length, heads, features), here with a
+    # single head
+    query, key, value = (
+        jnp.reshape(x, (-1, *x.shape[-2:]))[..., None, :] for x in (query, key, value)
+    )
+    if mask is not None:
+        mask = jnp.broadcast_to(
+            mask.astype(bool), (*batch_shape, num_queries, num_keys)
+        ).reshape(-1, 1, num_queries, num_keys)
+    ret = jax.nn.dot_product_attention(
+        query,
+        key,
+        value,
+        mask=mask,
+        scale=scale if scale else None,
+        is_causal=is_causal,
+    )
+    return jnp.reshape(ret[..., 0, :], (*batch_shape, num_queries, ret.shape[-1]))
+
+
+# jax has no dropout in its attention, and doesn't broadcast the batch dimensions
+scaled_dot_product_attention_v_0p4p31_and_above.partial_mixed_handler = (
+    lambda query, key, value, *, dropout_p=0.0, training=False, **kwargs: (
+        not (training and dropout_p)
+        and query.shape[:-2] == key.shape[:-2] == value.shape[:-2]
+        and query.shape[-1] == value.shape[-1]
+        and query.dtype == key.dtype == value.dtype
+        and ivy.is_float_dtype(query)
+    )
+)
+
+
+def _lstm_scan(x, init_h, init_c, kernel, recurrent_kernel, bias, reverse, mask):
+    # one direction of one layer, scanning over the time-major x *[t,batch,in]*
+    x_proj = jnp.matmul(x, kernel) + bias
+
+    def _step(carry, inputs):
+        ht, ct = carry
+        x_proj_t, mask_t = inputs
+        gates = x_proj_t + jnp.matmul(ht, recurrent_kernel)
+        it, ft, gt, ot = jnp.split(gates, 4, axis=-1)
+        ct_new = jax.nn.sigmoid(ft) * ct + jax.nn.sigmoid(it) * jnp.tanh(gt)
+        ht_new = jax.nn.sigmoid(ot) * jnp.tanh(ct_new)
+        ht = jnp.where(mask_t, ht_new, ht)
+        ct = jnp.where(mask_t, ct_new, ct)
+        return (ht, ct), jnp.where(mask_t, ht_new, 0)
+
+    (h_n, c_n), ret = jlax.scan(
+        _step, (init_h, init_c), (x_proj, mask), reverse=reverse
+    )
+    return ret, h_n, c_n
+
+
+def lstm(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernels: Sequence[JaxArray],
+    recurrent_kernels: Sequence[JaxArray],
+    /,
+    *,
+    biases: Optional[Sequence[JaxArray]] = None,
+    recurrent_biases: Optional[Sequence[JaxArray]] = None,
+    lengths: Optional[Union[JaxArray, Sequence[int]]] = None,
+    bidirectional: bool = False,
+    dropout: float = 0.0,
+    training: bool = False,
+) -> Tuple[JaxArray, JaxArray, JaxArray]:
+    num_directions = 2 if bidirectional else 1
+    x = jnp.swapaxes(x, 0, 1)
+    timesteps = x.shape[0]
+    if lengths is None:
+        mask = jnp.ones((timesteps, x.shape[1], 1), dtype=bool)
+    else:
+        mask = (jnp.arange(timesteps)[:, None] < jnp.asarray(lengths))[..., None]
+    h_n, c_n = [], []
+    for layer in range(len(kernels) // num_directions):
+        outputs = []
+        for direction in range(num_directions):
+            i = layer * num_directions + direction
+            bias = sum(b[i] for b in [biases, recurrent_biases] if b is not None)
+            ret, h, c = _lstm_scan(
+                x,
+                init_h[i],
+                init_c[i],
+                kernels[i],
+                recurrent_kernels[i],
+                bias,
+                direction == 1,
+                mask,
+            )
+            outputs.append(ret)
+            h_n.append(h)
+            c_n.append(c)
+        x = jnp.concatenate(outputs, axis=-1)
+    return jnp.swapaxes(x, 0, 1), jnp.stack(h_n), jnp.stack(c_n)
+
+
+lstm.partial_mixed_handler = (
+    lambda x, *args, dropout=0.0, training=False, **kwargs: x.ndim == 3
+    and not (dropout and training)
+)
@@ -6,6 +6,7 @@ import mxnet as mx
 
 # local
 from ivy.utils.exceptions import IvyNotImplementedException
+from ivy.functional.ivy.gradients import _handle_loss_scaling
 
 
 def variable(x, /):
@@ -20,6 +21,7 @@ def variable_data(x, /):
     raise IvyNotImplementedException()
 
 
+@_handle_loss_scaling
 def execute_with_gradients(
     func,
     xs,
@@ -46,3 +48,7 @@ def grad(func, argnums=0):
 
 def stop_gradient(x, /, *, preserve_type=True, out=None):
     raise IvyNotImplementedException()
+
+
+def checkpoint(func, /):
+    return func
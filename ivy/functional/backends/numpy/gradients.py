@@ -4,6 +4,7 @@
 import logging
 from typing import Optional, Sequence, Union
 import ivy
+from ivy.functional.ivy.gradients import _handle_loss_scaling
 
 
 def variable(x, /):
@@ -24,6 +25,7 @@ def variable_data(x, /):
     return x
 
 
+@_handle_loss_scaling
 def execute_with_gradients(
     func,
     xs,
@@ -97,3 +99,8 @@ def stop_gradient(x, /, *, preserve_type=True, out=None):
         "has no effect on the array, as gradients are not supported in the first place."
     )
     return x
+
+
+def checkpoint(func, /):
+    # no activations are kept for a gradient pass, so there is nothing to discard
+    return func
@@ -23,13 +23,20 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
-def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
+# the maximum number of bytes of the im2col matrix, the batch being split into chunks
+# whose matrices are under it
+_IM2COL_CHUNK_BYTES = 2**27
+# the minimum number of elements of the kernels convolved through the fft, when the
+# strides and dilations are 1 and the inputs and filters are finite
+_FFT_MIN_KERNEL_SIZE = 81
+
+
+def _pad_conv(x, kernel_shape, strides, padding, dims, dilations):
+    # the extent of the dilated kernels, which are never materialised
+    kernel_shape = [(k - 1) * d + 1 for k, d in zip(kernel_shape, dilations)]
     if isinstance(padding, str):
         pad_specific = [
-            _handle_padding(x.shape[1 + i], strides[i], filters.shape[i], padding)
+            _handle_padding(x.shape[1 + i], strides[i], kernel_shape[i], padding)
             for i in range(dims)
         ]
         pad_list = [
@@ -43,12 +50,120 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
 
     pad_width = [(0, 0), *pad_list, (0, 0)]
 
-    x = np.pad(
+    return np.pad(
         x,
         pad_width=pad_width,
         mode="constant",
     )
-    return x, filters
+
+
+def _conv_gemm(x, filters, strides, dims, dilations, groups, out_shape):
+    # im2col: the windows of the input are gathered into a matrix, multiplied with
+    # the filters in a single (batched over the groups) matmul
+    kernel_shape = filters.shape[:dims]
+    input_dim, output_dim = filters.shape[-2:]
+    x = np.ascontiguousarray(x).reshape(*x.shape[:-1], groups, input_dim)
+    # B x OH x OW x KH x KW x G x I, the dilations being strides of the windows
+    windows = np.lib.stride_tricks.as_strided(
+        x,
+        (x.shape[0], *out_shape, *kernel_shape, groups, input_dim),
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+            *x.strides[-2:],
+        ),
+        writeable=False,
+    )
+    # G x B x OH x OW x KH x KW x I
+    windows = np.transpose(windows, (2 * dims + 1, *range(2 * dims + 1), 2 * dims + 2))
+    # G x (KH x KW x I) x O/G
+    filters = np.moveaxis(
+        filters.reshape(*kernel_shape, input_dim, groups, output_dim // groups),
+        -2,
+        0,
+    ).reshape(groups, -1, output_dim // groups)
+    num_positions = int(np.prod(out_shape))
+    sample_bytes = num_positions * filters.shape[1] * groups * x.itemsize
+    chunk = max(1, _IM2COL_CHUNK_BYTES // max(sample_bytes, 1))
+    res = np.empty((x.shape[0], *out_shape, output_dim), x.dtype)
+    for b in range(0, x.shape[0], chunk):
+        # G x (B x OH x OW) x (KH x KW x I)
+        cols = windows[:, b : b + chunk].reshape(groups, -1, filters.shape[1])
+        # (B x OH x OW) x G x O/G
+        ret = np.swapaxes(np.matmul(cols, filters), 0, 1)
+        res[b : b + chunk] = ret.reshape(-1, *out_shape, output_dim)
+    return res
+
+
+def _conv_fft(x, filters, dims, groups, out_shape):
+    # the correlation is the product of the spectra of the input and of the flipped
+    # filters, the circular wrapping only affecting the positions out of the output
+    spatial_shape = x.shape[1 : dims + 1]
+    kernel_shape = filters.shape[:dims]
+    input_dim, output_dim = filters.shape[-2:]
+    x = x.reshape(*x.shape[:-1], groups, input_dim)
+    filters = np.flip(filters, tuple(range(dims))).reshape(
+        *kernel_shape, input_dim, groups, output_dim // groups
+    )
+    # FH x FW x G x B x I, over the frequencies
+    x_f = np.moveaxis(
+        np.fft.rfftn(x, s=spatial_shape, axes=tuple(range(1, dims + 1))), 0, -2
+    )
+    # FH x FW x G x I x O/G
+    filters_f = np.swapaxes(
+        np.fft.rfftn(filters, s=spatial_shape, axes=tuple(range(dims))), -3, -2
+    )
+    # B x OH x OW x G x O/G
+    res = np.fft.irfftn(
+        np.moveaxis(np.matmul(x_f, filters_f), -2, 0),
+        s=spatial_shape,
+        axes=tuple(range(1, dims + 1)),
+    )
+    res = res[
+        (
+            slice(None),
+            *[slice(k - 1, k - 1 + o) for k, o in zip(kernel_shape, out_shape)],
+        )
+    ]
+    return res.reshape(*res.shape[: dims + 1], output_dim)
+
+
+def _conv(x, filters, strides, padding, dims, dilations, feature_group_count=1):
+    """
+    Convolve channel last inputs with channel last filters, the shared engine of the
+    convolutions.
+
+    The convolution is an im2col matmul, or is computed through the fft for large
+    kernels with unit strides and dilations, and finite inputs and filters. Neither
+    tiles the windows over the output channels nor materialises the dilated filters.
+    """
+    strides = [strides] * dims if isinstance(strides, int) else strides
+    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
+    # the products are summed in the dtype of np.sum, which accumulates the small
+    # integers and booleans in the platform integer
+    dtype = np.sum(np.empty(0, np.result_type(x, filters))).dtype
+    x = _pad_conv(x, filters.shape[:dims], strides, padding, dims, dilations)
+    x, filters = x.astype(dtype, copy=False), filters.astype(dtype, copy=False)
+    out_shape = [
+        (x.shape[i + 1] - (filters.shape[i] - 1) * dilations[i] - 1) // strides[i] + 1
+        for i in range(dims)
+    ]
+    if (
+        np.issubdtype(dtype, np.floating)
+        and np.prod(filters.shape[:dims]) >= _FFT_MIN_KERNEL_SIZE
+        and all(s == 1 for s in strides)
+        and all(d == 1 for d in dilations)
+        # a non-finite value spreads through the whole spectrum, making every output
+        # nan rather than the ones of its windows
+        and np.isfinite(x).all()
+        and np.isfinite(filters).all()
+    ):
+        res = _conv_fft(x, filters, dims, feature_group_count, out_shape)
+        return res.astype(dtype)
+    return _conv_gemm(
+        x, filters, strides, dims, dilations, feature_group_count, out_shape
+    )
 
 
 def _dilate_pad_conv_tranpose(
@@ -127,39 +242,10 @@ def conv1d(
     bias: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    strides = [strides] if isinstance(strides, int) else strides
-    dilations = [dilations] if isinstance(dilations, int) else dilations
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
     x, filters = _ff_xd_before_conv(x, filters, 1, filter_format, x_dilations)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv(x, filters, strides, padding, 1, dilations)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -209,42 +295,10 @@ def conv2d(
     bias: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    strides = [strides] * 2 if isinstance(strides, int) else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
     x, filters = _ff_xd_before_conv(x, filters, 2, filter_format, x_dilations)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides, padding, 2, dilations)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -291,49 +345,22 @@ def depthwise_conv2d(
     dilations: Union[int, Tuple[int, int]] = 1,
     out: Optional[np.ndarray] = None,
 ):
-    strides = [strides] * 2 if isinstance(strides, int) else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # each channel is a group of its own
+    res = _conv(
+        x,
+        np.expand_dims(filters, -2),
+        strides,
+        padding,
+        2,
+        dilations,
+        feature_group_count=x.shape[-1],
+    )
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -350,45 +377,10 @@ def conv3d(
     bias: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    strides = [strides] * 3 if isinstance(strides, int) else strides
-    dilations = [dilations] * 3 if isinstance(dilations, int) else dilations
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
     x, filters = _ff_xd_before_conv(x, filters, 3, filter_format, x_dilations)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv(x, filters, strides, padding, 3, dilations)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -446,55 +438,12 @@ def conv_general_dilated(
     if filter_format == "channel_first":
         filters = np.transpose(filters, (*range(2, dims + 2), 1, 0))
 
-    strides = [strides] * dims if isinstance(strides, int) else strides
-    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
     x_dilations = [x_dilations] * dims if isinstance(x_dilations, int) else x_dilations
 
     for j in range(dims):
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    res = _conv(x, filters, strides, padding, dims, dilations, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -12,6 +12,8 @@ import ivy
 from ivy.func_wrapper import with_unsupported_device_and_dtypes
 from . import backend_version
 from ivy.functional.ivy.gradients import (
+    _handle_checkpoint_nests,
+    _handle_loss_scaling,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_y,
@@ -106,6 +108,7 @@ def _grad_func(y, xs, retain_grads):
 @with_unsupported_device_and_dtypes(
     {"2.5.1 and below": {"cpu": ("float16",)}}, backend_version
 )
+@_handle_loss_scaling
 def execute_with_gradients(
     func, xs, /, *, retain_grads=False, xs_grad_idxs=[[0]], ret_grad_idxs=[[0]]
 ):
@@ -292,3 +295,13 @@ def grad(f, argnums=0):
 
 grad.f_original = None
 grad.nth = 0
+
+
+@_handle_checkpoint_nests
+def checkpoint(func: Callable, /):
+    from paddle.distributed.fleet.utils import recompute
+
+    def checkpointed_fn(*args):
+        return recompute(func, *args)
+
+    return checkpointed_fn
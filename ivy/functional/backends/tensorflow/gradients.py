@@ -13,6 +13,8 @@ from typing import Sequence, Union, Optional, Callable
 import ivy
 from ivy.func_wrapper import outputs_to_ivy_arrays, inputs_to_native_arrays
 from ivy.functional.ivy.gradients import (
+    _handle_checkpoint_nests,
+    _handle_loss_scaling,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_y,
@@ -63,6 +65,7 @@ def _grad_func(y, xs, xs_required, tape):
     return grads
 
 
+@_handle_loss_scaling
 def execute_with_gradients(
     func,
     xs: Union[tf.Tensor, tf.Variable],
@@ -241,3 +244,8 @@ def grad(f, argnums=0):
 
 grad.f_original = None
 grad.nth = 0
+
+
+@_handle_checkpoint_nests
+def checkpoint(func: Callable, /):
+    return tf.recompute_grad(func)
@@ -37,8 +37,8 @@ def concat(
     if is_tuple:
         xs = list(xs)
     highest_dtype = xs[0].dtype
-    for i in xs:
-        highest_dtype = ivy.as_native_dtype(ivy.promote_types(highest_dtype, i.dtype))
+    for dtype in {i.dtype for i in xs}:
+        highest_dtype = ivy.as_native_dtype(ivy.promote_types(highest_dtype, dtype))
 
     for i in range(len(xs)):
         if is_axis_none:
@@ -132,12 +132,14 @@ def to_numpy(
     elif torch.is_tensor(x):
         x = x.resolve_neg().resolve_conj()
         if copy:
-            # we don't use inbuilt numpy() because it blocks for
-            # bfloat16, which we are supporting here by importing
-            # ml_dtypes
-            # TODO: use torch's numpy() method once this feature is accepted
-            # https://github.com/pytorch/pytorch/issues/109873
-            return np.array(x.tolist(), dtype=ivy.as_ivy_dtype(x.dtype))
+            if x.dtype == torch.bfloat16:
+                # we don't use inbuilt numpy() because it blocks for
+                # bfloat16, which we are supporting here by importing
+                # ml_dtypes
+                # TODO: use torch's numpy() method once this feature is accepted
+                # https://github.com/pytorch/pytorch/issues/109873
+                return np.array(x.tolist(), dtype=ivy.as_ivy_dtype(x.dtype))
+            return x.detach().cpu().numpy().copy()
         else:
             raise ivy.utils.exceptions.IvyException(
                 "Overwriting the same address is not supported for torch."
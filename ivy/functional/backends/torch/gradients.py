@@ -2,6 +2,7 @@
 
 # global
 import torch
+import torch.utils.checkpoint
 from typing import Optional, Callable, Sequence, Union
 
 # local
@@ -11,6 +12,8 @@ from ivy.func_wrapper import (
     inputs_to_native_arrays,
 )
 from ivy.functional.ivy.gradients import (
+    _handle_checkpoint_nests,
+    _handle_loss_scaling,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_y,
@@ -92,6 +95,7 @@ def _grad_func(y, xs, retain_grads):
     return grads
 
 
+@_handle_loss_scaling
 def execute_with_gradients(
     func,
     xs: torch.Tensor,
@@ -262,3 +266,14 @@ def grad(f, argnums=0):
 
 grad.f_original = None
 grad.nth = 0
+
+
+@_handle_checkpoint_nests
+def checkpoint(func: Callable, /):
+    def checkpointed_fn(*args):
+        # the recomputation is stopped early by raising from within the wrapped ivy
+        # functions, which would turn the exception into an ivy exception
+        with torch.utils.checkpoint.set_checkpoint_early_stop(False):
+            return torch.utils.checkpoint.checkpoint(func, *args, use_reentrant=False)
+
+    return checkpointed_fn
@@ -93,10 +93,11 @@ def multi_head_attention(
 
 
 multi_head_attention.partial_mixed_handler = (
-    lambda *args, scale=None, out_proj_weights=None, is_causal=False, attention_mask=None, return_attention_weights=False, in_proj_weights=None, q_proj_weights=None, k_proj_weights=None, v_proj_weights=None, **kwargs: not ivy.exists(  # noqa: E501
+    lambda *args, scale=None, out_proj_weights=None, is_causal=False, attention_mask=None, return_attention_weights=False, in_proj_weights=None, q_proj_weights=None, k_proj_weights=None, v_proj_weights=None, kv_cache=None, **kwargs: not ivy.exists(  # noqa: E501
         scale
     )
     and ivy.exists(out_proj_weights)
+    and not ivy.exists(kv_cache)
     and (not is_causal or ivy.exists(attention_mask))
     and (not is_causal or not return_attention_weights)
     and (
@@ -651,16 +652,124 @@ def conv_general_transpose(
     return res
 
 
-def scaled_dot_product_attention_v_2p0p0_and_above(
-    q,
-    k,
-    v,
-    scale: float,
+def scaled_dot_product_attention_v_2p1p0_and_above(
+    query: torch.Tensor,
+    key: torch.Tensor,
+    value: torch.Tensor,
     /,
     *,
-    mask=None,
-    out=None,
-):
+    scale: Optional[float] = None,
+    mask: Optional[torch.Tensor] = None,
+    dropout_p: Optional[float] = 0.0,
+    is_causal: Optional[bool] = False,
+    training: Optional[bool] = False,
+    out: Optional[torch.Tensor] = None,
+) -> torch.Tensor:
     if isinstance(mask, torch.Tensor):
-        mask = torch.where(mask == 0, -torch.inf, 0)
-    return torch.nn.functional.scaled_dot_product_attention(q, k, v, attn_mask=mask)
+        # the masked out similarities are lowered to the minimum rather than to -inf,
+        # so that fully masked out queries attend to all the keys, as in ivy
+        mask = torch.where(
+            mask.bool(),
+            torch.zeros((), dtype=query.dtype, device=query.device),
+            torch.finfo(query.dtype).min,
+        )
+    return torch.nn.functional.scaled_dot_product_attention(
+        query,
+        key,
+        value,
+        attn_mask=mask,
+        dropout_p=dropout_p if training else 0.0,
+        is_causal=is_causal,
+        scale=scale if scale else None,
+    )
+
+
+# ivy drops out similarities rather than attention weights
+scaled_dot_product_attention_v_2p1p0_and_above.partial_mixed_handler = (
+    lambda query, key, value, *, dropout_p=0.0, training=False, **kwargs: (
+        not (training and dropout_p)
+        and query.dtype == key.dtype == value.dtype
+        and ivy.is_float_dtype(query)
+    )
+)
+
+
+@with_supported_dtypes(
+    {"2.1.0 and below": ("float32", "float64")},
+    backend_version,
+)
+def lstm(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernels: Sequence[torch.Tensor],
+    recurrent_kernels: Sequence[torch.Tensor],
+    /,
+    *,
+    biases: Optional[Sequence[torch.Tensor]] = None,
+    recurrent_biases: Optional[Sequence[torch.Tensor]] = None,
+    lengths: Optional[Union[torch.Tensor, Sequence[int]]] = None,
+    bidirectional: bool = False,
+    dropout: float = 0.0,
+    training: bool = False,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    num_layers = len(kernels) // (2 if bidirectional else 1)
+    has_biases = biases is not None or recurrent_biases is not None
+    # torch expects the weights of each layer and direction transposed, followed by
+    # both of their biases, if any
+    params = []
+    for i, (kernel, recurrent_kernel) in enumerate(zip(kernels, recurrent_kernels)):
+        params += [kernel.t(), recurrent_kernel.t()]
+        if has_biases:
+            params += [
+                b[i] if b is not None else torch.zeros_like(kernel[0])
+                for b in [biases, recurrent_biases]
+            ]
+    if lengths is None:
+        return torch._VF.lstm(
+            x,
+            (init_h, init_c),
+            params,
+            has_biases,
+            num_layers,
+            dropout,
+            training,
+            bidirectional,
+            True,
+        )
+    packed = torch.nn.utils.rnn.pack_padded_sequence(
+        x,
+        torch.as_tensor(lengths, device="cpu"),
+        batch_first=True,
+        enforce_sorted=False,
+    )
+    # the states are in the order of the packed sequences, sorted by length
+    ret, h_n, c_n = torch._VF.lstm(
+        packed.data,
+        packed.batch_sizes,
+        tuple(s.index_select(1, packed.sorted_indices) for s in (init_h, init_c)),
+        params,
+        has_biases,
+        num_layers,
+        dropout,
+        training,
+        bidirectional,
+    )
+    ret, _ = torch.nn.utils.rnn.pad_packed_sequence(
+        torch.nn.utils.rnn.PackedSequence(
+            ret, packed.batch_sizes, packed.sorted_indices, packed.unsorted_indices
+        ),
+        batch_first=True,
+        total_length=x.shape[1],
+    )
+    return (
+        ret,
+        h_n.index_select(1, packed.unsorted_indices),
+        c_n.index_select(1, packed.unsorted_indices),
+    )
+
+
+lstm.partial_mixed_handler = (
+    lambda x, init_h, init_c, kernels, *args, lengths=None, **kwargs: x.ndim == 3
+    and (lengths is None or bool(torch.all(torch.as_tensor(lengths) > 0)))
+)
@@ -5,15 +5,31 @@ from ivy.func_wrapper import to_native_arrays_and_back
 
 @to_native_arrays_and_back
 def scaled_dot_product_attention(
-    q,
-    k,
-    v,
-    scale: float,
+    query,
+    key,
+    value,
     /,
     *,
+    scale=None,
     mask=None,
+    dropout_p=0.0,
+    is_causal=False,
+    training=False,
     out=None,
 ):
     if isinstance(mask, torch.Tensor):
-        mask = torch.where(mask == 0, -torch.inf, 0)
-    return xops.memory_efficient_attention(q, k, v, scale=scale, attn_bias=mask)
+        mask = torch.where(
+            mask.bool(),
+            torch.zeros((), dtype=query.dtype, device=query.device),
+            torch.finfo(query.dtype).min,
+        )
+    elif is_causal:
+        mask = xops.LowerTriangularMask()
+    return xops.memory_efficient_attention(
+        query,
+        key,
+        value,
+        attn_bias=mask,
+        p=dropout_p if training else 0.0,
+        scale=scale if scale else None,
+    )
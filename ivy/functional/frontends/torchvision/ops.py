@@ -3,6 +3,16 @@ from ivy.functional.frontends.torch.func_wrapper import to_ivy_arrays_and_back
 from ivy.func_wrapper import with_supported_dtypes
 
 
+@to_ivy_arrays_and_back
+def batched_nms(boxes, scores, idxs, iou_threshold):
+    return ivy.batched_nms(boxes, scores, idxs, iou_threshold=iou_threshold)
+
+
+@to_ivy_arrays_and_back
+def box_iou(boxes1, boxes2):
+    return ivy.box_iou(boxes1, boxes2)
+
+
 @to_ivy_arrays_and_back
 def nms(boxes, scores, iou_threshold):
     return ivy.nms(boxes, scores, iou_threshold)
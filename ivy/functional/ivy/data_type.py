@@ -819,11 +819,52 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = []
-default_float_dtype_stack = []
-default_int_dtype_stack = []
-default_uint_dtype_stack = []
-default_complex_dtype_stack = []
+default_dtype_stack = ivy.utils.context.ContextStack("default_dtype_stack")
+default_float_dtype_stack = ivy.utils.context.ContextStack("default_float_dtype_stack")
+default_int_dtype_stack = ivy.utils.context.ContextStack("default_int_dtype_stack")
+default_uint_dtype_stack = ivy.utils.context.ContextStack("default_uint_dtype_stack")
+default_complex_dtype_stack = ivy.utils.context.ContextStack(
+    "default_complex_dtype_stack"
+)
+autocast_dtype_stack = ivy.utils.context.ContextStack("autocast_dtype_stack")
+
+# the functions which run in the low precision dtype under autocast, as they are
+# compute bound and well conditioned, and the functions which run in float32, as
+# they accumulate over many elements or lose too much precision in 16 bits
+autocast_low_precision_fns = (
+    "conv",
+    "conv1d",
+    "conv1d_transpose",
+    "conv2d",
+    "conv2d_transpose",
+    "conv3d",
+    "conv3d_transpose",
+    "conv_general_dilated",
+    "conv_general_transpose",
+    "depthwise_conv2d",
+    "linear",
+    "matmul",
+    "multi_head_attention",
+    "scaled_dot_product_attention",
+)
+autocast_float32_fns = (
+    "batch_norm",
+    "binary_cross_entropy",
+    "cross_entropy",
+    "cumprod",
+    "cumsum",
+    "layer_norm",
+    "log_softmax",
+    "matrix_norm",
+    "mean",
+    "prod",
+    "softmax",
+    "sparse_cross_entropy",
+    "std",
+    "sum",
+    "var",
+    "vector_norm",
+)
 
 
 class DefaultDtype:
@@ -911,6 +952,30 @@ class DefaultComplexDtype:
         return self
 
 
+class Autocast:
+    """
+    Ivy's Autocast class.
+
+    Within the context, the functions in ``ivy.autocast_low_precision_fns`` cast
+    their float32 inputs to ``dtype``, and the functions in
+    ``ivy.autocast_float32_fns`` cast their float16 and bfloat16 inputs to float32.
+    The casts apply to the functions of the backend set with ``ivy.set_backend``.
+    """
+
+    def __init__(self, dtype: ivy.Dtype = "bfloat16"):
+        self._dtype = dtype
+
+    def __enter__(self):
+        set_autocast_dtype(self._dtype)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_autocast_dtype()
+        if self and (exc_type is not None):
+            raise exc_val
+        return self
+
+
 @handle_exceptions
 def dtype_bits(dtype_in: Union[ivy.Dtype, ivy.NativeDtype, str], /) -> int:
     """
@@ -1009,6 +1074,28 @@ def as_native_dtype(dtype_in: Union[ivy.Dtype, ivy.NativeDtype], /) -> ivy.Nativ
     return current_backend(None).as_native_dtype(dtype_in)
 
 
+@handle_exceptions
+def autocast_dtype() -> Optional[ivy.Dtype]:
+    """
+    Return the low precision dtype of the current autocast context.
+
+    Returns
+    -------
+    ret
+        The dtype set with ``ivy.set_autocast_dtype``, or ``None`` outside of an
+        autocast context.
+
+    Examples
+    --------
+    >>> ivy.autocast_dtype()
+    None
+    >>> with ivy.Autocast("float16"):
+    ...     print(ivy.autocast_dtype())
+    float16
+    """
+    return autocast_dtype_stack[-1] if autocast_dtype_stack else None
+
+
 def _check_float64(input) -> bool:
     if ivy.is_array(input):
         return ivy.dtype(input) == "float64"
@@ -2127,6 +2214,38 @@ def promote_types(
     return _promote(query)
 
 
+@handle_exceptions
+def set_autocast_dtype(dtype: Union[ivy.Dtype, str], /):
+    """
+    Set the low precision dtype of autocast, which the functions in
+    ``ivy.autocast_low_precision_fns`` then run in, while the functions in
+    ``ivy.autocast_float32_fns`` run in float32.
+
+    Parameters
+    ----------
+    dtype
+        The low precision dtype, either ``"float16"`` or ``"bfloat16"``.
+
+    Examples
+    --------
+    >>> ivy.set_autocast_dtype("float16")
+    >>> x = ivy.array([[1., 2.], [3., 4.]])
+    >>> ivy.matmul(x, x).dtype
+    float16
+    >>> ivy.sum(ivy.astype(x, "float16")).dtype
+    float32
+    >>> ivy.unset_autocast_dtype()
+    """
+    dtype = ivy.as_ivy_dtype(dtype)
+    ivy.utils.assertions.check_elem_in_list(
+        dtype,
+        ["float16", "bfloat16"],
+        message=f"autocast dtype must be float16 or bfloat16, but got {dtype}",
+    )
+    global autocast_dtype_stack
+    autocast_dtype_stack.append(dtype)
+
+
 @handle_exceptions
 def set_default_dtype(dtype: Union[ivy.Dtype, ivy.NativeDtype, str], /):
     """
@@ -2299,6 +2418,24 @@ def type_promote_arrays(
     return ivy.astype(x1, new_type), ivy.astype(x2, new_type)
 
 
+@handle_exceptions
+def unset_autocast_dtype():
+    """
+    Reset the autocast dtype to the previous state, ending autocast if it was the
+    outermost.
+
+    Examples
+    --------
+    >>> ivy.set_autocast_dtype("bfloat16")
+    >>> ivy.unset_autocast_dtype()
+    >>> ivy.autocast_dtype()
+    None
+    """
+    global autocast_dtype_stack
+    if autocast_dtype_stack:
+        autocast_dtype_stack.pop(-1)
+
+
 @handle_exceptions
 def unset_default_dtype():
     """
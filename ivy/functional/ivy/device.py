@@ -6,27 +6,14 @@ import os
 import gc
 import abc
 import math
-import psutil
+import time
+import collections
+import contextvars
+import concurrent.futures
 import warnings
 import types
 from typing import Type, Optional, Tuple
 
-# noinspection PyUnresolvedReferences
-try:
-    import pynvml
-
-    try:
-        pynvml.nvmlInit()
-    except pynvml.NVMLError:
-        pass
-except ImportError:
-    warnings.warn(
-        "pynvml installation was not found in the environment, functionalities"
-        " of the Ivy's device module will be limited. Please install pynvml if"
-        " you wish to use GPUs with Ivy."
-    )
-    # nvidia-ml-py (pynvml) is not installed in CPU Dockerfile.
-
 from typing import Union, Callable, Iterable, Any
 
 # local
@@ -40,11 +27,32 @@ from ivy.func_wrapper import (
 )
 from ivy.utils.exceptions import handle_exceptions
 
-default_device_stack = []
-soft_device_mode_stack = []
+
+def _init_nvml(pynvml):
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        pass
+
+
+# psutil and pynvml are only imported once a device function queries them
+psutil = ivy.utils.lazy_import("psutil")
+# noinspection PyUnresolvedReferences
+pynvml = ivy.utils.lazy_import("pynvml", on_import=_init_nvml)
+if pynvml is None:
+    warnings.warn(
+        "pynvml installation was not found in the environment, functionalities"
+        " of the Ivy's device module will be limited. Please install pynvml if"
+        " you wish to use GPUs with Ivy."
+    )
+    # nvidia-ml-py (pynvml) is not installed in CPU Dockerfile.
+
+default_device_stack = ivy.utils.context.ContextStack("default_device_stack")
+soft_device_mode_stack = ivy.utils.context.ContextStack("soft_device_mode_stack")
 dev_handles = {}
 split_factors = {}
 max_chunk_sizes = {}
+chunk_throughputs = {}
 
 
 # Extra #
@@ -1035,6 +1043,93 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _free_mem_on_dev(device: Union[ivy.Device, ivy.NativeDevice], /) -> Optional[int]:
+    # free memory in bytes, or None when it cannot be queried for the device
+    device = ivy.as_ivy_dev(device)
+    if "gpu" in device and pynvml is not None:
+        return pynvml.nvmlDeviceGetMemoryInfo(_get_nvml_gpu_handle(device)).free
+    if device == "cpu" and psutil is not None:
+        return psutil.virtual_memory().available
+    return None
+
+
+def _tune_chunk_size(
+    shape_key, chunk_size, max_dim, item_nbytes, num_in_flight, device
+):
+    """
+    Choose the chunk size for a split call from the throughputs measured on previous
+    calls with the same input shapes. Starting from the size given by the split factor,
+    which is never exceeded, the size is halved while the smallest size tried is also
+    the fastest one, and is capped so that the chunks in flight fit into half of the
+    free memory on the device.
+    """
+    measured = chunk_throughputs.get(shape_key)
+    if measured:
+        fastest = max(measured, key=measured.get)
+        smallest = min(measured)
+        chunk_size = min(
+            chunk_size, max(smallest // 2, 1) if fastest == smallest else fastest
+        )
+    if item_nbytes:
+        free_mem = _free_mem_on_dev(device)
+        if free_mem is not None:
+            max_fit = int(free_mem / 2 / (item_nbytes * num_in_flight))
+            chunk_size = min(chunk_size, max(max_fit, 1))
+    return max(min(chunk_size, max_dim), 1)
+
+
+class _ConcatBuffer:
+    """
+    Collects the chunked returns for one output of split_func_call, writing them into
+    a preallocated array when the backend supports inplace array updates, and falling
+    back to a concatenation of the chunks otherwise.
+    """
+
+    def __init__(self, axis, total_size):
+        self._axis = axis
+        self._total_size = total_size
+        self._preallocate = ivy.inplace_arrays_supported()
+        self._buffer = None
+        self._offset = 0
+        self._parts = []
+
+    def add(self, x, chunk_size):
+        if self._preallocate and not self._parts and self._fits(x, chunk_size):
+            axis = self._axis % len(x.shape)
+            if self._buffer is None:
+                shape = list(x.shape)
+                shape[axis] = self._total_size
+                self._buffer = ivy.empty(shape, dtype=x.dtype, device=ivy.dev(x))
+            idx = [slice(None)] * len(x.shape)
+            idx[axis] = slice(self._offset, self._offset + chunk_size)
+            ivy.to_native(self._buffer)[tuple(idx)] = ivy.to_native(x)
+            self._offset += chunk_size
+            return
+        if self._buffer is not None:
+            self._parts.append(self._written())
+            self._buffer = None
+        self._parts.append(x)
+
+    def result(self):
+        if not self._parts:
+            return self._buffer
+        return ivy.concat(self._parts, axis=self._axis)
+
+    def _fits(self, x, chunk_size):
+        if not ivy.is_array(x) or not len(x.shape):
+            return False
+        if x.shape[self._axis % len(x.shape)] != chunk_size:
+            return False
+        return self._buffer is None or (
+            x.dtype == self._buffer.dtype and len(x.shape) == len(self._buffer.shape)
+        )
+
+    def _written(self):
+        idx = [slice(None)] * len(self._buffer.shape)
+        idx[self._axis % len(self._buffer.shape)] = slice(0, self._offset)
+        return self._buffer[tuple(idx)]
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1048,12 +1143,20 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    num_workers: Optional[int] = None,
+    devices: Optional[Iterable[Union[ivy.Device, ivy.NativeDevice]]] = None,
+    tune_chunk_size: bool = False,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
     Call a function by splitting its inputs along a given axis, and calling the function
     in chunks, rather than feeding the entire input array at once. This can be useful to
     reduce memory usage of the device the arrays are on.
 
+    With ``tune_chunk_size``, and neither ``chunk_size`` nor ``max_chunk_size`` given,
+    the chunk size is tuned across calls from the throughput measured for the same
+    input shapes, up to the size given by the device's split factor, and capped by the
+    free memory on the device.
+
     Parameters
     ----------
     func
@@ -1078,6 +1181,19 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    num_workers
+        The number of threads to call the function on the chunks with. At most one
+        chunk more than the number of workers is in flight at any time. Default is
+        ``None``, which calls the function on the chunks one after another, or uses
+        one worker per device if ``devices`` is given.
+    devices
+        The devices to distribute the chunks over, in a round-robin fashion. The
+        returns are moved back to ``device``. Default is ``None``, which keeps each
+        chunk on the device of the inputs.
+    tune_chunk_size
+        Whether to tune the chunk size from the throughputs measured on previous calls,
+        which makes the chunking depend on timings. Default is ``False``, which uses
+        the size given by the device's split factor.
 
     Returns
     -------
@@ -1086,13 +1202,20 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
-    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
+    devices = list(devices) if ivy.exists(devices) else None
+    num_workers = ivy.default(num_workers, len(devices) if devices else 1)
+    auto_chunk_size = not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size)
+    tune = tune_chunk_size and auto_chunk_size
+    if auto_chunk_size:
         shape_key = "_".join([str(inp.shape) for inp in inputs])
         if shape_key in max_chunk_sizes:
             max_chunk_size = max_chunk_sizes[shape_key]
         else:
             max_chunk_size = 0
-        max_dim = max(inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes))
+        max_dim = max(
+            (inp.cont_shape if ivy.is_ivy_container(inp) else inp.shape)[inp_ax]
+            for inp, inp_ax in zip(inputs, input_axes)
+        )
         if max_dim > max_chunk_size:
             max_chunk_sizes[shape_key] = max_dim
             max_chunk_size = max_dim
@@ -1105,11 +1228,25 @@ def split_func_call(
         with_callable=True,
     )
     dim_size = inputs[0].shape[input_axes[0]]
+    if tune:
+        item_nbytes = (
+            sum(math.prod(inp.shape) * ivy.dtype_bits(inp.dtype) // 8 for inp in inputs)
+            // dim_size
+            if dim_size and all(ivy.is_array(inp) for inp in inputs)
+            else None
+        )
+        chunk_size = _tune_chunk_size(
+            shape_key,
+            chunk_size,
+            max_chunk_size,
+            item_nbytes,
+            num_workers + 1,
+            ivy.default_device(device),
+        )
     if chunk_size >= dim_size:
         return func(*inputs)
     num_chunks = dim_size / chunk_size
     num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
     chunk_sizes = [chunk_size] * num_chunks_floored
     if num_chunks != num_chunks_floored:
         chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
@@ -1131,39 +1268,77 @@ def split_func_call(
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
-    if is_mean or is_sum:
-        sums = None
-        for inps in zip(*inputs_split):
-            if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
-                )
+    out_device = ivy.default_device(device)
+
+    def _call(chunk_idx, inps):
+        if devices:
+            inps = [ivy.to_device(x, devices[chunk_idx % len(devices)]) for x in inps]
+        ret = func(*inps)
+        ret = (
+            tuple(post_fn(r) for r in ret)
+            if isinstance(ret, tuple)
+            else (post_fn(ret),)
+        )
+        if devices:
+            ret = tuple(ivy.to_device(r, out_device) for r in ret)
+        return ret
+
+    # accumulated sums for mean and sum modes, or one buffer per output for concat
+    accumulated = []
+
+    def _accumulate(chunk_idx, ret):
+        if not accumulated:
+            if is_mean:
+                # the means of the chunks are weighted by their sizes
+                accumulated.extend(r * chunk_sizes[chunk_idx] for r in ret)
+                return
+            if is_sum:
+                accumulated.extend(ret)
+                return
+            nonlocal output_axes
+            if output_axes is None:
+                output_axes = [input_axes[0]] * len(ret)
+            elif isinstance(output_axes, int):
+                output_axes = [output_axes] * len(ret)
+            accumulated.extend(
+                _ConcatBuffer(axis, dim_size) for axis in output_axes[: len(ret)]
+            )
+        for i, r in enumerate(ret):
+            if is_mean:
+                accumulated[i] = accumulated[i] + r * chunk_sizes[chunk_idx]
+            elif is_sum:
+                accumulated[i] = accumulated[i] + r
             else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
+                accumulated[i].add(r, chunk_sizes[chunk_idx])
+
+    start_time = time.perf_counter()
+    if num_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+            in_flight = collections.deque()
+            for chunk_idx, inps in enumerate(zip(*inputs_split)):
+                # worker threads run in a copy of the caller's context, so that the
+                # context-local global modes set by the caller apply to them
+                in_flight.append(
+                    executor.submit(
+                        contextvars.copy_context().run, _call, chunk_idx, inps
+                    )
+                )
+                if len(in_flight) > num_workers:
+                    _accumulate(chunk_idx - num_workers, in_flight.popleft().result())
+            first_idx = len(chunk_sizes) - len(in_flight)
+            for chunk_idx, future in enumerate(in_flight, first_idx):
+                _accumulate(chunk_idx, future.result())
+    else:
+        for chunk_idx, inps in enumerate(zip(*inputs_split)):
+            _accumulate(chunk_idx, _call(chunk_idx, inps))
+    if tune:
+        throughput = dim_size / max(time.perf_counter() - start_time, 1e-9)
+        measured = chunk_throughputs.setdefault(shape_key, {})
+        measured[chunk_size] = max(measured.get(chunk_size, 0.0), throughput)
+    if is_mean or is_sum:
+        sums_or_means = [s / dim_size for s in accumulated] if is_mean else accumulated
         return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
-    ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
-    ]
+    ret = [buffer.result() for buffer in accumulated]
     return ret[0] if len(ret) == 1 else ret
 
 
@@ -49,23 +49,27 @@ from ivy.functional.ivy.device import dev
 FN_CACHE = {}
 INF = float("inf")
 
-precise_mode_stack = []
-queue_timeout_stack = []
-array_mode_stack = []
-shape_array_mode_stack = []
-nestable_mode_stack = []
-exception_trace_mode_stack = []
-inplace_mode_stack = []
+precise_mode_stack = ivy.utils.context.ContextStack("precise_mode_stack")
+queue_timeout_stack = ivy.utils.context.ContextStack("queue_timeout_stack")
+array_mode_stack = ivy.utils.context.ContextStack("array_mode_stack")
+shape_array_mode_stack = ivy.utils.context.ContextStack("shape_array_mode_stack")
+nestable_mode_stack = ivy.utils.context.ContextStack("nestable_mode_stack")
+exception_trace_mode_stack = ivy.utils.context.ContextStack(
+    "exception_trace_mode_stack"
+)
+inplace_mode_stack = ivy.utils.context.ContextStack("inplace_mode_stack")
 trace_mode_dict = {
     "frontend": "ivy/functional/frontends",
     "ivy": "ivy/",
     "full": "",
     "none": "",
 }
-show_func_wrapper_trace_mode_stack = []
-min_denominator_stack = []
-min_base_stack = []
-tmp_dir_stack = []
+show_func_wrapper_trace_mode_stack = ivy.utils.context.ContextStack(
+    "show_func_wrapper_trace_mode_stack"
+)
+min_denominator_stack = ivy.utils.context.ContextStack("min_denominator_stack")
+min_base_stack = ivy.utils.context.ContextStack("min_base_stack")
+tmp_dir_stack = ivy.utils.context.ContextStack("tmp_dir_stack")
 
 
 # Extra #
@@ -1,6 +1,7 @@
 """Collection of gradient Ivy functions."""
 
 # global
+import functools
 from typing import Sequence, Union, Optional, Tuple, Callable
 import numpy as np
 import itertools
@@ -239,6 +240,12 @@ def _process_func_ret_and_grads(func_ret, grads, retain_grads):
     Set the gradients of non-finite values to zero, and stopping
     gradient propagation of the function results.
     """
+    if _found_inf_stack:
+        # the loss scaling records the overflow before the non-finite gradients are
+        # set to zero
+        _found_inf_stack[-1].append(
+            not all(bool(ivy.all(ivy.isfinite(g))) for g in _array_leaves(grads))
+        )
     grads = _non_finite_to_zero(grads)
     func_ret, grads = _stop_grad_and_index(func_ret, retain_grads, grads)
     grads = _to_ivy(grads)
@@ -271,6 +278,150 @@ def _non_finite_to_zero(xs):
     )
 
 
+def _map_arrays(fn, nest):
+    # map the arrays and containers of a nest of lists, tuples and dicts
+    if ivy.is_array(nest) or ivy.is_ivy_container(nest):
+        return fn(nest)
+    if isinstance(nest, dict):
+        return {k: _map_arrays(fn, v) for k, v in nest.items()}
+    if isinstance(nest, (list, tuple)):
+        return type(nest)(_map_arrays(fn, v) for v in nest)
+    return nest
+
+
+def _array_leaves(nest):
+    if ivy.is_ivy_container(nest):
+        return nest.cont_flatten()[0]
+    if ivy.is_array(nest):
+        return [nest]
+    if isinstance(nest, dict):
+        nest = list(nest.values())
+    if isinstance(nest, (list, tuple)):
+        return [leaf for v in nest for leaf in _array_leaves(v)]
+    return []
+
+
+def _flatten_nest(nest):
+    # the leaves of a nest of lists, tuples, dicts and containers, along with the
+    # function rebuilding the nest from new leaves
+    if ivy.is_ivy_container(nest):
+        leaves, treedef = nest.cont_flatten()
+        return leaves, treedef.unflatten
+    if isinstance(nest, (list, tuple, dict)):
+        keys = list(nest.keys()) if isinstance(nest, dict) else range(len(nest))
+        flat = [_flatten_nest(nest[k]) for k in keys]
+        ends = list(itertools.accumulate(len(leaves) for leaves, _ in flat))
+
+        def _unflatten(leaves):
+            values = [
+                unflatten(leaves[end - len(sub_leaves) : end])
+                for (sub_leaves, unflatten), end in zip(flat, ends)
+            ]
+            if isinstance(nest, dict):
+                return dict(zip(keys, values))
+            return type(nest)(values)
+
+        return [leaf for leaves, _ in flat for leaf in leaves], _unflatten
+    return [nest], lambda leaves: leaves[0]
+
+
+def _handle_checkpoint_nests(fn):
+    """
+    Let a backend implementation of checkpoint take functions of nests.
+
+    The backend implementation checkpoints a function of native arrays returning a
+    list of native arrays, so the arguments and the return of the function are
+    flattened into their array leaves around it, leaving the other leaves static.
+    """
+
+    @functools.wraps(fn)
+    def _checkpoint(func):
+        @functools.wraps(func)
+        def _checkpointed(*args, **kwargs):
+            leaves, unflatten = _flatten_nest((args, kwargs))
+            array_idxs = [i for i, x in enumerate(leaves) if ivy.is_array(x)]
+            ret_structure = []
+
+            def _native_fn(*arrays):
+                leaves_ = list(leaves)
+                for i, x in zip(array_idxs, arrays):
+                    leaves_[i] = ivy.to_ivy(x)
+                args_, kwargs_ = unflatten(leaves_)
+                ret_leaves, ret_unflatten = _flatten_nest(func(*args_, **kwargs_))
+                ret_idxs = [i for i, x in enumerate(ret_leaves) if ivy.is_array(x)]
+                # the structure is recorded again when the function is recomputed
+                ret_structure[:] = [ret_leaves, ret_unflatten, ret_idxs]
+                return [ivy.to_native(ret_leaves[i]) for i in ret_idxs]
+
+            ret_arrays = fn(_native_fn)(*[ivy.to_native(leaves[i]) for i in array_idxs])
+            ret_leaves, ret_unflatten, ret_idxs = ret_structure
+            ret_leaves = list(ret_leaves)
+            for i, x in zip(ret_idxs, ret_arrays):
+                ret_leaves[i] = ivy.to_ivy(x)
+            return ret_unflatten(ret_leaves)
+
+        return _checkpointed
+
+    return _checkpoint
+
+
+# whether the gradients computed under loss scaling overflowed, appended to by
+# _process_func_ret_and_grads
+_found_inf_stack = ivy.utils.context.ContextStack("found_inf_stack")
+
+
+def _handle_loss_scaling(fn):
+    """
+    Add the ``loss_scaler`` argument to a backend implementation of
+    execute_with_gradients.
+
+    The outputs which the gradients are computed for are multiplied by the scale of
+    the loss scaler before the backward pass, and the gradients are divided by it
+    afterwards, so that small gradients don't underflow in float16. The loss scaler
+    is then updated with whether any of the gradients overflowed.
+    """
+
+    @functools.wraps(fn)
+    def _execute_with_gradients(func, xs, /, *, loss_scaler=None, **kwargs):
+        if loss_scaler is None:
+            return fn(func, xs, **kwargs)
+        scale = loss_scaler.scale
+        ret_grad_idxs = kwargs.get("ret_grad_idxs", [[0]])
+
+        def _map_ret(ret, map_fn):
+            if ret_grad_idxs is None or ivy.is_array(ret) or ivy.is_ivy_container(ret):
+                return _map_arrays(map_fn, ret)
+            return ivy.map_nest_at_indices(
+                ret, ret_grad_idxs, lambda x: _map_arrays(map_fn, x), shallow=False
+            )
+
+        # the outputs of the first call of func, which the backends make eagerly, are
+        # returned as they are, as the scaled outputs divided back by the scale would
+        # be nan where they overflow
+        unscaled = []
+
+        def _scaled_func(x):
+            ret = func(x)
+            if not unscaled:
+                unscaled.append(ret)
+            return _map_ret(ret, lambda y: y * scale)
+
+        found_inf = []
+        _found_inf_stack.append(found_inf)
+        try:
+            _, grads = fn(_scaled_func, xs, **kwargs)
+        finally:
+            _found_inf_stack.pop()
+        func_ret, _ = _stop_grad_and_index(
+            unscaled[0], kwargs.get("retain_grads", False), None
+        )
+        grads = _map_arrays(lambda g: g / scale, grads)
+        loss_scaler.update(any(found_inf))
+        return func_ret, grads
+
+    return _execute_with_gradients
+
+
 # Private Variable Helpers #
 # -------------------------#
 
@@ -408,6 +559,7 @@ def execute_with_gradients(
     retain_grads: bool = False,
     xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
     ret_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
+    loss_scaler: Optional["LossScaler"] = None,
 ) -> Tuple[ivy.Array, ivy.Array]:
     """
     Call function func with input of xs variables, and return the function result
@@ -433,6 +585,11 @@ def execute_with_gradients(
         gradients are returned for all returned arrays. If the returned object from the
         ``func`` is an ``ivy.Array`` or ``ivy.Container``, the default value is ``None``
         otherwise the default value is ``[[0]]``.
+    loss_scaler
+        An ``ivy.LossScaler`` to scale the loss by before computing the gradients,
+        which are then unscaled and checked for overflow. Whether they overflowed is
+        recorded in ``loss_scaler.found_inf``, and the scale is updated accordingly.
+        Default is ``None``, which doesn't scale the loss.
 
     Returns
     -------
@@ -479,6 +636,7 @@ def execute_with_gradients(
         retain_grads=retain_grads,
         xs_grad_idxs=xs_grad_idxs,
         ret_grad_idxs=ret_grad_idxs,
+        loss_scaler=loss_scaler,
     )
 
 
@@ -587,6 +745,40 @@ def grad(func: Callable, argnums: Union[int, Sequence[int]] = 0) -> Callable:
 grad.computes_gradients = True
 
 
+@handle_exceptions
+def checkpoint(func: Callable, /) -> Callable:
+    """
+    Create a function computing func without keeping its intermediate activations
+    for the gradient pass, which recomputes them instead.
+
+    Only the arguments and the return of the checkpointed function are kept alive
+    until the gradients are computed, trading memory for a second forward pass
+    through func. Backends without automatic differentiation return func unchanged.
+
+    Parameters
+    ----------
+    func
+        Function to checkpoint, taking and returning arbitrary nests of arrays. The
+        function is called again during the gradient pass, so it should not have
+        side effects.
+
+    Returns
+    -------
+    ret
+        The checkpointed function, returning the same values as func.
+
+    Examples
+    --------
+    >>> x = ivy.array([[4.6, 2.1, 5], [2.8, 1.3, 6.2]])
+    >>> func = ivy.checkpoint(lambda x: ivy.tanh(ivy.exp(x) * 2))
+    >>> y = func(x)
+    >>> print(y)
+    ivy.array([[1., 1., 1.],
+           [1., 1., 1.]])
+    """
+    return current_backend(None).checkpoint(func)
+
+
 # Optimizer Steps #
 
 
@@ -1395,3 +1587,114 @@ def lamb_update(
 
 
 lamb_update.out_index = 0
+
+
+# Loss Scaling #
+# -------------#
+
+
+class LossScaler:
+    """
+    Dynamic loss scaling, for training with float16 gradients.
+
+    The loss is multiplied by ``scale`` in ``ivy.execute_with_gradients``, so that
+    the small gradients don't underflow, and the gradients are divided by it again.
+    When any of them overflows, the step should be skipped and the scale is reduced
+    by ``backoff_factor``, while after ``growth_interval`` steps without overflow the
+    scale grows by ``growth_factor``.
+
+    Examples
+    --------
+    >>> loss_scaler = ivy.LossScaler()
+    >>> optimizer = ivy.Adam(lr=1e-3, master_weights=True)
+    >>> loss, grads = ivy.execute_with_gradients(
+    ...     loss_fn, v, loss_scaler=loss_scaler
+    ... )
+    >>> v = loss_scaler.step(optimizer, v, grads)
+    """
+
+    def __init__(
+        self,
+        init_scale: float = 2.0**16,
+        growth_factor: float = 2.0,
+        backoff_factor: float = 0.5,
+        growth_interval: int = 2000,
+    ):
+        """
+        Construct a loss scaler.
+
+        Parameters
+        ----------
+        init_scale
+            The initial scale. Default is ``2.0**16``.
+        growth_factor
+            The factor to grow the scale by after ``growth_interval`` steps without
+            overflow. Default is ``2.0``.
+        backoff_factor
+            The factor to reduce the scale by when the gradients overflow. Default is
+            ``0.5``.
+        growth_interval
+            The number of steps without overflow after which the scale grows. Default
+            is ``2000``.
+        """
+        ivy.utils.assertions.check_greater(
+            growth_factor,
+            1.0,
+            message="growth_factor must be greater than 1",
+            as_array=False,
+        )
+        ivy.utils.assertions.check_less(
+            backoff_factor,
+            1.0,
+            message="backoff_factor must be less than 1",
+            as_array=False,
+        )
+        self.scale = float(init_scale)
+        self.found_inf = False
+        self._growth_factor = growth_factor
+        self._backoff_factor = backoff_factor
+        self._growth_interval = growth_interval
+        self._growth_tracker = 0
+
+    def update(self, found_inf: bool):
+        """
+        Update the scale after a backward pass.
+
+        Parameters
+        ----------
+        found_inf
+            Whether any of the gradients of the backward pass was not finite.
+        """
+        self.found_inf = found_inf
+        if found_inf:
+            self.scale *= self._backoff_factor
+            self._growth_tracker = 0
+            return
+        self._growth_tracker += 1
+        if self._growth_tracker == self._growth_interval:
+            self.scale *= self._growth_factor
+            self._growth_tracker = 0
+
+    def step(self, optimizer, v: ivy.Container, grads: ivy.Container, **kwargs):
+        """
+        Step the optimizer, unless the gradients of the last backward pass overflowed.
+
+        Parameters
+        ----------
+        optimizer
+            The optimizer to step.
+        v
+            Nested variables to update.
+        grads
+            Nested gradients, unscaled by ``ivy.execute_with_gradients``.
+        kwargs
+            The other arguments of ``optimizer.step``.
+
+        Returns
+        -------
+        ret
+            The updated variables, or ``v`` if the step was skipped.
+        """
+        if self.found_inf:
+            return v
+        return optimizer.step(v, grads, **kwargs)
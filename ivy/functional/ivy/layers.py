@@ -2,6 +2,7 @@
 
 # global
 from typing import Optional, Tuple, Union, Sequence
+import numpy as np
 
 # local
 import ivy
@@ -23,6 +24,23 @@ from ivy.utils.exceptions import handle_exceptions
 # Extra #
 # ------#
 
+# the number of queries and of keys in the tiles of the similarities computed at once
+# by scaled_dot_product_attention
+_ATTENTION_BLOCK_SIZE = 512
+
+# the number of boxes whose overlaps with the lower scoring boxes nms computes at once,
+# a multiple of 8 for the rows of the overlaps to pack into whole bytes
+_NMS_BLOCK_SIZE = 256
+
+
+def _attention_mask_tile(mask, q_start, q_end, k_start, k_end):
+    # the tile of a mask broadcasting against the (..., queries, keys) similarities
+    k_slice = slice(k_start, k_end) if mask.shape[-1] > 1 else slice(None)
+    if len(mask.shape) < 2:
+        return mask[k_slice]
+    q_slice = slice(q_start, q_end) if mask.shape[-2] > 1 else slice(None)
+    return mask[..., q_slice, k_slice]
+
 
 def _get_embed_dim(
     in_proj_weights, q_proj_weights, k_proj_weights, v_proj_weights, query
@@ -434,6 +452,7 @@ dropout.mixed_backend_wrappers = {
 
 
 @handle_exceptions
+@handle_partial_mixed_function
 @handle_array_like_without_promotion
 @handle_array_function
 def scaled_dot_product_attention(
@@ -452,6 +471,11 @@ def scaled_dot_product_attention(
     """
     Apply scaled dot product attention to inputs x using optional mask.
 
+    The similarities are computed a tile of queries and keys at a time, with an
+    online softmax, so that neither the full matrix of similarities nor a full mask
+    is materialised, and causal masking skips the tiles past the diagonal. The fused
+    kernels of the backends are used instead when available.
+
     Parameters
     ----------
     query
@@ -692,29 +716,64 @@ def scaled_dot_product_attention(
     )
     embed_dim = query.shape[-1]
     scale = scale if scale else 1 / (embed_dim**0.5)
-    sim = ivy.einsum("... q f, ... k f -> ... q k", query, key) * scale
-    sim = ivy.dropout(sim, dropout_p, training=training)
-    if ivy.exists(mask):
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
-    elif is_causal:
-        L = query.shape[-2]  # Source sequence length
-        S = key.shape[-2]  # Target sequence length
-        mask = ivy.tril(ivy.ones((L, S)), k=0)
-        mask = ivy.astype(mask, ivy.bool)
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
-    attn = ivy.softmax(sim, axis=-1)
-    result = ivy.einsum("... qk, ...kf -> ...qf", attn, value)
+    num_queries, num_keys = query.shape[-2], key.shape[-2]
+    block_size = _ATTENTION_BLOCK_SIZE
+    # the similarities are computed a tile at a time, with the softmax over the keys
+    # accumulated online, rescaling the running sums whenever the maximum grows
+    results = []
+    for q_start in range(0, num_queries, block_size):
+        q_end = min(q_start + block_size, num_queries)
+        q = query[..., q_start:q_end, :]
+        # causal masking skips the tiles of keys after the last query of the block
+        k_stop = min(q_end, num_keys) if is_causal else num_keys
+        max_sim, sum_exp, acc = None, None, None
+        for k_start in range(0, k_stop, block_size):
+            k_end = min(k_start + block_size, k_stop)
+            sim = ivy.matmul(q, key[..., k_start:k_end, :], transpose_b=True) * scale
+            sim = ivy.dropout(sim, dropout_p, training=training)
+            if ivy.exists(mask):
+                tile = _attention_mask_tile(mask, q_start, q_end, k_start, k_end)
+            elif is_causal and k_end - 1 > q_start:
+                # only the tiles crossing the diagonal are partly masked
+                tile = ivy.greater_equal(
+                    ivy.expand_dims(ivy.arange(q_start, q_end), axis=-1),
+                    ivy.arange(k_start, k_end),
+                )
+            else:
+                tile = None
+            if tile is not None:
+                sim = ivy.where(
+                    ivy.logical_not(tile), -ivy.finfo(ivy.dtype(sim)).max, sim
+                )
+            tile_max = ivy.max(sim, axis=-1, keepdims=True)
+            new_max = tile_max if max_sim is None else ivy.maximum(max_sim, tile_max)
+            exp_sim = ivy.exp(sim - new_max)
+            tile_sum = ivy.sum(exp_sim, axis=-1, keepdims=True)
+            tile_acc = ivy.matmul(exp_sim, value[..., k_start:k_end, :])
+            if max_sim is None:
+                sum_exp, acc = tile_sum, tile_acc
+            else:
+                correction = ivy.exp(max_sim - new_max)
+                sum_exp = sum_exp * correction + tile_sum
+                acc = acc * correction + tile_acc
+            max_sim = new_max
+        results.append(acc / sum_exp)
+    result = results[0] if len(results) == 1 else ivy.concat(results, axis=-2)
     return ivy.inplace_update(out, result) if ivy.exists(out) else result
 
 
+scaled_dot_product_attention.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "handle_out_argument",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays", "handle_partial_mixed_function"),
+}
+
+
 @handle_exceptions
 @handle_nestable
 @handle_out_argument
@@ -749,6 +808,9 @@ def multi_head_attention(
     average_attention_weights: bool = True,
     dropout: float = 0.0,
     training: bool = False,
+    kv_cache=None,
+    kv_cache_layer: int = 0,
+    kv_cache_slots: Optional[Sequence[int]] = None,
     out: Optional[ivy.Array] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
@@ -830,6 +892,18 @@ def multi_head_attention(
         Specifies the dropout probability. Dropout is applied on the attention weights.
     training
         If True, dropout is used, otherwise dropout is not activated.
+    kv_cache
+        An :class:`ivy.KVCache` holding the keys and values of the previous tokens of
+        the sequences, for incremental decoding. The keys and values of the new tokens,
+        `key` and `value`, are projected and appended to it, and the queries attend to
+        all the cached tokens of their sequence, a causal mask using the positions of
+        the queries in it. `key_padding_mask` then masks the padding of the new tokens,
+        which has to follow them, and isn't cached.
+    kv_cache_layer
+        The layer of `kv_cache` holding the keys and values of this attention.
+    kv_cache_slots
+        The slots of `kv_cache` holding the sequences of the batch. Default is
+        ``None``, which uses the first `N` slots.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -899,16 +973,56 @@ def multi_head_attention(
 
     num_keys = k.shape[1]
 
-    # reshape q, k, v for efficient matrix multiplication
-    q = ivy.swapaxes(q.reshape((num_queries, num_batches * num_heads, head_dim)), 0, 1)
-    if static_k is None:
-        k = ivy.swapaxes(k.reshape((num_keys, num_batches * num_heads, head_dim)), 0, 1)
-    else:
-        k = static_k
-    if static_v is None:
-        v = ivy.swapaxes(v.reshape((num_keys, num_batches * num_heads, head_dim)), 0, 1)
+    # reshape q, k, v to (N*num_heads, L, E//num_heads) for efficient matrix
+    # multiplication
+    def _split_heads(x):
+        x = ivy.permute_dims(
+            x.reshape((num_batches, x.shape[1], num_heads, head_dim)), (0, 2, 1, 3)
+        )
+        return x if ivy.exists(kv_cache) else x.reshape((-1,) + x.shape[2:])
+
+    q = _split_heads(q)
+    if ivy.exists(kv_cache):
+        ivy.assertions.check_true(
+            not any(ivy.exists(x) for x in [static_k, static_v, bias_k, bias_v])
+            and not add_zero_attn
+            and attention_mask is None,
+            "a kv_cache can't be used with static or biased keys and values, or with"
+            " an attention_mask",
+        )
+        num_tokens = None
+        if key_padding_mask is not None:
+            num_tokens = ivy.to_numpy(
+                ivy.sum(ivy.astype(~key_padding_mask, "int64"), axis=-1)
+            )
+            key_padding_mask = None
+        k, v, offsets, lengths = kv_cache.append(
+            kv_cache_layer,
+            _split_heads(k),
+            _split_heads(v),
+            slots=kv_cache_slots,
+            num_tokens=num_tokens,
+        )
+        num_keys = k.shape[2]
+        q, k, v = [x.reshape((-1,) + x.shape[2:]) for x in [q, k, v]]
+        # mask the keys past the end of the sequences, and with is_causal, past the
+        # positions of the queries, built on the host like the lengths
+        ends = lengths[:, None, None]
+        if is_causal:
+            ends = np.minimum(
+                ends, offsets[:, None, None] + np.arange(1, num_queries + 1)[:, None]
+            )
+        mask = np.where(np.arange(num_keys) >= ends, -np.inf, 0.0)
+        attention_mask = ivy.asarray(
+            np.broadcast_to(
+                mask[:, None], (num_batches, num_heads, num_queries, num_keys)
+            ).reshape((-1, num_queries, num_keys)),
+            dtype=q.dtype,
+            device=ivy.dev(q),
+        )
     else:
-        v = static_v
+        k = _split_heads(k) if static_k is None else static_k
+        v = _split_heads(v) if static_v is None else static_v
 
     # add extra batch of zeros to k, v
     if add_zero_attn:
@@ -923,16 +1037,17 @@ def multi_head_attention(
     attn_scores *= scale
 
     # mask the attention scores
-    if ivy.exists(attention_mask):
-        assert attention_mask.dtype in [query.dtype, ivy.bool], (
-            "was expecting attention_mask of type bool or the same as the input's, but"
-            f" got {attention_mask.dtype}"
-        )
+    if not ivy.exists(kv_cache) and (is_causal or ivy.exists(attention_mask)):
         if is_causal:
             mask = ivy.triu(ivy.ones((num_queries, num_keys)), k=1)
             attention_mask = ivy.where(mask, float("-inf"), 0)
-        elif ivy.is_bool_dtype(attention_mask):
-            attention_mask = ivy.where(attention_mask, float("-inf"), 0)
+        else:
+            assert attention_mask.dtype in [query.dtype, ivy.bool], (
+                "was expecting attention_mask of type bool or the same as the input's,"
+                f" but got {attention_mask.dtype}"
+            )
+            if ivy.is_bool_dtype(attention_mask):
+                attention_mask = ivy.where(attention_mask, float("-inf"), 0)
         if attention_mask.ndim == 2:
             attention_mask = ivy.tile(attention_mask, (num_batches * num_heads, 1, 1))
     if key_padding_mask is not None:
@@ -963,9 +1078,10 @@ def multi_head_attention(
 
     # get attention output
     attention_out = ivy.matmul(attn_weights, v)
-    attention_out = ivy.swapaxes(attention_out, 0, 1).reshape(
-        (num_batches, num_queries, emb_dim)
-    )
+    attention_out = ivy.permute_dims(
+        attention_out.reshape((num_batches, num_heads, num_queries, head_dim)),
+        (0, 2, 1, 3),
+    ).reshape((num_batches, num_queries, emb_dim))
     if ivy.exists(out_proj_weights):
         attention_out = ivy.linear(attention_out, out_proj_weights, bias=out_proj_bias)
 
@@ -2202,6 +2318,177 @@ def conv(
 # LSTM #
 
 
+def _lstm_layer(
+    x, init_h, init_c, kernel, recurrent_kernel, bias, recurrent_bias, reverse, mask
+):
+    # one direction of one lstm layer over x *[batch_shape,t,in]*, mask being whether
+    # each timestep of each sequence is within its length *[t,batch_shape,1]*, as
+    # booleans and as floats
+    x_proj = ivy.matmul(x, kernel)
+    if bias is not None:
+        x_proj = x_proj + bias
+    if recurrent_bias is not None:
+        x_proj = x_proj + recurrent_bias
+    x_proj = ivy.unstack(x_proj, axis=-2)
+    if mask is not None:
+        mask, mask_float = [ivy.unstack(m, axis=0) for m in mask]
+    out_channels = recurrent_kernel.shape[0]
+    ht, ct = init_h, init_c
+    hts = [None] * len(x_proj)
+    for t in reversed(range(len(x_proj))) if reverse else range(len(x_proj)):
+        gates = x_proj[t] + ivy.matmul(ht, recurrent_kernel)
+        # the input, forget and output gates are activated together
+        it, ft, _, ot = ivy.split(ivy.sigmoid(gates), num_or_size_splits=4, axis=-1)
+        gt = ivy.tanh(gates[..., 2 * out_channels : 3 * out_channels])
+        ct_new = ft * ct + it * gt
+        ht_new = ot * ivy.tanh(ct_new)
+        if mask is None:
+            ht, ct = ht_new, ct_new
+            hts[t] = ht
+        else:
+            # the states are kept past the end of a sequence, and before its start
+            # when reversed, where the outputs are zeros
+            ht = ivy.where(mask[t], ht_new, ht)
+            ct = ivy.where(mask[t], ct_new, ct)
+            hts[t] = ht_new * mask_float[t]
+    return ivy.stack(hts, axis=-2), ht, ct
+
+
+@handle_exceptions
+@handle_nestable
+@handle_partial_mixed_function
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+def lstm(
+    x: Union[ivy.Array, ivy.NativeArray],
+    init_h: Union[ivy.Array, ivy.NativeArray],
+    init_c: Union[ivy.Array, ivy.NativeArray],
+    kernels: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    recurrent_kernels: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    /,
+    *,
+    biases: Optional[Sequence[Union[ivy.Array, ivy.NativeArray]]] = None,
+    recurrent_biases: Optional[Sequence[Union[ivy.Array, ivy.NativeArray]]] = None,
+    lengths: Optional[Union[ivy.Array, ivy.NativeArray, Sequence[int]]] = None,
+    bidirectional: bool = False,
+    dropout: float = 0.0,
+    training: bool = False,
+) -> Tuple[ivy.Array, ivy.Array, ivy.Array]:
+    """
+    Apply a multi-layer, optionally bidirectional, long-short term memory to a
+    sequence, running the native kernel of the backend where it has one.
+
+    Parameters
+    ----------
+    x
+        input sequence *[batch_shape,t,in]*.
+    init_h
+        initial hidden states of each layer and direction
+        *[num_layers*num_directions,batch_shape,out]*.
+    init_c
+        initial cell states of each layer and direction
+        *[num_layers*num_directions,batch_shape,out]*.
+    kernels
+        weights for the cell kernel of each layer and direction, the forward direction
+        of a layer coming before its backward direction. Each is *[in,4 x out]* for
+        the first layer, and *[num_directions x out,4 x out]* for the others.
+    recurrent_kernels
+        weights for the cell recurrent kernel of each layer and direction, each
+        *[out,4 x out]*.
+    biases
+        biases for the cell kernels *[4 x out]*. Default is ``None``.
+    recurrent_biases
+        biases for the cell recurrent kernels *[4 x out]*. Default is ``None``.
+    lengths
+        the number of valid timesteps of each sequence *[batch_shape]*, for a batch of
+        sequences of different lengths padded to ``t``. The outputs past the end of a
+        sequence are zeros, and its final states those of its last valid timestep.
+        Default is ``None``, where all the sequences are ``t`` timesteps long.
+    bidirectional
+        whether each layer also runs over the sequence in reverse, its outputs being
+        concatenated to those of the forward direction. Default is ``False``.
+    dropout
+        the dropout probability applied to the outputs of each layer but the last.
+        Default is ``0.0``.
+    training
+        whether dropout is applied. Default is ``False``.
+
+    Returns
+    -------
+    ret
+        the outputs of the last layer for all timesteps
+        *[batch_shape,t,num_directions x out]*, and the final hidden and cell states
+        of each layer and direction *[num_layers*num_directions,batch_shape,out]*.
+
+    Examples
+    --------
+    >>> x = ivy.random_normal(shape=(2, 5, 3))
+    >>> h0 = c0 = ivy.zeros((2, 2, 4))
+    >>> kernels = [ivy.random_normal(shape=s) for s in [(3, 16), (4, 16)]]
+    >>> recurrent_kernels = [ivy.random_normal(shape=(4, 16)) for _ in range(2)]
+    >>> out, h_n, c_n = ivy.lstm(x, h0, c0, kernels, recurrent_kernels,
+    ...                          lengths=[5, 3])
+    >>> print(out.shape)
+    ivy.Shape(2, 5, 4)
+    >>> print(h_n.shape)
+    ivy.Shape(2, 2, 4)
+    """
+    num_directions = 2 if bidirectional else 1
+    ivy.utils.assertions.check_equal(
+        len(kernels) % num_directions,
+        0,
+        message="there must be a kernel for each direction of each layer",
+        as_array=False,
+    )
+    num_layers = len(kernels) // num_directions
+    mask = None
+    if lengths is not None:
+        lengths = ivy.asarray(lengths, device=ivy.dev(x))
+        # whether each timestep is within the length of each sequence
+        mask = ivy.expand_dims(
+            ivy.arange(x.shape[-2], device=ivy.dev(x))
+            < ivy.expand_dims(lengths, axis=-1),
+            axis=-1,
+        )
+        mask = ivy.moveaxis(mask, -2, 0)
+        mask = (mask, ivy.astype(mask, x.dtype))
+    h_n, c_n = [], []
+    for layer in range(num_layers):
+        outputs = []
+        for direction in range(num_directions):
+            i = layer * num_directions + direction
+            ht, h, c = _lstm_layer(
+                x,
+                init_h[i],
+                init_c[i],
+                kernels[i],
+                recurrent_kernels[i],
+                biases[i] if biases is not None else None,
+                recurrent_biases[i] if recurrent_biases is not None else None,
+                direction == 1,
+                mask,
+            )
+            outputs.append(ht)
+            h_n.append(h)
+            c_n.append(c)
+        x = outputs[0] if num_directions == 1 else ivy.concat(outputs, axis=-1)
+        if dropout and layer < num_layers - 1:
+            x = ivy.dropout(x, dropout, training=training)
+    return x, ivy.stack(h_n), ivy.stack(c_n)
+
+
+lstm.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays", "handle_partial_mixed_function"),
+}
+
+
 @handle_exceptions
 @handle_nestable
 @handle_array_like_without_promotion
@@ -2244,58 +2531,16 @@ def lstm_update(
         hidden state for all timesteps *[batch_shape,t,out]* and cell state for last
         timestep *[batch_shape,out]*
     """
-    # get shapes
-    x_shape = list(x.shape)
-    batch_shape = x_shape[:-2]
-    timesteps = x_shape[-2]
-    input_channels = x_shape[-1]
-    x_flat = ivy.reshape(x, (-1, input_channels))
-
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
+    ret, _, c_n = ivy.lstm(
+        x,
+        ivy.expand_dims(init_h, axis=0),
+        ivy.expand_dims(init_c, axis=0),
+        [kernel],
+        [recurrent_kernel],
+        biases=None if bias is None else [bias],
+        recurrent_biases=None if recurrent_bias is None else [recurrent_bias],
     )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
-
-    # lstm states
-    ht = init_h
-    ct = init_c
-
-    # lstm outputs
-    hts_list = []
-
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
-        ht = ot * ivy.tanh(ct)
-
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
-
-    return ivy.concat(hts_list, axis=-2), ct
+    return ret, c_n[0]
 
 
 # Helpers #
@@ -2644,6 +2889,111 @@ def roi_align(
     return output
 
 
+def _box_areas(boxes):
+    return (boxes[..., 2] - boxes[..., 0]) * (boxes[..., 3] - boxes[..., 1])
+
+
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+def box_iou(
+    boxes1: Union[ivy.Array, ivy.NativeArray],
+    boxes2: Union[ivy.Array, ivy.NativeArray],
+) -> ivy.Array:
+    """
+    Compute the intersection over union of every pair of boxes from two sets.
+
+    Parameters
+    ----------
+    boxes1
+        The first set of boxes *[N,4]*, in (x1, y1, x2, y2) format.
+    boxes2
+        The second set of boxes *[M,4]*, in (x1, y1, x2, y2) format.
+
+    Returns
+    -------
+    ret
+        The intersection over union of each box of ``boxes1`` with each box of
+        ``boxes2`` *[N,M]*.
+
+    Examples
+    --------
+    >>> boxes1 = ivy.array([[0., 0., 2., 2.], [1., 1., 3., 3.]])
+    >>> boxes2 = ivy.array([[0., 0., 2., 2.]])
+    >>> print(ivy.box_iou(boxes1, boxes2))
+    ivy.array([[1.        ],
+           [0.14285715]])
+    """
+    # the sides of the intersections, a coordinate at a time, as these broadcast to
+    # contiguous *[N,M]* arrays
+    sides = [
+        ivy.maximum(
+            0.0,
+            ivy.minimum(boxes1[:, i + 2, None], boxes2[:, i + 2], use_where=False)
+            - ivy.maximum(boxes1[:, i, None], boxes2[:, i], use_where=False),
+            use_where=False,
+        )
+        for i in range(2)
+    ]
+    inter = sides[0] * sides[1]
+    return inter / (_box_areas(boxes1)[:, None] + _box_areas(boxes2) - inter)
+
+
+box_iou.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
+
+
+def _nms_keep(boxes, iou_threshold, max_output_size):
+    # greedily keeps the boxes *[N,4]*, sorted by decreasing score, which overlap no
+    # kept box by more than iou_threshold, returning their positions
+    num_boxes = boxes.shape[0]
+    if max_output_size is None or max_output_size < 0:
+        max_output_size = num_boxes
+    # bit i is set once the i-th box overlaps a kept box
+    suppressed = np.zeros(-(-num_boxes // 8), dtype=np.uint8)
+    keep = []
+    for start in range(0, num_boxes, _NMS_BLOCK_SIZE):
+        if len(keep) >= max_output_size:
+            break
+        end = min(start + _NMS_BLOCK_SIZE, num_boxes)
+        # the boxes of the block not suppressed by the kept boxes of previous blocks
+        candidates = np.flatnonzero(
+            np.unpackbits(suppressed[start // 8 :], bitorder="little")[: end - start]
+            == 0
+        )
+        if candidates.size == 0:
+            continue
+        # the overlaps of the candidates with the boxes from start on, as rows of bits
+        # aligning with those of suppressed from start on. A nan iou, as with empty
+        # boxes, counts as an overlap
+        overlaps = ivy.logical_not(
+            ivy.box_iou(
+                ivy.gather(boxes, ivy.array(candidates + start), axis=0),
+                boxes[start:],
+            )
+            <= iou_threshold
+        )
+        overlaps = np.packbits(ivy.to_numpy(overlaps), axis=1, bitorder="little")
+        suppressed_from_start = suppressed[start // 8 :]
+        for row, i in enumerate(candidates + start):
+            if suppressed[i >> 3] >> (i & 7) & 1:
+                continue
+            keep.append(i)
+            if len(keep) >= max_output_size:
+                break
+            suppressed_from_start |= overlaps[row]
+    return keep
+
+
 # TODO add paddle backend implementation back,
 #  once paddle.argsort uses a stable algorithm
 #  https://github.com/PaddlePaddle/Paddle/issues/57508
@@ -2659,64 +3009,142 @@ def nms(
     max_output_size=None,
     score_threshold=float("-inf"),
 ):
+    """
+    Perform non-maximum suppression on boxes.
+
+    Starting from the highest scoring box, keeps each box that overlaps no box kept
+    before it by an intersection over union of more than ``iou_threshold``.
+
+    Parameters
+    ----------
+    boxes
+        The boxes *[N,4]*, in (x1, y1, x2, y2) format.
+    scores
+        The scores of the boxes *[N]*. Default is ``None``, for the boxes to all
+        score the same.
+    iou_threshold
+        The intersection over union above which a box is suppressed by a higher
+        scoring one. Default is ``0.5``.
+    max_output_size
+        The maximum number of boxes to keep. Default is ``None``, for no maximum.
+    score_threshold
+        The score which a box must exceed to be kept. Default is ``-inf``.
+
+    Returns
+    -------
+    ret
+        The indices of the kept boxes, by decreasing score and then increasing index.
+
+    Examples
+    --------
+    >>> boxes = ivy.array([[0., 0., 2., 2.], [0., 0., 2., 1.9], [2., 2., 4., 4.]])
+    >>> scores = ivy.array([0.5, 0.9, 0.7])
+    >>> print(ivy.nms(boxes, scores))
+    ivy.array([1, 2])
+    """
     change_id = False
-    if score_threshold is not float("-inf") and scores is not None:
+    if scores is not None:
         keep_idx = scores > score_threshold
         boxes = boxes[keep_idx]
         scores = scores[keep_idx]
         change_id = True
-        nonzero = ivy.nonzero(keep_idx)[0].flatten()
-    if scores is None:
-        scores = ivy.ones((boxes.shape[0],), dtype=boxes.dtype)
+        nonzero = ivy.to_numpy(ivy.nonzero(keep_idx)[0]).flatten()
 
-    if len(boxes) < 2:
-        if len(boxes) == 1:
-            ret = ivy.array([0], dtype=ivy.int64)
-        else:
-            ret = ivy.array([], dtype=ivy.int64)
+    if scores is None:
+        order = np.arange(boxes.shape[0])
     else:
-        x1 = boxes[:, 0]
-        y1 = boxes[:, 1]
-        x2 = boxes[:, 2]
-        y2 = boxes[:, 3]
-
-        areas = (x2 - x1) * (y2 - y1)
-        order = ivy.argsort(
-            (-1 * scores), stable=True
-        )  # get boxes with more ious first
-        keep = []
-
-        while order.size > 0:
-            i = order[0]  # pick maxmum iou box
-            keep.append(i)
-            xx1 = ivy.maximum(x1[i], x1[order[1:]])
-            yy1 = ivy.maximum(y1[i], y1[order[1:]])
-            xx2 = ivy.minimum(x2[i], x2[order[1:]])
-            yy2 = ivy.minimum(y2[i], y2[order[1:]])
+        # a stable sort, for the boxes of equal scores to be kept in order of index
+        order = ivy.to_numpy(ivy.argsort(-1 * scores, stable=True)).flatten()
+    keep = []
+    if boxes.shape[0] > 0:
+        keep = _nms_keep(
+            ivy.gather(boxes, ivy.array(order), axis=0),
+            iou_threshold,
+            max_output_size,
+        )
+    ret = order[keep]
 
-            w = ivy.maximum(0.0, xx2 - xx1)  # maximum width
-            h = ivy.maximum(0.0, yy2 - yy1)  # maximum height
-            inter = w * h
-            ovr = inter / (areas[i] + areas[order[1:]] - inter)
-            inds = ivy.nonzero(ovr <= iou_threshold)[0]
+    if change_id:
+        ret = nonzero[ret]
 
-            order = order[inds + 1]
+    return ivy.array(ret, dtype=ivy.int64)[:max_output_size]
 
-        ret = ivy.array(keep)
 
-    if len(ret) > 1 and scores is not None:
-        ret = sorted(
-            ret.flatten().tolist(), reverse=True, key=lambda x: (scores[x], -x)
-        )
-        ret = ivy.array(ret, dtype=ivy.int64).flatten()
+nms.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
+
+
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+def batched_nms(
+    boxes,
+    scores,
+    group_ids,
+    iou_threshold=0.5,
+    max_output_size=None,
+    score_threshold=float("-inf"),
+):
+    """
+    Perform non-maximum suppression on groups of boxes independently.
 
-    if change_id and len(ret) > 0:
-        ret = ivy.array(nonzero[ret], dtype=ivy.int64).flatten()
+    A box is only suppressed by the boxes of its own group, such as those of the same
+    class. All the groups are processed at once, and a batch of images can be too, by
+    giving each pair of an image and a class its own group id.
 
-    return ret.flatten()[:max_output_size]
+    Parameters
+    ----------
+    boxes
+        The boxes *[N,4]*, in (x1, y1, x2, y2) format.
+    scores
+        The scores of the boxes *[N]*.
+    group_ids
+        The integer ids of the groups of the boxes *[N]*.
+    iou_threshold
+        The intersection over union above which a box is suppressed by a higher
+        scoring one of its group. Default is ``0.5``.
+    max_output_size
+        The maximum number of boxes to keep over all the groups. Default is
+        ``None``, for no maximum.
+    score_threshold
+        The score which a box must exceed to be kept. Default is ``-inf``.
 
+    Returns
+    -------
+    ret
+        The indices of the kept boxes, by decreasing score and then increasing index.
 
-nms.mixed_backend_wrappers = {
+    Examples
+    --------
+    >>> boxes = ivy.array([[0., 0., 2., 2.], [0., 0., 2., 1.9], [2., 2., 4., 4.]])
+    >>> scores = ivy.array([0.5, 0.9, 0.7])
+    >>> print(ivy.batched_nms(boxes, scores, ivy.array([0, 1, 1])))
+    ivy.array([1, 2, 0])
+    """
+    if boxes.shape[0] == 0:
+        return ivy.array([], dtype=ivy.int64)
+    # moves the boxes of each group to a region of their own, clear of the regions of
+    # the other groups, for boxes of different groups never to overlap
+    offsets = ivy.astype(group_ids, boxes.dtype) * (ivy.max(boxes) - ivy.min(boxes) + 1)
+    return ivy.nms(
+        boxes + offsets[:, None],
+        scores,
+        iou_threshold=iou_threshold,
+        max_output_size=max_output_size,
+        score_threshold=score_threshold,
+    )
+
+
+batched_nms.mixed_backend_wrappers = {
     "to_add": (
         "handle_backend_invalid",
         "inputs_to_native_arrays",
@@ -1,6 +1,7 @@
 """Collection of Ivy functions for nested objects."""
 
 # global
+import functools
 from builtins import map as _map
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 from collections import UserDict, OrderedDict
@@ -10,6 +11,135 @@ import ivy
 from ivy.utils.exceptions import handle_exceptions
 
 
+# Helpers #
+# --------#
+
+
+def _flatten_nest(nest, to_ignore=(), include_nests=False, dict_types=(dict, UserDict)):
+    """
+    Flatten a nest in a single pass into a list of its values and its treedef.
+
+    Tuples, lists and ``dict_types``, including derived classes, are traversed
+    unless they are instances of ``to_ignore``. The treedef is a hashable description
+    of the structure of the nest, which is ``None`` for a leaf, and a tuple of the
+    type, the dict keys (``None`` for sequences) and the treedefs of the children for
+    a nest. With ``include_nests``, each nest is also added to the values after its
+    children, in post-order.
+    """
+    values = []
+    return values, _flatten_into(nest, values, to_ignore, include_nests, dict_types)
+
+
+def _flatten_into(x, values, to_ignore, include_nests, dict_types):
+    # recursive helpers are module level functions rather than closures, as a closure
+    # referring to itself forms a reference cycle keeping the nest leaves alive
+    if isinstance(x, (tuple, list)) and not isinstance(x, to_ignore):
+        treedef = (
+            type(x),
+            None,
+            tuple(
+                [
+                    _flatten_into(v, values, to_ignore, include_nests, dict_types)
+                    for v in x
+                ]
+            ),
+        )
+    elif isinstance(x, dict_types) and not isinstance(x, to_ignore):
+        treedef = (
+            type(x),
+            tuple(x.keys()),
+            tuple(
+                [
+                    _flatten_into(v, values, to_ignore, include_nests, dict_types)
+                    for v in x.values()
+                ]
+            ),
+        )
+    else:
+        values.append(x)
+        return None
+    if include_nests:
+        values.append(x)
+    return treedef
+
+
+@functools.lru_cache(maxsize=64)
+def _nest_index_chains(treedef, include_nests=False):
+    """
+    Return the index chain of each value flattened by _flatten_nest for treedef,
+    along with the position of the first value within the subtree of each value.
+
+    This only depends on the structure of the nest, so it is cached per treedef.
+    """
+    chains = []
+    starts = []
+    _walk_treedef(treedef, (), chains, starts, include_nests)
+    return tuple(chains), tuple(starts)
+
+
+def _walk_treedef(treedef, chain, chains, starts, include_nests):
+    start = len(chains)
+    if treedef is not None:
+        _, keys, children = treedef
+        keys = range(len(children)) if keys is None else keys
+        for key, child in zip(keys, children):
+            _walk_treedef(child, chain + (key,), chains, starts, include_nests)
+        if not include_nests:
+            return
+    chains.append(chain)
+    starts.append(start)
+
+
+def _nested_map(x, fn, to_ignore, check_fns, to_mutable, shallow):
+    # single pass of nested_map, with its arguments resolved once by the caller
+    # rather than at every level of the nest
+    tuple_check_fn, list_check_fn, dict_check_fn = check_fns
+    class_instance = type(x)
+    # TODO: Fixes iterating over tracked instances from the graph
+    # during transpilation. However, there might be a better fix
+    # than this. Remove the check below if that's the case
+    if (
+        hasattr(x, "is_tracked_proxy")
+        and hasattr(class_instance, "__bases__")
+        and not set(class_instance.__bases__).intersection(set(to_ignore))
+    ):
+        to_ignore += (class_instance,)
+    if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
+        ret_list = [
+            _nested_map(i, fn, to_ignore, check_fns, to_mutable, shallow) for i in x
+        ]
+        if to_mutable:
+            return ret_list
+        elif hasattr(x, "_fields"):
+            # noinspection PyProtectedMember
+            return class_instance(**dict(zip(x._fields, ret_list)))
+        else:
+            return class_instance(ret_list)
+    elif list_check_fn(x, list) and not isinstance(x, to_ignore):
+        ret_list = [
+            _nested_map(i, fn, to_ignore, check_fns, to_mutable, shallow) for i in x
+        ]
+        if shallow:
+            x[:] = ret_list[:]
+            return x
+        return class_instance(ret_list)
+    elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
+        x, to_ignore
+    ):
+        ret = {
+            k: _nested_map(v, fn, to_ignore, check_fns, to_mutable, shallow)
+            for k, v in x.items()
+        }
+        if shallow:
+            x.update(ret)
+            return x
+        return class_instance(ret)
+    elif isinstance(x, slice):
+        # TODO: add tests for this
+        return slice(*nested_map(fn, [x.start, x.stop, x.step]))
+    return fn(x)
+
+
 # Extra #
 # ------#
 
@@ -431,7 +561,13 @@ def multi_index_nest(
     >>> print(z)
     ['h', 'b']
     """
-    return [index_nest(nest, index) for index in indices]
+    ret = []
+    for index in indices:
+        value = nest
+        for i in index:
+            value = value[i]
+        ret.append(value)
+    return ret
 
 
 @handle_exceptions
@@ -723,80 +859,27 @@ def nested_argwhere(
     """
     to_ignore = ivy.default(to_ignore, ())
     _index = [] if _index is None else _index
-    if isinstance(nest, (tuple, list)) and not isinstance(nest, to_ignore):
-        n = 0
-        _indices = []
-        for i, item in enumerate(nest):
-            ind = (
-                nested_argwhere(
-                    item,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [i],
-                    False,
-                    stop_after_n_found - n,
-                )
-                if stop_after_n_found is not None
-                else nested_argwhere(
-                    item,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [i],
-                    False,
-                    None,
-                )
-            )
-            if stop_after_n_found is not None and ind:
-                if n >= stop_after_n_found:
-                    break
-                n += len(ind)
-            _indices += [ind]
-            if stop_after_n_found is not None and n >= stop_after_n_found:
-                break
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if check_nests and fn(nest):
-            _indices.append(_index)
-    elif (isinstance(nest, (dict, UserDict))) and not isinstance(nest, to_ignore):
-        n = 0
-        _indices = []
-        for k, v in nest.items():
-            ind = (
-                nested_argwhere(
-                    v,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [k],
-                    False,
-                    stop_after_n_found - n,
-                )
-                if stop_after_n_found is not None
-                else nested_argwhere(
-                    v,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [k],
-                    False,
-                    None,
-                )
-            )
-            if stop_after_n_found is not None and ind:
-                if n >= stop_after_n_found:
-                    break
-                n += len(ind)
-            _indices += [ind]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if check_nests and fn(nest):
-            _indices.append(_index)
-    else:
-        cond_met = fn(nest)
-        if cond_met:
-            return [_index]
-        return False
-    return [index for index in _indices if index]
+    values, treedef = _flatten_nest(nest, to_ignore, include_nests=check_nests)
+    if treedef is None:
+        return [_index] if fn(nest) else False
+    chains, starts = _nest_index_chains(treedef, check_nests)
+    if check_nests and not _index:
+        # the nest itself is never returned, as its index is empty
+        values.pop()
+    indices = []
+    # once enough indices are found, only the nests containing the last checked
+    # value, whose own check comes after it in post-order, are still checked
+    stopped_at = (
+        -1 if stop_after_n_found is not None and stop_after_n_found <= 0 else None
+    )
+    for value, chain, start in zip(values, chains, starts):
+        if stopped_at is not None and start > stopped_at:
+            continue
+        if fn(value):
+            indices.append(_index + list(chain))
+            if stop_after_n_found is not None and len(indices) >= stop_after_n_found:
+                stopped_at = start if stopped_at is None else stopped_at
+    return indices
 
 
 @handle_exceptions
@@ -867,30 +950,12 @@ def all_nested_indices(
     [['a'], ['b']]
     """
     _index = [] if _index is None else _index
-    if isinstance(nest, (tuple, list)):
-        _indices = [
-            all_nested_indices(
-                item,
-                include_nests,
-                _index + [i],
-                False,
-            )
-            for i, item in enumerate(nest)
-        ]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if include_nests:
-            _indices.append(_index)
-    elif isinstance(nest, dict):
-        _indices = [
-            all_nested_indices(v, include_nests, _index + [k], False)
-            for k, v in nest.items()
-        ]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if include_nests:
-            _indices.append(_index)
-    else:
+    _, treedef = _flatten_nest(nest, include_nests=include_nests, dict_types=dict)
+    if treedef is None:
         return [_index]
-    return [index for index in _indices if index]
+    chains, _ = _nest_index_chains(treedef, include_nests)
+    # the nest itself is never returned if its index is empty
+    return [_index + list(chain) for chain in chains if _index or chain]
 
 
 # noinspection PyShadowingBuiltins
@@ -1119,16 +1184,6 @@ def nested_map(
     for t in ("tuple", "list", "dict"):
         if t not in include_derived:
             include_derived[t] = False
-    class_instance = type(x)
-    # TODO: Fixes iterating over tracked instances from the graph
-    # during transpilation. However, there might be a better fix
-    # than this. Remove the check below if that's the case
-    if (
-        hasattr(x, "is_tracked_proxy")
-        and hasattr(class_instance, "__bases__")
-        and not set(class_instance.__bases__).intersection(set(to_ignore))
-    ):
-        to_ignore += (class_instance,)
     tuple_check_fn = ivy.default(
         _tuple_check_fn,
         (
@@ -1153,73 +1208,15 @@ def nested_map(
             else (lambda x_, t_: type(x_) is t_)
         ),
     )
-    if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                fn,
-                i,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for i in x
-        ]
-        if to_mutable:
-            return ret_list
-        elif hasattr(x, "_fields"):
-            # noinspection PyProtectedMember
-            return class_instance(**dict(zip(x._fields, ret_list)))
-        else:
-            return class_instance(ret_list)
-    elif list_check_fn(x, list) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                fn,
-                i,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for i in x
-        ]
-        if shallow:
-            x[:] = ret_list[:]
-            return x
-        return class_instance(ret_list)
-    elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
-        x, to_ignore
-    ):
-        class_instance = type(x)
-        ret = {
-            k: nested_map(
-                fn,
-                v,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for k, v in x.items()
-        }
-        if shallow:
-            x.update(ret)
-            return x
-        return class_instance(ret)
-    elif isinstance(x, slice):
-        # TODO: add tests for this
-        return slice(*nested_map(fn, [x.start, x.stop, x.step]))
-    return fn(x)
+
+    return _nested_map(
+        x,
+        fn,
+        to_ignore,
+        (tuple_check_fn, list_check_fn, dict_check_fn),
+        to_mutable,
+        shallow,
+    )
 
 
 @handle_exceptions
@@ -4,6 +4,8 @@ from . import converters
 from .converters import *
 from . import initializers
 from .initializers import *
+from . import kv_cache
+from .kv_cache import *
 from . import layers
 from .layers import *
 from . import losses
@@ -0,0 +1,214 @@
+"""Key/value cache of the attention layers, for incremental decoding."""
+
+import numpy as np
+
+import ivy
+
+__all__ = ["KVCache"]
+
+
+class KVCache:
+    """
+    Preallocated keys and values of the attention layers of a model.
+
+    Each layer has a buffer of keys and of values of shape
+    *[batch_size,num_heads,max_length,head_dim]*, whose rows are slots holding one
+    sequence each, so that concurrent sequences of different lengths are decoded as
+    one batch. Passed to ``ivy.multi_head_attention``, the keys and values of the new
+    tokens are written in place after those of the previous tokens of their
+    sequence, so that only the new tokens are projected, and attend to the whole
+    sequence, at their positions in it.
+
+    Example
+    -------
+        cache = KVCache(num_layers, 4, 512, num_heads, head_dim)
+        slot = cache.add_sequence()
+        out = ivy.multi_head_attention(
+            prompt, ..., is_causal=True, kv_cache=cache, kv_cache_slots=[slot]
+        )
+        ...
+        cache.evict(slot)
+    """
+
+    # the buffers are updated in place, so the cache can't be part of the signature of
+    # a compiled forward pass
+    __hash__ = None
+
+    def __init__(
+        self,
+        num_layers,
+        batch_size,
+        max_length,
+        num_heads,
+        head_dim,
+        /,
+        *,
+        dtype=None,
+        device=None,
+    ):
+        """
+        Allocate the keys and values of the layers.
+
+        Parameters
+        ----------
+        num_layers
+            The number of attention layers to cache the keys and values of.
+        batch_size
+            The number of sequences to hold at once.
+        max_length
+            The maximum number of tokens of a sequence.
+        num_heads
+            The number of attention heads of the layers.
+        head_dim
+            The size of each attention head.
+        dtype
+            The data type of the keys and values. Default is ``None``, which uses the
+            default float data type.
+        device
+            The device to allocate the keys and values on. Default is ``None``, which
+            uses the default device.
+        """
+        for name, value in [
+            ("num_layers", num_layers),
+            ("batch_size", batch_size),
+            ("max_length", max_length),
+            ("num_heads", num_heads),
+            ("head_dim", head_dim),
+        ]:
+            ivy.utils.assertions.check_greater(
+                value, 0, message=f"{name} must be positive", as_array=False
+            )
+        self.max_length = max_length
+        shape = (batch_size, num_heads, max_length, head_dim)
+        self._keys = [
+            ivy.zeros(shape, dtype=dtype, device=device) for _ in range(num_layers)
+        ]
+        self._values = [
+            ivy.zeros(shape, dtype=dtype, device=device) for _ in range(num_layers)
+        ]
+        # the number of cached tokens of each slot, in each layer, kept on the host as
+        # they decide which parts of the buffers to write and read
+        self._lengths = np.zeros((num_layers, batch_size), dtype=np.int64)
+        self._active = np.zeros(batch_size, dtype=bool)
+
+    @property
+    def num_layers(self):
+        return len(self._keys)
+
+    @property
+    def batch_size(self):
+        return len(self._active)
+
+    def lengths(self, layer=0, /):
+        """Get the number of tokens cached for each slot by a layer."""
+        return self._lengths[layer].tolist()
+
+    def active_slots(self):
+        """Get the slots holding a sequence."""
+        return np.flatnonzero(self._active).tolist()
+
+    def add_sequence(self):
+        """
+        Reserve a free slot for a new sequence.
+
+        Returns
+        -------
+        ret
+            The slot, whose rows of the buffers hold the keys and values of the
+            sequence until it is evicted.
+        """
+        free = np.flatnonzero(~self._active)
+        if not len(free):
+            raise ivy.utils.exceptions.IvyException(
+                f"all the {self.batch_size} slots of the cache hold a sequence, evict"
+                " one to add another"
+            )
+        slot = int(free[0])
+        self._active[slot] = True
+        self._lengths[:, slot] = 0
+        return slot
+
+    def evict(self, slot, /):
+        """Free the slot of a finished sequence, for a new one to reuse."""
+        self._active[slot] = False
+        self._lengths[:, slot] = 0
+
+    def reset(self):
+        """Evict all the sequences."""
+        self._active[:] = False
+        self._lengths[:] = 0
+
+    def append(self, layer, keys, values, /, *, slots=None, num_tokens=None):
+        """
+        Write the keys and values of new tokens after the cached ones.
+
+        Parameters
+        ----------
+        layer
+            The layer the keys and values are of.
+        keys
+            The keys of the new tokens, *[num_sequences,num_heads,length,head_dim]*.
+        values
+            The values of the new tokens, of the same shape as ``keys``.
+        slots
+            The slot of each of the sequences. Default is ``None``, which uses the
+            first ``num_sequences`` slots.
+        num_tokens
+            The number of new tokens of each sequence, those past it being padding
+            which isn't cached. Default is ``None``, which caches all ``length``
+            tokens of each sequence.
+
+        Returns
+        -------
+        ret
+            The cached keys and values of the sequences, up to the longest of them,
+            *[num_sequences,num_heads,max_cached_length,head_dim]*, along with the
+            position of the first new token, and the number of cached tokens, of each
+            sequence.
+        """
+        num_sequences, _, length, _ = keys.shape
+        slots = list(range(num_sequences)) if slots is None else list(slots)
+        ivy.utils.assertions.check_equal(
+            len(slots),
+            num_sequences,
+            message="there must be one slot per sequence",
+            as_array=False,
+        )
+        num_tokens = (
+            np.full(num_sequences, length)
+            if num_tokens is None
+            else np.asarray(num_tokens, dtype=np.int64).reshape(-1)
+        )
+        offsets = self._lengths[layer, slots]
+        lengths = offsets + num_tokens
+        if lengths.max(initial=0) > self.max_length:
+            raise ivy.utils.exceptions.IvyException(
+                f"the sequences would be {lengths.max()} tokens long, longer than the"
+                f" {self.max_length} tokens the cache can hold"
+            )
+        # the cache is meant for inference, and doesn't keep the graph of the new tokens
+        keys, values = [
+            ivy.stop_gradient(x, preserve_type=False) for x in [keys, values]
+        ]
+        for i, (slot, start, end) in enumerate(zip(slots, offsets, lengths)):
+            if end == start:
+                continue
+            query = (int(slot), slice(None), slice(int(start), int(end)))
+            n = int(end - start)
+            # set_item writes the slice in place, through inplace_update on the
+            # backends without in-place updates
+            ivy.set_item(self._keys[layer], query, keys[i, :, :n])
+            ivy.set_item(self._values[layer], query, values[i, :, :n])
+        self._lengths[layer, slots] = lengths
+        self._active[slots] = True
+        max_length = max(int(lengths.max(initial=0)), 1)
+        if slots == list(range(num_sequences)):
+            cached = (slice(0, num_sequences), slice(None), slice(0, max_length))
+        else:
+            cached = (ivy.array(slots), slice(None), slice(0, max_length))
+        return (
+            self._keys[layer][cached],
+            self._values[layer][cached],
+            offsets,
+            lengths,
+        )
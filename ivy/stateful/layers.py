@@ -386,6 +386,10 @@ class MultiHeadAttention(Module):
         is_causal=False,
         return_attention_weights=False,
         average_attention_weights=True,
+        key_padding_mask=None,
+        kv_cache=None,
+        kv_cache_layer=0,
+        kv_cache_slots=None,
     ):
         """
         Perform forward pass of the MultiHeadAttention layer.
@@ -410,6 +414,18 @@ class MultiHeadAttention(Module):
             If true, indicates that the returned ``attention_weights`` should be averaged across
             heads. Otherwise, ``attention_weights`` are provided separately per head. Note that this flag only has an
             effect when ``return_attention_weights=True``. Default: ``True`` (i.e. average weights across heads)
+        key_padding_mask
+            A boolean mask of the padding of the keys *[batch_shape,num_keys]*, True
+            where the key is padding. Default is ``None``.
+        kv_cache
+            An :class:`ivy.KVCache` of the keys and values of the previous tokens, to
+            append the new ones to and attend over, for incremental decoding. Default
+            is ``None``.
+        kv_cache_layer
+            The layer of ``kv_cache`` holding the keys and values of this layer.
+        kv_cache_slots
+            The slots of ``kv_cache`` holding the sequences of the batch. Default is
+            ``None``, which uses the first ones.
 
         Returns
         -------
@@ -443,8 +459,12 @@ class MultiHeadAttention(Module):
             is_causal=is_causal,
             return_attention_weights=return_attention_weights,
             average_attention_weights=average_attention_weights,
+            key_padding_mask=key_padding_mask,
             dropout=self._dropout_rate,
             training=self.training,
+            kv_cache=kv_cache,
+            kv_cache_layer=kv_cache_layer,
+            kv_cache_slots=kv_cache_slots,
         )
 
 
@@ -1496,6 +1516,7 @@ class LSTM(Module):
         *,
         weight_initializer=GlorotUniform(),
         num_layers=1,
+        bidirectional=False,
         return_sequence=True,
         return_state=True,
         device=None,
@@ -1515,6 +1536,9 @@ class LSTM(Module):
             Initializer for the weights. Default is GlorotUniform.
         num_layers
             Number of lstm cells in the lstm layer, default is ``1``.
+        bidirectional
+            Whether each lstm cell also runs over the sequence in reverse, its outputs
+            being concatenated to those of the forward direction. Default is ``False``.
         return_sequence
             Whether or not to return the entire output sequence, or
             just the latest timestep.
@@ -1536,6 +1560,7 @@ class LSTM(Module):
         self._output_channels = output_channels
         self._w_init = weight_initializer
         self._num_layers = num_layers
+        self._bidirectional = bidirectional
         self._return_sequence = return_sequence
         self._return_state = return_state
         Module.__init__(self, device=device, v=v, dtype=dtype)
@@ -1557,14 +1582,22 @@ class LSTM(Module):
         return (
             [
                 ivy.zeros((batch_shape + [self._output_channels]), dtype=dtype)
-                for i in range(self._num_layers)
+                for i in range(len(self._layer_names()))
             ],
             [
                 ivy.zeros((batch_shape + [self._output_channels]), dtype=dtype)
-                for i in range(self._num_layers)
+                for i in range(len(self._layer_names()))
             ],
         )
 
+    def _layer_names(self):
+        # the forward, then the backward, direction of each lstm cell
+        return [
+            f"layer_{str(i)}{suffix}"
+            for i in range(self._num_layers)
+            for suffix in (["", "_reverse"] if self._bidirectional else [""])
+        ]
+
     # Overridden
 
     def _create_variables(self, device, dtype=None):
@@ -1580,17 +1613,18 @@ class LSTM(Module):
             the desired data type of the internal variables to be created if not
              provided. Default is ``None``.
         """
+        num_directions = 2 if self._bidirectional else 1
         input_weights = dict(
             zip(
-                [f"layer_{str(i)}" for i in range(self._num_layers)],
+                self._layer_names(),
                 [
                     {
                         "w": self._w_init.create_variables(
                             (
                                 (
                                     self._input_channels
-                                    if i == 0
-                                    else self._output_channels
+                                    if i < num_directions
+                                    else num_directions * self._output_channels
                                 ),
                                 4 * self._output_channels,
                             ),
@@ -1600,13 +1634,13 @@ class LSTM(Module):
                             dtype=dtype,
                         )
                     }
-                    for i in range(self._num_layers)
+                    for i in range(len(self._layer_names()))
                 ],
             )
         )
         recurrent_weights = dict(
             zip(
-                [f"layer_{str(i)}" for i in range(self._num_layers)],
+                self._layer_names(),
                 [
                     {
                         "w": self._w_init.create_variables(
@@ -1617,14 +1651,14 @@ class LSTM(Module):
                             dtype=dtype,
                         )
                     }
-                    for i in range(self._num_layers)
+                    for i in range(len(self._layer_names()))
                 ],
             )
         )
         return {"input": input_weights, "recurrent": recurrent_weights}
 
     @handle_nestable
-    def _forward(self, inputs, initial_state=None):
+    def _forward(self, inputs, initial_state=None, lengths=None):
         """
         Perform forward pass of the LSTM layer.
 
@@ -1633,44 +1667,60 @@ class LSTM(Module):
         inputs
             Inputs to process *[batch_shape, t, in]*.
         initial_state
-            2-tuple of lists of the hidden states h and c for each layer,
-            each of dimension *[batch_shape,out]*.
+            2-tuple of lists of the hidden states h and c for each layer, and each
+            direction of a bidirectional layer, each of dimension *[batch_shape,out]*.
             Created internally if None. (Default value = None)
+        lengths
+            The number of valid timesteps of each sequence *[batch_shape]*, for a
+            batch of sequences of different lengths padded to ``t``. All the
+            sequences are ``t`` timesteps long if None. (Default value = None)
 
         Returns
         -------
         ret
-            The outputs of the final lstm layer *[batch_shape, t, out]* and the hidden
-            state tuple of lists, each of dimension *[batch_shape, out]*
+            The outputs of the final lstm layer *[batch_shape, t, out]*, or
+            *[batch_shape, t, 2 x out]* if bidirectional, and the hidden state tuple
+            of lists, each of dimension *[batch_shape, out]*
         """
         if initial_state is None:
             initial_state = self.get_initial_state(
                 inputs.shape[:-2], dtype=inputs.dtype
             )
-        h_n_list = []
-        c_n_list = []
-        h_t = inputs
-        for h_0, c_0, (_, lstm_input_var), (_, lstm_recurrent_var) in zip(
-            initial_state[0],
-            initial_state[1],
-            self.v.input.items(),
-            self.v.recurrent.items(),
-        ):
-            h_t, c_n = ivy.lstm_update(
-                h_t, h_0, c_0, lstm_input_var.w, lstm_recurrent_var.w
-            )
-            h_n_list.append(h_t[..., -1, :])
-            c_n_list.append(c_n)
+        # all the lstm cells run in one call, using the native kernel of the backend
+        # where it has one
+        h_t, h_n, c_n = ivy.lstm(
+            inputs,
+            ivy.stack(initial_state[0]),
+            ivy.stack(initial_state[1]),
+            [self.v.input[name].w for name in self._layer_names()],
+            [self.v.recurrent[name].w for name in self._layer_names()],
+            lengths=lengths,
+            bidirectional=self._bidirectional,
+        )
         if not self._return_sequence:
-            h_t = h_t[..., -1, :]
+            if lengths is None:
+                h_t = h_t[..., -1, :]
+            else:
+                # the outputs of the last valid timestep of each sequence
+                last = ivy.asarray(lengths, device=ivy.dev(h_t)) - 1
+                h_t = ivy.take_along_axis(
+                    h_t,
+                    ivy.broadcast_to(
+                        ivy.expand_dims(last, axis=(-2, -1)),
+                        h_t.shape[:-2] + (1, h_t.shape[-1]),
+                    ),
+                    -2,
+                )[..., 0, :]
         if not self._return_state:
             return h_t
-        return h_t, (h_n_list, c_n_list)
+        return h_t, (ivy.unstack(h_n), ivy.unstack(c_n))
 
     def extra_repr(self):
         s = "{_input_channels}, {_output_channels}"
         if self._num_layers != 1:
             s += ", num_layers={_num_layers}"
+        if self._bidirectional:
+            s += ", bidirectional={_bidirectional}"
         if self._return_sequence is not True:
             s += ", return_sequence={_return_sequence}"
         if self._return_state is not True:
@@ -6,7 +6,7 @@ import functools
 import os
 import abc
 import copy
-import dill
+import warnings
 from typing import Optional, Tuple, Dict
 
 # local
@@ -16,6 +16,9 @@ from ivy.func_wrapper import _get_first_array
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.stateful.helpers import ModuleHelpers
 from ivy.stateful.converters import ModuleConverters
+from ivy.utils.tensor_store import TensorStore, save_tensor_store
+
+dill = ivy.utils.lazy_import("dill")
 
 
 # helpers
@@ -31,6 +34,78 @@ def _addindent(s_, numSpaces):
     return s
 
 
+def _flatten_signature(nest, backend, leaves):
+    # appends the native arrays of a nest to `leaves`, and returns the signature of
+    # the nest, holding its structure, the shape, dtype and device of its arrays,
+    # and its other leaves, which raise a TypeError if they aren't hashable
+    if isinstance(nest, ivy.Array):
+        nest = nest.data
+    if backend.is_native_array(nest):
+        leaves.append(nest)
+        return ("array", tuple(nest.shape), str(nest.dtype), str(backend.dev(nest)))
+    if isinstance(nest, dict):
+        return (
+            "map",
+            type(nest),
+            tuple((k, _flatten_signature(v, backend, leaves)) for k, v in nest.items()),
+        )
+    if isinstance(nest, (list, tuple)):
+        return (
+            "seq",
+            type(nest),
+            tuple(_flatten_signature(v, backend, leaves) for v in nest),
+        )
+    hash(nest)
+    return ("const", type(nest), nest)
+
+
+def _unflatten_signature(signature, leaves):
+    # rebuilds a nest from its signature and an iterator over its native arrays
+    tag = signature[0]
+    if tag == "array":
+        return ivy.Array(next(leaves))
+    if tag == "map":
+        return signature[1](
+            {k: _unflatten_signature(s, leaves) for k, s in signature[2]}
+        )
+    if tag == "seq":
+        return signature[1](_unflatten_signature(s, leaves) for s in signature[2])
+    return signature[2]
+
+
+def _has_buffers(buffers):
+    # the buffers of the submodules are nested as dicts, which may be empty
+    if isinstance(buffers, dict):
+        return any(_has_buffers(b) for b in buffers.values())
+    return buffers is not None
+
+
+def _native_compile(fn, example_leaves):
+    # compiles a function of native arrays with the compiler of the backend
+    backend = ivy.current_backend_str()
+    if backend == "torch" and example_leaves:
+        import torch
+
+        # torch.compile can't trace through the wrappers of the ivy functions, while
+        # tracing records the torch operations they end up calling
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", torch.jit.TracerWarning)
+            return torch.jit.trace(fn, tuple(example_leaves), check_trace=False)
+    if backend == "jax":
+        import jax
+
+        return jax.jit(fn)
+    if backend == "tensorflow":
+        import tensorflow as tf
+
+        return tf.function(fn)
+    if backend == "paddle":
+        import paddle
+
+        return paddle.jit.to_static(fn)
+    return fn
+
+
 # Base #
 # -----#
 
@@ -77,6 +152,9 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         dtype=None,
         dynamic_backend=None,
         training=True,
+        checkpoint=False,
+        compile_forward=False,
+        compile_cache_size=16,
         **kwargs,
     ):
         """
@@ -117,12 +195,29 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         training
             specifies whether the module is in training or evaluation mode. Default is
             ``True``.
+        checkpoint
+            Whether to recompute the intermediate activations of the forward pass
+            during the gradient pass rather than keeping them, see
+            ``ivy.checkpoint``. Default is ``False``.
+        compile_forward
+            Whether to compile the forward pass with the compiler of the backend,
+            once per signature of the inputs, see ``compile_forward``. Default is
+            ``False``.
+        compile_cache_size
+            The number of compiled forward passes to keep, the least recently used
+            being evicted first. Default is ``16``.
         devices
             devices on which to distribute the module's variables
             'cuda:0', 'cuda:1', 'cpu' etc. (Default value = None)
         """
         valid_build_modes = ["on_init", "explicit", "on_call"]
         ivy.utils.assertions.check_elem_in_list(build_mode, valid_build_modes)
+        ivy.utils.assertions.check_greater(
+            compile_cache_size,
+            0,
+            message="compile_cache_size must be positive",
+            as_array=False,
+        )
         self._device = ivy.default(
             device,
             ivy.default(
@@ -165,6 +260,11 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._lazy_traced = False
         self._dynamic_backend = dynamic_backend
         self.training = training
+        self._checkpoint = checkpoint
+        self._compile_forward = compile_forward
+        self._compile_cache_size = compile_cache_size
+        self._compiled_forwards = OrderedDict()
+        self._compile_stats = dict(hits=0, misses=0, recompiles=0, evictions=0)
         if build_mode != "on_init":
             return
         if hasattr(Module, "_init_var"):
@@ -537,6 +637,29 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         """
         raise ivy.utils.exceptions.IvyNotImplementedException
 
+    def _forward_checkpointed(self, *args, **kwargs):
+        """
+        Forward pass of the layer, recomputing its activations for the gradient pass.
+
+        The variables are passed to the checkpointed forward pass explicitly, so that
+        the backends trace the gradients through them.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+
+        def _forward(v, *args, **kwargs):
+            v_orig = self.v
+            self.v = v
+            try:
+                return self._forward(*args, **kwargs)
+            finally:
+                self.v = v_orig
+
+        return ivy.checkpoint(_forward)(self.v, *args, **kwargs)
+
     def _forward_with_tracking(self, *args, **kwargs):
         """
         Forward pass while optionally tracking submodule returns and call order.
@@ -548,7 +671,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         """
         if self.track_submod_call_order():
             self._add_submod_enter()
-        ret = self._forward(*args, **kwargs)
+        if self._checkpoint:
+            ret = self._forward_checkpointed(*args, **kwargs)
+        else:
+            ret = self._forward(*args, **kwargs)
         track_submod_rets = self.track_submod_rets()
         check_submod_rets = self.check_submod_rets()
         if track_submod_rets or check_submod_rets:
@@ -601,6 +727,57 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             return self.__call__(*args, **kwargs)
         return self._forward_with_tracking(*args, **kwargs)
 
+    def _call_compiled(self, args, kwargs, v):
+        """
+        Compute forward pass of the layer with the compiled forward pass of the
+        signature of its inputs, compiling it on a cache miss.
+
+        The arrays of the inputs and of the variables are the inputs of the compiled
+        forward pass, while their structure and the other leaves of the inputs are
+        part of the signature, along with the training mode.
+
+        Returns
+        -------
+        ret
+            Whether the inputs have a signature, and the result of the forward pass
+            of the layer if so.
+        """
+        backend = ivy.current_backend()
+        leaves = []
+        try:
+            signature = _flatten_signature(
+                (args, kwargs, self.v if v is None else v), backend, leaves
+            )
+        except TypeError:
+            return False, None
+        key = (ivy.current_backend_str(), self.training, signature)
+        stats = self._compile_stats
+        entry = self._compiled_forwards.get(key)
+        if entry is not None:
+            stats["hits"] += 1
+            self._compiled_forwards.move_to_end(key)
+        else:
+            # the signature of the returns is recorded when tracing the forward pass
+            entry = [None, None]
+
+            def _forward(*leaves):
+                args, kwargs, v = _unflatten_signature(signature, iter(leaves))
+                ret_leaves = []
+                entry[1] = _flatten_signature(
+                    self._call(*args, v=v, **kwargs), backend, ret_leaves
+                )
+                return tuple(ret_leaves)
+
+            entry[0] = _native_compile(_forward, leaves)
+            stats["recompiles"] += stats["misses"] > 0
+            stats["misses"] += 1
+            self._compiled_forwards[key] = entry
+            while len(self._compiled_forwards) > self._compile_cache_size:
+                self._compiled_forwards.popitem(last=False)
+                stats["evictions"] += 1
+        ret_leaves = entry[0](*leaves)
+        return True, _unflatten_signature(entry[1], iter(ret_leaves))
+
     # Public #
     # -------#
     def __call__(
@@ -656,6 +833,18 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             v = v if v else self.v
             return self._module_graph(*args, v=v, **kwargs)
 
+        if (
+            self._compile_forward
+            and self._built
+            and not (track_submod_rets or track_submod_call_order)
+            and expected_submod_rets is None
+            and not buffers
+            and not _has_buffers(getattr(self, "buffers", None))
+        ):
+            compiled, ret = self._call_compiled(args, kwargs, v)
+            if compiled:
+                return ret
+
         backend = ivy.with_backend("numpy")
         self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
         self.submod_call_order = ivy.Container(alphabetical_keys=False, ivyh=backend)
@@ -686,9 +875,86 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         -------
         None
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
+        weights_dir = os.path.dirname(weights_path)
+        if weights_dir:
+            os.makedirs(weights_dir, exist_ok=True)
         self.v.cont_to_disk_as_hdf5(weights_path)
 
+    def save_tensors(self, path, /, *, shard_size=2**30, num_workers=None):
+        """
+        Save the variables and buffers of the Module as a tensor store.
+
+        Unlike ``save``, only the arrays are saved, as raw buffers which are
+        independent of the class of the Module, and can be loaded lazily into any
+        Module with the same variables by ``load_tensors``.
+
+        Parameters
+        ----------
+        path
+            The file to save the store to.
+        shard_size
+            The number of bytes of arrays per shard of the store, the shards being
+            written in parallel. Default is ``2**30``.
+        num_workers
+            The number of threads writing the shards. Default is ``None``, which uses
+            up to one thread per CPU.
+
+        Returns
+        -------
+        ret
+            A dict with the ``bytes`` saved, the ``seconds`` it took and the
+            ``bytes_per_second`` of the saving.
+        """
+        return save_tensor_store(
+            {"v": self.v, "buffers": getattr(self, "buffers", {})},
+            path,
+            shard_size=shard_size,
+            num_workers=num_workers,
+        )
+
+    def load_tensors(self, path, /):
+        """
+        Load the variables and buffers of the Module from a tensor store saved by
+        ``save_tensors``.
+
+        The store is memory-mapped, and each variable is read from it directly onto
+        the device of the variable it replaces.
+
+        Parameters
+        ----------
+        path
+            The file the store was saved to.
+
+        Returns
+        -------
+        ret
+            A dict with the ``bytes`` loaded, the ``seconds`` it took and the
+            ``bytes_per_second`` of the loading.
+        """
+        store = TensorStore(path)
+        leaves, treedef = self.v.cont_flatten()
+        keys = ["v/" + key_chain for key_chain in treedef.key_chains]
+        missing = [key for key in keys if key not in store]
+        unexpected = set(k for k in store if k.startswith("v/")) - set(keys)
+        if missing or unexpected:
+            raise ivy.utils.exceptions.IvyException(
+                f"the variables of the tensor store {path} don't match those of the"
+                f" module, missing {missing} and unexpected {sorted(unexpected)}"
+            )
+        for key, leaf in zip(keys, leaves):
+            if store.shape(key) != tuple(leaf.shape):
+                raise ivy.utils.exceptions.IvyException(
+                    f"the variable {key[2:]} has shape {store.shape(key)} in the"
+                    f" tensor store {path}, but {tuple(leaf.shape)} in the module"
+                )
+        self.v = treedef.unflatten(
+            [store.load(key, device=ivy.dev(leaf)) for key, leaf in zip(keys, leaves)]
+        )
+        buffers = store.to_container(prefix="buffers")
+        if buffers:
+            self._set_buffers(buffers.cont_to_dict())
+        return store.stats()
+
     def build(
         self,
         *args,
@@ -846,6 +1112,61 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             if isinstance(module, ivy.Module):
                 module.train(mode=mode)
 
+    def checkpoint(self, mode: bool = True):
+        # enables/disables recomputing the activations of the forward pass
+        self._checkpoint = mode
+
+    def compile_forward(self, mode: bool = True, *, cache_size: int = 16):
+        """
+        Enable or disable compiling the forward pass of the Module, clearing the
+        cache of compiled forward passes and its statistics.
+
+        When enabled, calling the Module compiles its forward pass with the compiler
+        of the backend, ``torch.jit.trace``, ``jax.jit``, ``tf.function`` or
+        ``paddle.jit.to_static``, once for each signature of its inputs, that is the
+        shapes, dtypes and devices of the arrays of its inputs and variables, its
+        other inputs and the training mode. The compiled forward passes are cached,
+        and the next calls with the same signature run them, skipping the overhead
+        of the ivy functions. The forward pass must only depend on the values of the
+        arrays through the backend operations on them, and Modules with buffers,
+        or calls tracking the submodules, run without compiling.
+
+        Parameters
+        ----------
+        mode
+            Whether to compile the forward pass. Default is ``True``.
+        cache_size
+            The number of compiled forward passes to keep, the least recently used
+            being evicted first. Default is ``16``.
+
+        Returns
+        -------
+        ret
+            The Module.
+        """
+        ivy.utils.assertions.check_greater(
+            cache_size, 0, message="cache_size must be positive", as_array=False
+        )
+        self._compile_forward = mode
+        self._compile_cache_size = cache_size
+        self._compiled_forwards.clear()
+        self._compile_stats = dict(hits=0, misses=0, recompiles=0, evictions=0)
+        return self
+
+    def compile_stats(self):
+        """
+        Get the statistics of the cache of compiled forward passes.
+
+        Returns
+        -------
+        ret
+            A dict with the number of ``hits`` and ``misses`` of the cache, the
+            ``recompiles`` for a new signature after the first compilation, the
+            ``evictions`` of the least recently used forward passes, and the
+            ``size`` of the cache.
+        """
+        return dict(self._compile_stats, size=len(self._compiled_forwards))
+
     def to_device(self, device):
         # moves the weights and buffers
         # to the specified device
@@ -961,6 +1282,25 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         else:
             super().__delattr__(name)
 
+    def __getstate__(self):
+        # the forward passes compiled by the backend can't be pickled, so the module
+        # is saved and loaded with an empty cache, compiling them again when called
+        state = self.__dict__.copy()
+        state["_compiled_forwards"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the modules pickled before checkpointing and compiled forward passes lack
+        # their attributes, which are set to the defaults of __init__
+        self.__dict__.setdefault("_checkpoint", False)
+        self.__dict__.setdefault("_compile_forward", False)
+        self.__dict__.setdefault("_compile_cache_size", 16)
+        self.__dict__.setdefault("_compiled_forwards", OrderedDict())
+        self.__dict__.setdefault(
+            "_compile_stats", dict(hits=0, misses=0, recompiles=0, evictions=0)
+        )
+
     def state_dict(self):
         return {**self.v, **getattr(self, "buffers", {})}
 
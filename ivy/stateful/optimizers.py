@@ -3,12 +3,68 @@
 
 # global
 import abc
+import math
 from typing import Union, Optional, Callable
 
 # local
 import ivy
 
 
+# Helpers #
+# --------#
+
+
+class _FlatGroup:
+    """
+    Leaves of a container sharing a dtype and device, which the foreach mode of the
+    optimizers flattens into one contiguous buffer, updated with a few batched ops.
+    """
+
+    def __init__(self, idxs, shapes):
+        self.idxs = idxs
+        self.shapes = shapes
+        self.sizes = [math.prod(shape) for shape in shapes]
+
+    def flatten(self, leaves):
+        return ivy.concat([leaves[i] for i in self.idxs], axis=None)
+
+    def unflatten(self, flat):
+        # the views of the leaves are taken with the backend functions directly, as
+        # going through the ivy wrappers for each leaf would cost more than the update
+        backend = ivy.current_backend(flat)
+        return [
+            ivy.Array(backend.reshape(x, shape))
+            for x, shape in zip(
+                backend.split(ivy.to_native(flat), num_or_size_splits=self.sizes),
+                self.shapes,
+            )
+        ]
+
+    def segment_norms(self, flat):
+        # the vector norm of each leaf, each reduced over its own view of the buffer in
+        # the dtype of the buffer. Differences of running sums over the whole buffer
+        # would cancel out for the small leaves following large ones
+        backend = ivy.current_backend(flat)
+        return ivy.Array(
+            backend.stack(
+                [
+                    backend.vector_norm(x)
+                    for x in backend.split(
+                        ivy.to_native(flat), num_or_size_splits=self.sizes
+                    )
+                ]
+            )
+        )
+
+    def repeat(self, per_leaf):
+        # broadcast per leaf values to the elements of the buffer
+        return ivy.repeat(per_leaf, self.sizes)
+
+
+def _to_float32(x):
+    return ivy.astype(x, "float32") if ivy.dtype(x) in ("float16", "bfloat16") else x
+
+
 # Base #
 # -----#
 
@@ -23,6 +79,8 @@ class Optimizer(abc.ABC):
         trace_on_next_step: bool = False,
         fallback_to_non_traced: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        master_weights: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,6 +108,14 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to flatten the variables, gradients and optimizer state of each
+            dtype and device into one buffer, so that every step runs as a few batched
+            ops rather than a few ops for every variable. Default is ``False``.
+        master_weights
+            Whether to keep float32 master copies of the float16 and bfloat16
+            variables, which the updates are applied to before casting them back.
+            Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +128,14 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._traced_step_fn = None
         self._traced = False
+        self._foreach = foreach
+        self._master_weights = master_weights
+        self._master_v = None
+        self._master_dtypes = None
+        self._foreach_treedef = None
+        self._foreach_groups = None
+        self._foreach_dtypes = None
+        self._flat_state = None
 
     # Private #
     # --------#
@@ -88,8 +162,131 @@ class Optimizer(abc.ABC):
         """
         raise ivy.utils.exceptions.IvyNotImplementedException
 
+    def _foreach_update(self, group_idx: int, w: ivy.Array, dcdw: ivy.Array):
+        """
+        Update a flat buffer of variables from the flat buffer of their gradients, for
+        the foreach mode. Override this method with the update formula of the child
+        class, applied to the variables of the group ``self._foreach_groups[group_idx]``
+        and its flat state.
+
+        Parameters
+        ----------
+        group_idx
+            Index of the group of variables to update.
+        w
+            Flat buffer of variables to update.
+        dcdw
+            Flat buffer of gradients.
+
+        Returns
+        -------
+        ret
+            The updated flat buffer of variables.
+        """
+        raise ivy.utils.exceptions.IvyNotImplementedException
+
     # Given #
 
+    # the attributes holding the optimizer state, as containers of the structure of the
+    # variables, which the foreach mode keeps as flat buffers while stepping
+    _state_attrs = ()
+
+    def _sync_flat_state(self):
+        """Write the flat state of the foreach mode back to the state containers."""
+        if self._flat_state is None:
+            return
+        for attr, flat_bufs in self._flat_state.items():
+            leaves = [None] * self._foreach_treedef.num_leaves
+            for group, flat in zip(self._foreach_groups, flat_bufs):
+                for i, x in zip(group.idxs, group.unflatten(flat)):
+                    leaves[i] = x
+            setattr(self, attr, self._foreach_treedef.unflatten(leaves))
+
+    def _flat_state_of(self, group_idx, init):
+        """
+        Get the flat state buffers of a group, in the order of ``self._state_attrs``,
+        setting them to the buffers returned by ``init()`` if there are none yet.
+        """
+        if self._flat_state is None:
+            self._flat_state = {
+                attr: [None] * len(self._foreach_groups) for attr in self._state_attrs
+            }
+        if self._flat_state[self._state_attrs[0]][group_idx] is None:
+            for attr, flat in zip(self._state_attrs, init()):
+                self._flat_state[attr][group_idx] = flat
+        return [self._flat_state[attr][group_idx] for attr in self._state_attrs]
+
+    def _set_flat_state(self, group_idx, bufs):
+        for attr, flat in zip(self._state_attrs, bufs):
+            self._flat_state[attr][group_idx] = flat
+
+    def _set_foreach_groups(self, treedef, leaves):
+        # the native dtypes are compared, which is cheaper than getting the ivy
+        # dtypes and devices of the leaves at every step
+        dtypes = [ivy.to_native(x).dtype for x in leaves]
+        if self._foreach_groups is not None and (treedef, dtypes) == (
+            self._foreach_treedef,
+            self._foreach_dtypes,
+        ):
+            return
+        # the flat state is laid out by the groups, so goes back to the containers
+        self._sync_flat_state()
+        self._flat_state = None
+        idxs = {}
+        for i, x in enumerate(leaves):
+            idxs.setdefault((ivy.dtype(x), ivy.dev(x)), []).append(i)
+        self._foreach_treedef = treedef
+        self._foreach_dtypes = dtypes
+        self._foreach_groups = [
+            _FlatGroup(group_idxs, [tuple(leaves[i].shape) for i in group_idxs])
+            for group_idxs in idxs.values()
+        ]
+
+    def _foreach_step(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Update nested variables container v as a few batched ops per dtype and device,
+        by running the update formula on flat buffers of the variables and gradients.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables, following update step.
+        """
+        leaves, treedef = v.cont_flatten()
+        grad_leaves, grad_treedef = grads.cont_flatten()
+        if grad_treedef != treedef:
+            raise ivy.utils.exceptions.IvyException(
+                "the gradients must have the same structure as the variables to be"
+                " updated by a foreach optimizer step, but got key-chains"
+                f" {grad_treedef.key_chains} for the variables {treedef.key_chains}"
+            )
+        self._set_foreach_groups(treedef, leaves)
+        if self._flat_state is None and all(
+            getattr(self, attr) is not None for attr in self._state_attrs
+        ):
+            # load the state containers into flat buffers, laid out like the variables
+            self._flat_state = {}
+            for attr in self._state_attrs:
+                state_leaves = getattr(self, attr).cont_flatten()[0]
+                self._flat_state[attr] = [
+                    group.flatten(state_leaves) for group in self._foreach_groups
+                ]
+        new_leaves = [None] * len(leaves)
+        for group_idx, group in enumerate(self._foreach_groups):
+            new_w = self._foreach_update(
+                group_idx, group.flatten(leaves), group.flatten(grad_leaves)
+            )
+            for i, x in zip(group.idxs, group.unflatten(new_w)):
+                new_leaves[i] = x
+        return treedef.unflatten(new_leaves)
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -107,9 +304,68 @@ class Optimizer(abc.ABC):
             the variables.
             Default is ``False``
         """
+        step = self._foreach_step if self._foreach else self._step
+        if self._master_weights:
+            return self._master_weights_step(step, v, grads, ignore_missing)
+        if ignore_missing:
+            return v.cont_set_at_keys(step(v.cont_at_key_chains(grads), grads))
+        return step(v, grads)
+
+    def _master_weights_step(self, step, v, grads, ignore_missing):
+        """
+        Update the float32 master weights of the variables, and return them cast back
+        to the dtypes of the variables.
+
+        The master weights are float32 copies of the float16 and bfloat16 variables,
+        created on the first step, which accumulate the updates too small to change
+        the low precision variables. They are created again whenever the key-chains or
+        the dtypes of the variables change.
+        """
+        leaves, treedef = v.cont_flatten()
+        dtypes = [ivy.as_ivy_dtype(ivy.dtype(x)) for x in leaves]
+        if self._master_v is not None:
+            master_leaves, master_treedef = self._master_v.cont_flatten()
+            if (
+                master_treedef != treedef
+                or self._master_dtypes not in (None, dtypes)
+                or [ivy.as_ivy_dtype(ivy.dtype(x)) for x in master_leaves]
+                != [
+                    "float32" if dtype in ("float16", "bfloat16") else dtype
+                    for dtype in dtypes
+                ]
+            ):
+                self._master_v = None
+        if self._master_v is None:
+            self._master_v = v.cont_map(lambda x, _: _to_float32(x))
+        self._master_dtypes = dtypes
+        master_v = self._master_v
+        grads = grads.cont_map(lambda x, _: _to_float32(x))
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
-        return self._step(v, grads)
+            master_v = master_v.cont_set_at_keys(
+                step(master_v.cont_at_key_chains(grads), grads)
+            )
+        else:
+            master_v = step(master_v, grads)
+        self._master_v = master_v
+        return ivy.Container.cont_multi_map(
+            lambda xs, _: (
+                xs[0]
+                if ivy.dtype(xs[0]) == ivy.dtype(xs[1])
+                else ivy.astype(xs[0], ivy.dtype(xs[1]))
+            ),
+            [master_v, v],
+        )
+
+    def _with_master_state(self, state: ivy.Container):
+        # the state of the optimizer, with the master weights if any
+        if self._master_v is not None:
+            state["master_v"] = self._master_v
+        return state
+
+    def _set_master_state(self, state: ivy.Container):
+        # the master weights are matched against the variables on the next step
+        self._master_v = state["master_v"] if "master_v" in state else None
+        self._master_dtypes = None
 
     # Public #
     # -------#
@@ -168,6 +424,8 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
+        master_weights: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -186,9 +444,21 @@ class SGD(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all the variables of each dtype and device together, as
+            flat buffers, rather than one at a time. Default is ``False``.
+        master_weights
+            Whether to update float32 master copies of the float16 and bfloat16
+            variables. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
+            master_weights=master_weights,
         )
 
     # Custom Step
@@ -217,6 +487,14 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _foreach_update(self, group_idx: int, w: ivy.Array, dcdw: ivy.Array):
+        return ivy.gradient_descent_update(
+            w,
+            dcdw,
+            self._lr if isinstance(self._lr, float) else self._lr(),
+            stop_gradients=self._stop_gradients,
+        )
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -226,11 +504,11 @@ class SGD(Optimizer):
         state
             Nested state to update.
         """
-        pass
+        self._set_master_state(state)
 
     @property
     def state(self):
-        return ivy.Container({})
+        return self._with_master_state(ivy.Container({}))
 
 
 class LARS(Optimizer):
@@ -241,6 +519,8 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
+        master_weights: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -261,10 +541,22 @@ class LARS(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all the variables of each dtype and device together, as
+            flat buffers, rather than one at a time. Default is ``False``.
+        master_weights
+            Whether to update float32 master copies of the float16 and bfloat16
+            variables. Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
+            master_weights=master_weights,
         )
 
     # Custom Step
@@ -294,6 +586,20 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _foreach_update(self, group_idx: int, w: ivy.Array, dcdw: ivy.Array):
+        # the layer-wise learning rates of lars_update, from the norm of each leaf
+        group = self._foreach_groups[group_idx]
+        w_norm = group.segment_norms(w)
+        lr = ivy.stable_divide(
+            w_norm * (self._lr if isinstance(self._lr, float) else self._lr()),
+            group.segment_norms(dcdw),
+        )
+        if self._decay_lambda > 0:
+            lr /= w_norm * self._decay_lambda
+        return ivy.gradient_descent_update(
+            w, dcdw, group.repeat(lr), stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -303,14 +609,16 @@ class LARS(Optimizer):
         state
             Nested state to update.
         """
-        pass
+        self._set_master_state(state)
 
     @property
     def state(self):
-        return ivy.Container({})
+        return self._with_master_state(ivy.Container({}))
 
 
 class Adam(Optimizer):
+    _state_attrs = ("_mw", "_vw")
+
     def __init__(
         self,
         lr: float = 1e-4,
@@ -321,6 +629,8 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        master_weights: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -349,6 +659,12 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of each dtype and device together, as
+            flat buffers, rather than one at a time. Default is ``False``.
+        master_weights
+            Whether to update float32 master copies of the float16 and bfloat16
+            variables. Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -359,7 +675,15 @@ class Adam(Optimizer):
         self._should_trace = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
+            master_weights=master_weights,
         )
 
     # Custom Step
@@ -400,6 +724,23 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _foreach_update(self, group_idx: int, w: ivy.Array, dcdw: ivy.Array):
+        mw, vw = self._flat_state_of(group_idx, lambda: (dcdw, dcdw**2))
+        new_w, mw, vw = ivy.adam_update(
+            w,
+            dcdw,
+            self._lr if isinstance(self._lr, float) else self._lr(),
+            mw,
+            vw,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+            stop_gradients=self._stop_gradients,
+        )
+        self._set_flat_state(group_idx, (mw, vw))
+        return new_w
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -411,10 +752,13 @@ class Adam(Optimizer):
         """
         self._mw = state.mw
         self._vw = state.vw
+        self._flat_state = None
+        self._set_master_state(state)
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        self._sync_flat_state()
+        return self._with_master_state(ivy.Container({"mw": self._mw, "vw": self._vw}))
 
 
 class AdamW(Adam):
@@ -429,6 +773,8 @@ class AdamW(Adam):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        master_weights: bool = False,
     ):
         """
         Construct an ADAMW optimizer.
@@ -459,6 +805,12 @@ class AdamW(Adam):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of each dtype and device together, as
+            flat buffers, rather than one at a time. Default is ``False``.
+        master_weights
+            Whether to update float32 master copies of the float16 and bfloat16
+            variables. Default is ``False``.
         """
         self._weight_decay = weight_decay
         super().__init__(
@@ -470,6 +822,8 @@ class AdamW(Adam):
             stop_gradients,
             trace_on_next_step,
             device,
+            foreach,
+            master_weights,
         )
 
     def _step(self, v: ivy.Container, grads: ivy.Container):
@@ -495,8 +849,15 @@ class AdamW(Adam):
 
         return super()._step(v, grads)
 
+    def _foreach_update(self, group_idx: int, w: ivy.Array, dcdw: ivy.Array):
+        if self._weight_decay != 0:
+            dcdw = dcdw + self._weight_decay * w
+        return super()._foreach_update(group_idx, w, dcdw)
+
 
 class LAMB(Optimizer):
+    _state_attrs = ("_mw", "_vw")
+
     def __init__(
         self,
         lr: float = 1e-4,
@@ -509,6 +870,8 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        master_weights: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -542,9 +905,23 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables of each dtype and device together, as
+            flat buffers, rather than one at a time. Default is ``False``.
+        master_weights
+            Whether to update float32 master copies of the float16 and bfloat16
+            variables. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
+            master_weights=master_weights,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -595,6 +972,33 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _foreach_update(self, group_idx: int, w: ivy.Array, dcdw: ivy.Array):
+        # lamb_update, with the trust ratio of each leaf from its segment of the buffers
+        group = self._foreach_groups[group_idx]
+        mw, vw = self._flat_state_of(group_idx, lambda: (dcdw, dcdw**2))
+        eff_grads, mw, vw = ivy.adam_step(
+            dcdw,
+            mw,
+            vw,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+        )
+        self._set_flat_state(group_idx, (mw, vw))
+        if self._decay_lambda > 0:
+            r2 = group.segment_norms(eff_grads + self._decay_lambda * w)
+        else:
+            r2 = group.segment_norms(eff_grads)
+        r = ivy.minimum(
+            ivy.stable_divide(group.segment_norms(w), r2),
+            ivy.array(self._max_trust_ratio, dtype=ivy.dtype(w)),
+        )
+        lr = group.repeat(r * (self._lr if isinstance(self._lr, float) else self._lr()))
+        return ivy.optimizer_update(
+            w, eff_grads, lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -606,7 +1010,10 @@ class LAMB(Optimizer):
         """
         self._mw = state.mw
         self._vw = state.vw
+        self._flat_state = None
+        self._set_master_state(state)
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        self._sync_flat_state()
+        return self._with_master_state(ivy.Container({"mw": self._mw, "vw": self._vw}))
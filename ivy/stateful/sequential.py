@@ -5,9 +5,27 @@ from typing import Union, Optional
 
 # local
 import ivy
+from ivy.functional.ivy.gradients import _array_leaves
 from ivy.stateful.module import Module
 
 
+def _segments_under_budget(activation_nbytes, memory_budget):
+    # split the submodules greedily into the fewest consecutive segments whose
+    # activations fit in the budget, a submodule exceeding it on its own being a
+    # segment of its own
+    segments = []
+    start = 0
+    nbytes = 0
+    for i, size in enumerate(activation_nbytes):
+        if i > start and nbytes + size > memory_budget:
+            segments.append((start, i))
+            start = i
+            nbytes = 0
+        nbytes += size
+    segments.append((start, len(activation_nbytes)))
+    return segments
+
+
 class Sequential(Module):
     def __init__(
         self,
@@ -15,6 +33,7 @@ class Sequential(Module):
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+        checkpoint_memory_budget: Optional[int] = None,
     ):
         """
         Initialize a sequential container. Modules will be added to it in the order they
@@ -30,6 +49,14 @@ class Sequential(Module):
         v
             the variables for each submodule in the sequence, constructed internally by
             default.
+        checkpoint_memory_budget
+            If given, the number of bytes of activations to keep for the gradient pass.
+            The submodules are split into consecutive segments whose outputs fit in
+            the budget, and each segment is checkpointed with ``ivy.checkpoint``, so
+            that only the outputs of the segments are kept and the activations within
+            them are recomputed. The sizes of the outputs are measured on the first
+            forward pass for each input shape, which checkpoints every submodule.
+            Default is ``None``, which keeps all the activations.
         """
         if v is not None:
             for i, submod in enumerate(sub_modules):
@@ -42,12 +69,43 @@ class Sequential(Module):
                             "chains in the form of "
                             '"submodules/v{}", where {} is an idx'
                         )
+        if checkpoint_memory_budget is not None:
+            ivy.utils.assertions.check_greater(
+                checkpoint_memory_budget,
+                0,
+                message="checkpoint_memory_budget must be positive",
+                as_array=False,
+            )
         self._submodules = list(sub_modules)
+        self._checkpoint_memory_budget = checkpoint_memory_budget
+        # the segments to checkpoint for each input shape, and the sizes of the
+        # outputs of the submodules measured while finding them
+        self._checkpoint_segments = {}
+        self._activation_nbytes = [0] * len(self._submodules)
         Module.__init__(self, device=device, v=v, dtype=dtype)
 
     def __iter__(self):
         return iter(self._submodules)
 
+    def _forward_segment(self, x, v, start, end):
+        for i in range(start, end):
+            submod = self._submodules[i]
+            try:
+                x = submod(x, v=v.submodules[f"v{str(i)}"])
+            except KeyError:
+                if submod.v:
+                    raise ivy.utils.exceptions.IvyException(
+                        "variables v passed to Sequential class must have key chains "
+                        "in the form of "
+                        '"submodules/v{}", where {} is an idx'
+                    )
+                x = submod(x)
+            if self._checkpoint_memory_budget is not None:
+                self._activation_nbytes[i] = sum(
+                    a.size * ivy.dtype_bits(a.dtype) // 8 for a in _array_leaves(x)
+                )
+        return x
+
     def _forward(self, inputs):
         """
         Perform forward pass of the Sequential container.
@@ -62,16 +120,22 @@ class Sequential(Module):
         ret
             The output after each of the layers in the Sequential has been applied.
         """
+        if self._checkpoint_memory_budget is None:
+            return self._forward_segment(inputs, self.v, 0, len(self._submodules))
+        key = tuple((tuple(a.shape), a.dtype) for a in _array_leaves(inputs))
+        segments = self._checkpoint_segments.get(key)
+        if segments is None:
+            # measure the outputs of the submodules, checkpointing each of them
+            segments = [(i, i + 1) for i in range(len(self._submodules))]
         x = inputs
-        for i, submod in enumerate(self._submodules):
-            try:
-                x = submod(x, v=self.v.submodules[f"v{str(i)}"])
-            except KeyError:
-                if submod.v:
-                    raise ivy.utils.exceptions.IvyException(
-                        "variables v passed to Sequential class must have key chains "
-                        "in the form of "
-                        '"submodules/v{}", where {} is an idx'
-                    )
-                x = submod(x)
+        if len(segments) == 1:
+            # all the activations fit in the budget
+            x = self._forward_segment(x, self.v, 0, len(self._submodules))
+        else:
+            for start, end in segments:
+                x = ivy.checkpoint(self._forward_segment)(x, self.v, start, end)
+        if key not in self._checkpoint_segments:
+            self._checkpoint_segments[key] = _segments_under_budget(
+                self._activation_nbytes, self._checkpoint_memory_budget
+            )
         return x
@@ -1,4 +1,5 @@
 from . import backend
+from . import context
 from . import dynamic_import
 from .dynamic_import import *
 from .binaries import *
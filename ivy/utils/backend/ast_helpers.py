@@ -1,4 +1,6 @@
 import ast
+import hashlib
+import marshal
 import os
 import sys
 import traceback
@@ -7,6 +9,7 @@ from string import Template
 from importlib.util import spec_from_file_location
 from importlib.abc import Loader, MetaPathFinder
 
+from ivy._version import __version__ as _ivy_version
 
 # AST helpers ##################
 
@@ -21,6 +24,28 @@ _local_import_template = Template(
 )
 _unmodified_ivy_path = sys.modules["ivy"].__path__[0].rpartition(os.path.sep)[0]
 _compiled_modules_cache = {}
+# the transformed modules are also cached on disk, per ivy version and version of the
+# transformations, alongside the source file stats they were compiled from, to be
+# reused by other processes. Setting the
+# IVY_WITH_BACKEND_CACHE_DIR environment variable to an empty string disables this.
+_compiled_modules_cache_dir = os.environ.get(
+    "IVY_WITH_BACKEND_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "ivy", "with_backend"),
+)
+_compiled_modules_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _transformer_hash():
+    # the modules are transformed by this one, so that a change to the
+    # transformations invalidates the modules cached without the ivy version changing
+    try:
+        with open(__file__, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return "unknown"
+
+
+_compiled_modules_cache_key = _transformer_hash()
 
 
 def _retrive_local_modules():
@@ -171,6 +196,51 @@ def _create_node(stmnt: str):
     return ast.parse(stmnt).body[0]
 
 
+def _cached_module_path(filename):
+    if not _compiled_modules_cache_dir:
+        return None
+    relpath = os.path.relpath(filename, _unmodified_ivy_path)
+    return os.path.join(
+        _compiled_modules_cache_dir,
+        _ivy_version,
+        _compiled_modules_cache_key,
+        f"{os.path.splitext(relpath)[0]}.{sys.implementation.cache_tag}.pyc",
+    )
+
+
+def _load_cached_module(filename):
+    cache_path = _cached_module_path(filename)
+    if cache_path is None:
+        return None
+    try:
+        stat = os.stat(filename)
+        with open(cache_path, "rb") as f:
+            mtime, size, compiled_obj = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+        return None
+    return compiled_obj
+
+
+def _save_cached_module(filename, compiled_obj):
+    cache_path = _cached_module_path(filename)
+    if cache_path is None:
+        return
+    try:
+        stat = os.stat(filename)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # write to a temporary file first, so that concurrent processes never read
+        # a partially written module
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump((stat.st_mtime_ns, stat.st_size, compiled_obj), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # the cache is only an optimization, e.g. it may be read-only
+        pass
+
+
 # End AST helpers ##############
 
 
@@ -263,17 +333,28 @@ class IvyLoader(Loader):
         if self.filename in _compiled_modules_cache:
             compiled_obj = _compiled_modules_cache[self.filename]
         else:
-            # enforce UTF-8 for compiling when installed as a package
-            # according to PEP 686
-            with open(self.filename, encoding="utf-8") as f:
-                data = f.read()
-
-            ast_tree = parse(data)
-            transformer = ImportTransformer()
-            transformer.visit(ast_tree)
-            transformer.impersonate_import(ast_tree, local_ivy_id)
-            ast.fix_missing_locations(ast_tree)
-            compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+            # modules compiled for a nested local ivy embed its id, which is only
+            # valid within this process, so these aren't cached on disk
+            compiled_obj = (
+                _load_cached_module(self.filename) if local_ivy_id is None else None
+            )
+            if compiled_obj is not None:
+                _compiled_modules_cache_stats["hits"] += 1
+            else:
+                _compiled_modules_cache_stats["misses"] += 1
+                # enforce UTF-8 for compiling when installed as a package
+                # according to PEP 686
+                with open(self.filename, encoding="utf-8") as f:
+                    data = f.read()
+
+                ast_tree = parse(data)
+                transformer = ImportTransformer()
+                transformer.visit(ast_tree)
+                transformer.impersonate_import(ast_tree, local_ivy_id)
+                ast.fix_missing_locations(ast_tree)
+                compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+                if local_ivy_id is None:
+                    _save_cached_module(self.filename, compiled_obj)
             _compiled_modules_cache[self.filename] = compiled_obj
         try:
             exec(compiled_obj, module.__dict__)
@@ -7,6 +7,7 @@ import importlib
 import functools
 import numpy as np
 import gc
+import time
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -18,8 +19,16 @@ from ivy.utils.backend.sub_backend_handler import (
 from ivy.utils.exceptions import _handle_inplace_mode
 
 backend_stack = []
+# the ivy namespace of every backend set so far, cached as the original dict keys it
+# was built from along with the list of (module dict, key, value) updates to apply
+_backend_namespace_cache = {}
+_deleted = object()
 compiled_backends = {}
 _compiled_backends_ids = {}
+# local ivy packages built ahead of time by prebuild_backend, handed out by
+# with_backend(backend, cached=False)
+_prebuilt_backends = {}
+_with_backend_build_times = []
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
@@ -74,6 +83,52 @@ def _get_backend_for_arg(arg_module_name):
             return importlib.import_module(module_name)
 
 
+# maps the type of each leaf seen during backend inference to its backend module,
+# or to None for non-array types such as scalars
+_backend_type_cache = {}
+_backend_type_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _get_backend_for_type(arg_type):
+    try:
+        backend = _backend_type_cache[arg_type]
+        _backend_type_cache_stats["hits"] += 1
+    except KeyError:
+        _backend_type_cache_stats["misses"] += 1
+        backend = _get_backend_for_arg(arg_type.__module__)
+        _backend_type_cache[arg_type] = backend
+    return backend
+
+
+def backend_cache_info():
+    """
+    Return the statistics of the cache used to infer the backend from arguments when
+    no global backend is set.
+
+    Returns
+    -------
+    ret
+        a dict with the number of cache ``hits`` and ``misses``, and the number of
+        types currently cached as ``size``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> ivy.utils.backend.clear_backend_cache()
+    >>> _ = ivy.current_backend(np.array([1.0]))
+    >>> _ = ivy.current_backend(np.array([2.0]))
+    >>> print(ivy.utils.backend.backend_cache_info())
+    {'hits': 1, 'misses': 1, 'size': 1}
+    """
+    return {**_backend_type_cache_stats, "size": len(_backend_type_cache)}
+
+
+def clear_backend_cache():
+    """Clear the cache used to infer the backend from arguments, and its stats."""
+    _backend_type_cache.clear()
+    _backend_type_cache_stats.update(hits=0, misses=0)
+
+
 def _determine_backend_from_args(args):
     """
     Return the appropriate Ivy backend, given some arguments.
@@ -99,25 +154,26 @@ def _determine_backend_from_args(args):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>    # noqa
     """
     arg_type = type(args)
+    if arg_type is list or arg_type is tuple:
+        for arg in args:
+            # recursively call the function for each element in the list/tuple,
+            # returning as soon as the first array is found
+            lib = _determine_backend_from_args(arg)
+            if lib:
+                return lib
+        return None
     if isinstance(args, ivy.Array):
         args = args.data
-
+        arg_type = type(args)
     if isinstance(args, dict):
-        for key, value in args.items():
+        for value in args.values():
             # recursively call the function for each value in the dictionary
             lib = _determine_backend_from_args(value)
             if lib:
                 return lib
-        # check if args is a list or tuple
-    elif arg_type in [list, tuple]:
-        for arg in args:
-            # recursively call the function for each element in the list/tuple
-            lib = _determine_backend_from_args(arg)
-            if lib:
-                return lib
-    else:
-        # check if the class module of the arg is in _array_types
-        return _get_backend_for_arg(args.__class__.__module__)
+        return None
+    # the backend of a leaf only depends on its type
+    return _get_backend_for_type(arg_type)
 
 
 def set_backend_to_specific_version(backend):
@@ -189,7 +245,9 @@ def current_backend(*args, **kwargs):
 
     # if no global backend exists, we try to infer
     # the backend from the arguments
-    f = _determine_backend_from_args(list(args) + list(kwargs.values()))
+    f = _determine_backend_from_args(args) or _determine_backend_from_args(
+        tuple(kwargs.values())
+    )
     if f is not None:
         if verbosity.level > 0:
             verbosity.cprint(f"Using backend from type: {f}")
@@ -199,22 +257,30 @@ def current_backend(*args, **kwargs):
 
 
 def _set_module_backend(
-    original_dict, target, backend, invalid_dtypes=None, backend_str=None
+    original_dict,
+    target,
+    backend,
+    invalid_dtypes=None,
+    backend_str=None,
+    namespace_updates=None,
 ):
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
+    namespace_updates = [] if namespace_updates is None else namespace_updates
     for k, v in original_dict.items():
         compositional = k not in backend.__dict__
         if compositional:
             if k in invalid_dtypes and k in target.__dict__:
                 del target.__dict__[k]
+                namespace_updates.append((target.__dict__, k, _deleted))
                 continue
             backend.__dict__[k] = v
         target.__dict__[k] = _wrap_function(
             key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
         )
+        namespace_updates.append((target.__dict__, k, target.__dict__[k]))
         if (
             isinstance(v, types.ModuleType)
             and "ivy.functional." in v.__name__
@@ -226,7 +292,50 @@ def _set_module_backend(
                 backend.__dict__[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
+                namespace_updates=namespace_updates,
             )
+    return namespace_updates
+
+
+def _apply_namespace_updates(namespace_updates):
+    for module_dict, k, v in namespace_updates:
+        if v is _deleted:
+            module_dict.pop(k, None)
+        else:
+            module_dict[k] = v
+
+
+def _set_backend_namespace(backend):
+    """
+    Set the ivy namespace to the wrapped functions of `backend`.
+
+    The namespace is only built the first time a backend is set, recording the
+    updates made to ivy and its submodules. Setting the same backend again just
+    replays these updates, unless the original ivy dict has changed since.
+    """
+    backend_str = backend.current_backend_str()
+    if backend_str in _backend_namespace_cache:
+        original_keys, namespace_updates = _backend_namespace_cache[backend_str]
+        if original_keys == ivy_original_dict.keys():
+            _apply_namespace_updates(namespace_updates)
+            return
+    set_backend_to_specific_version(backend)
+    namespace_updates = _set_module_backend(ivy_original_dict, ivy, backend)
+    # following snippet is required to update the ivy.functional namespace with
+    # backend-specific functions
+    for key, value in ivy.__dict__.items():
+        if key in ivy.functional.__dict__ and not key.startswith("__"):
+            ivy.functional.__dict__[key] = value
+            namespace_updates.append((ivy.functional.__dict__, key, value))
+    _backend_namespace_cache[backend_str] = (
+        set(ivy_original_dict.keys()),
+        namespace_updates,
+    )
+
+
+def clear_backend_namespace_cache():
+    """Clear the cached ivy namespaces, so they are rebuilt on the next switch."""
+    _backend_namespace_cache.clear()
 
 
 def _handle_backend_specific_vars(target, backend):
@@ -407,13 +516,7 @@ def set_backend(backend: str, dynamic: bool = False):
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_module_backend(ivy_original_dict, ivy, backend)
-        # following snippet is required to update the ivy.functional namespace with
-        # backend-specific functions
-        for key, _ in ivy.__dict__.items():
-            if key in ivy.functional.__dict__ and not key.startswith("__"):
-                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        _set_backend_namespace(backend)
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
@@ -529,18 +632,15 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
+        # restore the namespace of the previous backend if there still is one,
+        # otherwise return to ivy's original functions
+        if backend_stack:
+            _set_backend_namespace(backend_stack[-1])
+        else:
+            for k, v in ivy_original_dict.items():
                 ivy.__dict__[k] = v
-            if k in ivy.functional.__dict__ and not k.startswith("__"):
-                ivy.functional.__dict__[k] = v
+                if k in ivy.functional.__dict__ and not k.startswith("__"):
+                    ivy.functional.__dict__[k] = v
     if verbosity.level > 0:
         verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
@@ -576,13 +676,8 @@ def choose_random_backend(excluded=None):
             return f
 
 
-# noinspection PyProtectedMember
-@prevent_access_locally
-def with_backend(backend: str, cached: bool = True):
-    # Use already compiled object
-    if cached and backend in compiled_backends:
-        cached_backend = compiled_backends[backend][-1]
-        return cached_backend
+def _build_local_ivy(backend: str):
+    start = time.perf_counter()
     with _importlib.LocalIvyImporter():
         ivy_pack = _importlib._import_module("ivy")
         ivy_pack._is_local_pkg = True
@@ -607,6 +702,21 @@ def with_backend(backend: str, cached: bool = True):
         )
         _compiled_backends_ids[ivy_pack._compiled_id] = ivy_pack
         _importlib._clear_cache()
+    _with_backend_build_times.append((backend, time.perf_counter() - start))
+    return ivy_pack
+
+
+# noinspection PyProtectedMember
+@prevent_access_locally
+def with_backend(backend: str, cached: bool = True):
+    # Use already compiled object
+    if cached and backend in compiled_backends:
+        cached_backend = compiled_backends[backend][-1]
+        return cached_backend
+    if _prebuilt_backends.get(backend):
+        ivy_pack = _prebuilt_backends[backend].pop()
+    else:
+        ivy_pack = _build_local_ivy(backend)
     try:
         compiled_backends[backend].append(ivy_pack)
     except KeyError:
@@ -615,3 +725,49 @@ def with_backend(backend: str, cached: bool = True):
         # to avoid warning users when not using set_backend with ivy.Array.__repr__
         _handle_inplace_mode(ivy_pack=ivy_pack)
     return ivy_pack
+
+
+@prevent_access_locally
+def prebuild_backend(backend: str, num: int = 1):
+    """
+    Build local ivy packages for a backend ahead of time, such as when a worker
+    starts, so that later calls to ``ivy.with_backend`` can hand them out at no cost.
+
+    Parameters
+    ----------
+    backend
+        the backend to build the local ivy packages with.
+    num
+        the number of packages to add to the pool. Each one is handed out once, by
+        the first ``ivy.with_backend`` call which would otherwise build a package.
+        Default is ``1``.
+
+    Examples
+    --------
+    >>> ivy.utils.backend.prebuild_backend("numpy", num=2)
+    >>> ivy_np = ivy.with_backend("numpy", cached=False)
+    >>> print(ivy.utils.backend.with_backend_build_info()["pool"])
+    {'numpy': 1}
+    """
+    for _ in range(num):
+        _prebuilt_backends.setdefault(backend, []).append(_build_local_ivy(backend))
+
+
+def with_backend_build_info():
+    """
+    Return timing information about the local ivy packages built by
+    ``ivy.with_backend`` and ``ivy.utils.backend.prebuild_backend``.
+
+    Returns
+    -------
+    ret
+        a dict with the ``(backend, seconds)`` of every build so far as ``builds``,
+        the number of prebuilt packages left per backend as ``pool``, and the
+        ``hits`` and ``misses`` of the on-disk cache of the transformed ivy modules
+        as ``module_cache``.
+    """
+    return {
+        "builds": list(_with_backend_build_times),
+        "pool": {k: len(v) for k, v in _prebuilt_backends.items()},
+        "module_cache": dict(_importlib.ast_helpers._compiled_modules_cache_stats),
+    }
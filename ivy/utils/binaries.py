@@ -1,9 +1,6 @@
 import os
 import logging
 import json
-from pip._vendor.packaging import tags
-from urllib import request
-from tqdm import tqdm
 
 
 def _get_paths_from_binaries(binaries, root_dir=""):
@@ -58,6 +55,12 @@ def check_for_binaries():
 
 
 def cleanup_and_fetch_binaries(clean=True):
+    # imported here as these are only needed to fetch the binaries, and are slow
+    # to import on every `import ivy`
+    from pip._vendor.packaging import tags
+    from urllib import request
+    from tqdm import tqdm
+
     folder_path = os.sep.join(__file__.split(os.sep)[:-3])
     binaries_path = os.path.join(folder_path, "binaries.json")
     available_configs_path = os.path.join(folder_path, "available_configs.json")
@@ -0,0 +1,71 @@
+"""Stacks of ivy's global modes which are local to each thread and asyncio task."""
+
+# global
+import copy
+import contextvars
+from collections.abc import MutableSequence
+
+
+class ContextStack(MutableSequence):
+    """
+    A stack whose items are local to the current thread or asyncio task.
+
+    The items are stored as a tuple in a ``contextvars.ContextVar``, which is
+    replaced on every update. A new thread therefore starts with an empty stack,
+    an asyncio task starts with the items of the task which created it, and neither
+    sees the updates made by the other afterwards.
+    """
+
+    def __init__(self, name):
+        self._var = contextvars.ContextVar(name, default=())
+
+    def __getitem__(self, index):
+        items = self._var.get()
+        return list(items[index]) if isinstance(index, slice) else items[index]
+
+    def __setitem__(self, index, value):
+        items = list(self._var.get())
+        items[index] = value
+        self._var.set(tuple(items))
+
+    def __delitem__(self, index):
+        items = list(self._var.get())
+        del items[index]
+        self._var.set(tuple(items))
+
+    def __len__(self):
+        return len(self._var.get())
+
+    def __iter__(self):
+        return iter(self._var.get())
+
+    def insert(self, index, value):
+        items = list(self._var.get())
+        items.insert(index, value)
+        self._var.set(tuple(items))
+
+    def append(self, value):
+        self._var.set(self._var.get() + (value,))
+
+    def pop(self, index=-1):
+        items = list(self._var.get())
+        value = items.pop(index)
+        self._var.set(tuple(items))
+        return value
+
+    def clear(self):
+        self._var.set(())
+
+    def __eq__(self, other):
+        if isinstance(other, ContextStack):
+            other = list(other)
+        return list(self._var.get()) == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self._var.get()))
+
+    def __deepcopy__(self, memo):
+        # a copy is a snapshot of the current items, which isn't tied to any context
+        return copy.deepcopy(list(self._var.get()), memo)
@@ -0,0 +1,364 @@
+"""
+Prefetching data loader, producing batches as ivy Containers.
+
+Batches are loaded by worker processes, which collate the samples of each batch into
+numpy arrays written to shared memory, so that only their layout is sent back over
+the result queue. A pipeline thread in the main process reorders the batches, copies
+them onto the target device and keeps up to ``prefetch_depth`` batches ready ahead of
+the training loop.
+"""
+
+import collections
+import contextvars
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+from collections.abc import Mapping
+
+import numpy as np
+
+import ivy
+from ivy.utils.shared_memory import from_shared_memory, to_shared_memory
+
+# how often the pipeline checks that the workers are alive while waiting for batches
+_RESULT_POLL_SECONDS = 1.0
+
+
+def _collate(samples):
+    # stack the leaves of a list of samples, which are (nested) mappings or arrays
+    if isinstance(samples[0], Mapping):
+        return {k: _collate([s[k] for s in samples]) for k in samples[0].keys()}
+    return np.stack([np.asarray(s) for s in samples])
+
+
+def _worker_loop(dataset, collate_fn, index_queue, result_queue):
+    while True:
+        task = index_queue.get()
+        if task is None:
+            return
+        batch_idx, indices = task
+        start = time.perf_counter()
+        try:
+            batch = collate_fn([dataset[i] for i in indices])
+            handle = to_shared_memory(batch)
+            result_queue.put((batch_idx, handle, time.perf_counter() - start, None))
+        except Exception:
+            result_queue.put((batch_idx, None, 0.0, traceback.format_exc()))
+
+
+class DataLoader:
+    """
+    Iterate over a dataset in batches of ivy Containers, loaded in the background.
+
+    The dataset is indexed with integers, and returns samples which are (nested)
+    mappings of arrays or scalars, or arrays. The samples of each batch are collated
+    into numpy arrays by stacking them, then copied onto ``device`` as ivy arrays,
+    giving batches which are Containers, or arrays if the samples are arrays.
+
+    Loading, by the worker processes or by the pipeline thread when ``num_workers``
+    is ``0``, and the copy onto the device both run ahead of the iteration, with up
+    to ``prefetch_depth`` batches ready or in flight at any time. The time spent in
+    each stage is reported by ``stats``.
+
+    Example
+    -------
+        with DataLoader(dataset, batch_size=32, shuffle=True, num_workers=4) as loader:
+            for epoch in range(num_epochs):
+                for batch in loader:
+                    train_step(batch)
+        print(loader.stats())
+    """
+
+    def __init__(
+        self,
+        dataset,
+        /,
+        *,
+        batch_size=1,
+        shuffle=False,
+        seed=0,
+        drop_last=False,
+        num_workers=0,
+        prefetch_depth=2,
+        device=None,
+        collate_fn=None,
+        mp_context=None,
+    ):
+        """
+        Create a data loader over a dataset.
+
+        Parameters
+        ----------
+        dataset
+            The dataset to load, supporting ``len`` and indexing with integers.
+        batch_size
+            The number of samples per batch. Default is ``1``.
+        shuffle
+            Whether to shuffle the samples at the start of each epoch. Default is
+            ``False``.
+        seed
+            The seed of the shuffling, the order of the samples only depends on the
+            seed and the epoch. Default is ``0``.
+        drop_last
+            Whether to drop the last batch if it is smaller than ``batch_size``.
+            Default is ``False``.
+        num_workers
+            The number of worker processes to load batches with. Default is ``0``,
+            which loads the batches from the pipeline thread of the main process.
+        prefetch_depth
+            The number of batches to load ahead of the iteration, per worker when
+            using worker processes. Default is ``2``.
+        device
+            The device to copy the batches to. Default is ``None``, which uses the
+            default device.
+        collate_fn
+            The function collating a list of samples into a batch of numpy arrays,
+            which must be picklable when using worker processes. Default stacks the
+            leaves of the samples.
+        mp_context
+            The multiprocessing start method of the workers. Default is ``None``,
+            which uses the default start method of the platform.
+        """
+        ivy.utils.assertions.check_greater(
+            batch_size, 0, message="batch_size must be positive", as_array=False
+        )
+        ivy.utils.assertions.check_greater(
+            prefetch_depth, 0, message="prefetch_depth must be positive", as_array=False
+        )
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.drop_last = drop_last
+        self.num_workers = num_workers
+        self.prefetch_depth = prefetch_depth
+        self.device = device
+        self.collate_fn = ivy.default(collate_fn, _collate)
+        self._mp_context = multiprocessing.get_context(mp_context)
+        self._epoch = 0
+        self._workers = []
+        self._index_queues = []
+        self._result_queue = None
+        self._stats = collections.defaultdict(lambda: [0, 0.0])
+
+    def __len__(self):
+        if self.drop_last:
+            return len(self.dataset) // self.batch_size
+        return -(-len(self.dataset) // self.batch_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "_workers", None):
+            self.close()
+
+    def __iter__(self):
+        batches = self._batch_indices(self._epoch)
+        self._epoch += 1
+        depth = self.prefetch_depth * max(self.num_workers, 1)
+        ready = queue.Queue(depth)
+        stop = threading.Event()
+        # the caller's context is copied into the pipeline thread, so that the
+        # context-local default device and dtype apply to the batches it creates
+        ctx = contextvars.copy_context()
+        thread = threading.Thread(
+            target=ctx.run, args=(self._pipeline, batches, ready, stop), daemon=True
+        )
+        thread.start()
+        try:
+            for _ in range(len(batches)):
+                start = time.perf_counter()
+                batch, error = ready.get()
+                self._record("wait", time.perf_counter() - start)
+                if error is not None:
+                    raise ivy.utils.exceptions.IvyException(
+                        f"loading a batch failed with:\n{error}"
+                    )
+                yield batch
+        finally:
+            stop.set()
+            # unblock the pipeline thread, and release the batches left over
+            while thread.is_alive():
+                try:
+                    ready.get(timeout=0.01)
+                except queue.Empty:
+                    pass
+
+    def stats(self):
+        """
+        Get the throughput of each stage of the pipeline.
+
+        The ``load`` stage is the time spent loading and collating batches, summed
+        over the workers, ``transfer`` is the time spent copying the batches onto the
+        device, and ``wait`` is the time the iteration spent waiting for batches.
+
+        Returns
+        -------
+        ret
+            A dict mapping each stage to a dict with the number of ``batches``, the
+            ``seconds`` spent, and the ``batches_per_second`` of the stage.
+        """
+        return {
+            stage: {
+                "batches": count,
+                "seconds": seconds,
+                "batches_per_second": count / seconds if seconds else float("inf"),
+            }
+            for stage, (count, seconds) in self._stats.items()
+        }
+
+    def close(self):
+        """Stop the worker processes."""
+        for index_queue in self._index_queues:
+            index_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        # release the shared memory of the batches loaded but never collected
+        while self._result_queue is not None:
+            try:
+                _, handle, _, _ = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if handle is not None:
+                handle.release()
+        self._workers = []
+        self._index_queues = []
+        self._result_queue = None
+
+    def _record(self, stage, seconds):
+        entry = self._stats[stage]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def _batch_indices(self, epoch):
+        indices = np.arange(len(self.dataset))
+        if self.shuffle:
+            np.random.default_rng((self.seed, epoch)).shuffle(indices)
+        return [
+            indices[i * self.batch_size : (i + 1) * self.batch_size]
+            for i in range(len(self))
+        ]
+
+    def _start_workers(self):
+        if self._workers:
+            return
+        self._result_queue = self._mp_context.Queue()
+        for _ in range(self.num_workers):
+            index_queue = self._mp_context.Queue()
+            worker = self._mp_context.Process(
+                target=_worker_loop,
+                args=(self.dataset, self.collate_fn, index_queue, self._result_queue),
+                daemon=True,
+            )
+            worker.start()
+            self._index_queues.append(index_queue)
+            self._workers.append(worker)
+
+    def _to_device(self, batch):
+        start = time.perf_counter()
+        if isinstance(batch, Mapping):
+            ret = ivy.Container(batch).cont_map(
+                lambda x, _: ivy.asarray(x, copy=True, device=self.device)
+            )
+        else:
+            ret = ivy.asarray(batch, copy=True, device=self.device)
+        self._record("transfer", time.perf_counter() - start)
+        return ret
+
+    def _put(self, ready, stop, item):
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _pipeline(self, batches, ready, stop):
+        try:
+            if self.num_workers:
+                self._pipeline_from_workers(batches, ready, stop)
+                return
+            for indices in batches:
+                start = time.perf_counter()
+                batch = self.collate_fn([self.dataset[i] for i in indices])
+                self._record("load", time.perf_counter() - start)
+                if not self._put(ready, stop, (self._to_device(batch), None)):
+                    return
+        except Exception:
+            self._put(ready, stop, (None, traceback.format_exc()))
+
+    def _pipeline_from_workers(self, batches, ready, stop):
+        self._start_workers()
+        depth = self.prefetch_depth * self.num_workers
+        next_to_send = 0
+        next_to_yield = 0
+        pending = {}
+
+        def _send():
+            nonlocal next_to_send
+            worker = next_to_send % self.num_workers
+            self._index_queues[worker].put((next_to_send, batches[next_to_send]))
+            next_to_send += 1
+
+        while next_to_send < min(depth, len(batches)):
+            _send()
+        while next_to_yield < len(batches):
+            while next_to_yield not in pending:
+                try:
+                    batch_idx, handle, seconds, error = self._get_result()
+                except Exception:
+                    # the batches in flight never arrive, only the ones loaded are
+                    # released
+                    self._drain(0, pending)
+                    raise
+                pending[batch_idx] = (handle, seconds, error)
+            handle, seconds, error = pending.pop(next_to_yield)
+            next_to_yield += 1
+            if next_to_send < len(batches):
+                _send()
+            if error is not None:
+                self._put(ready, stop, (None, error))
+                self._drain(next_to_send - next_to_yield, pending)
+                return
+            self._record("load", seconds)
+            batch = self._to_device(from_shared_memory(handle))
+            if stop.is_set() or not self._put(ready, stop, (batch, None)):
+                self._drain(next_to_send - next_to_yield, pending)
+                return
+
+    def _get_result(self):
+        # the result queue is polled, as a worker which died, killed or crashing in
+        # native code, never puts the batches it was sent
+        while True:
+            try:
+                return self._result_queue.get(timeout=_RESULT_POLL_SECONDS)
+            except queue.Empty:
+                pass
+            for i, worker in enumerate(self._workers):
+                if not worker.is_alive():
+                    self.close()
+                    raise ivy.utils.exceptions.IvyException(
+                        f"data loader worker {i} (pid {worker.pid}) exited"
+                        f" unexpectedly with exit code {worker.exitcode}"
+                    )
+
+    def _drain(self, num_in_flight, pending):
+        # release the shared memory of the batches loaded but not yielded
+        try:
+            for _ in range(num_in_flight - len(pending)):
+                batch_idx, handle, _, _ = self._get_result()
+                pending[batch_idx] = (handle, 0.0, None)
+        finally:
+            for handle, _, _ in pending.values():
+                if handle is not None:
+                    handle.release()
+            pending.clear()
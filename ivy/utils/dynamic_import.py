@@ -1,6 +1,8 @@
 # NOQA
 import ivy
 from importlib import import_module as builtin_import
+from importlib.util import find_spec
+import types
 
 
 def import_module(name, package=None):
@@ -8,3 +10,53 @@ def import_module(name, package=None):
         with ivy.utils._importlib.LocalIvyImporter():
             return ivy.utils._importlib._import_module(name=name, package=package)
     return builtin_import(name=name, package=package)
+
+
+class LazyModule(types.ModuleType):
+    """Module which is only imported on its first attribute access."""
+
+    def __init__(self, name, on_import=None):
+        super().__init__(name)
+        self._on_import = on_import
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = builtin_import(self.__name__)
+            if self._on_import is not None:
+                self._on_import(self._module)
+        return self._module
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name, on_import=None):
+    """
+    Defer the import of a module until one of its attributes is accessed.
+
+    Parameters
+    ----------
+    name
+        the name of the module to import.
+    on_import
+        optional callable run on the imported module right after its import.
+
+    Returns
+    -------
+    ret
+        a module proxy importing ``name`` on first use, or ``None`` if the module
+        is not installed.
+
+    Examples
+    --------
+    >>> json = ivy.utils.lazy_import("json")
+    >>> json.dumps([1, 2])
+    '[1, 2]'
+    """
+    if find_spec(name) is None:
+        return None
+    return LazyModule(name, on_import=on_import)
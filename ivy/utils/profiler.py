@@ -2,6 +2,15 @@ import cProfile
 import pstats
 import subprocess
 import logging
+import collections
+import functools
+import json
+import math
+import os
+import re
+import threading
+import time
+import types
 from tempfile import NamedTemporaryFile
 from importlib.util import find_spec
 
@@ -54,3 +63,288 @@ class Profiler(cProfile.Profile):
 
             if self.print_stats:
                 stats.print_stats()
+
+
+class OpProfiler:
+    """
+    A profiler recording every call of the ivy functions in the namespace.
+
+    While the profiler is running, the functions in the ivy namespace are replaced by
+    versions wrapped with ``_wrap_function`` around a timed backend kernel, so that
+    the time spent in the ivy wrappers can be told apart from the time spent in the
+    kernel. The namespace is restored when the profiler stops, hence there is no
+    cost once it is not running.
+
+    For each call, the wall time, the kernel time, and the shapes and dtypes of the
+    input and output arrays are recorded. The results can be aggregated per function
+    with ``stats`` and ``table``, or written as a Chrome trace with
+    ``export_chrome_trace``, which can be opened in ``chrome://tracing`` or Perfetto.
+
+    Attributes
+    ----------
+        ops (Iterable[str], optional): the names of the functions to profile. All
+        the functions in the ivy namespace are profiled by default. Profiling fewer
+        functions also avoids counting the profiling overhead of the functions called
+        by the wrappers of the profiled ones.
+
+    Example
+    -------
+        with OpProfiler() as prof:
+            fn(x, y)
+        print(prof.table())
+        prof.export_chrome_trace("trace.json")
+    """
+
+    def __init__(self, ops=None):
+        self.ops = None if ops is None else set(ops)
+        self.events = []
+        self._local = threading.local()
+        self._replaced = {}
+        self._start_ns = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        """Instrument the functions in the ivy namespace and start recording."""
+        if self._replaced:
+            return
+        import ivy
+
+        self._start_ns = time.perf_counter_ns()
+        original_dict = ivy.utils.backend.handler.ivy_original_dict
+        for name, fn in list(ivy.__dict__.items()):
+            if not _is_wrapped(fn) or (self.ops is not None and name not in self.ops):
+                continue
+            kernel = self._time_kernel(_unwrap_ivy_wrappers(fn))
+            original = original_dict.get(name, fn)
+            if not _is_wrapped(original):
+                original = fn
+            instrumented = self._profile_op(
+                name, ivy.func_wrapper._wrap_function(name, kernel, original)
+            )
+            self._replaced[name] = (fn, instrumented)
+            ivy.__dict__[name] = instrumented
+
+    def stop(self):
+        """Stop recording and restore the functions in the ivy namespace."""
+        import ivy
+
+        for name, (fn, instrumented) in self._replaced.items():
+            # functions replaced since, e.g. by setting another backend, are kept
+            if ivy.__dict__.get(name) is instrumented:
+                ivy.__dict__[name] = fn
+        self._replaced = {}
+
+    def _frames(self):
+        try:
+            return self._local.frames
+        except AttributeError:
+            self._local.frames = []
+            return self._local.frames
+
+    def _time_kernel(self, fn):
+        @functools.wraps(fn)
+        def _kernel(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                frames = self._frames()
+                if frames:
+                    frame = frames[-1]
+                    if frame[0] is None:
+                        frame[0] = start
+                    frame[1] += time.perf_counter_ns() - start
+
+        return _kernel
+
+    def _profile_op(self, name, fn):
+        @functools.wraps(fn)
+        def _profiled(*args, **kwargs):
+            frames = self._frames()
+            # start and duration of the kernel calls, filled in by _time_kernel
+            frame = [None, 0]
+            frames.append(frame)
+            start = time.perf_counter_ns()
+            try:
+                ret = fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter_ns()
+                frames.pop()
+            self.events.append(
+                (
+                    name,
+                    start,
+                    end - start,
+                    frame[0],
+                    frame[1],
+                    threading.get_ident(),
+                    _array_specs((*args, *kwargs.values())),
+                    _array_specs(ret if isinstance(ret, (tuple, list)) else (ret,)),
+                )
+            )
+            return ret
+
+        return _profiled
+
+    def stats(self):
+        """
+        Aggregate the recorded calls per function.
+
+        Returns
+        -------
+        ret
+            A dict mapping each function name to a dict with the number of
+            ``calls``, the ``total_time``, ``kernel_time`` and ``wrapper_time`` in
+            seconds, the ``bytes`` of the arrays returned, and a ``Counter`` of the
+            ``inputs`` shapes and dtypes.
+        """
+        stats = {}
+        for name, _, dur, _, kernel_dur, _, inputs, outputs in self.events:
+            entry = stats.setdefault(
+                name,
+                {
+                    "calls": 0,
+                    "total_time": 0.0,
+                    "kernel_time": 0.0,
+                    "wrapper_time": 0.0,
+                    "bytes": 0,
+                    "inputs": collections.Counter(),
+                },
+            )
+            entry["calls"] += 1
+            entry["total_time"] += dur / 1e9
+            entry["kernel_time"] += kernel_dur / 1e9
+            entry["wrapper_time"] += (dur - kernel_dur) / 1e9
+            entry["bytes"] += sum(
+                math.prod(d or 0 for d in shape) * _dtype_nbytes(dtype)
+                for shape, dtype in outputs
+            )
+            entry["inputs"][inputs] += 1
+        return stats
+
+    def table(self, sort_by="total_time", limit=None):
+        """
+        Format the aggregated stats as a table, with one row per function.
+
+        Parameters
+        ----------
+        sort_by
+            The stat to sort the rows by, in descending order.
+        limit
+            The maximum number of rows to include. Includes all rows by default.
+
+        Returns
+        -------
+        ret
+            The table as a string.
+        """
+        stats = sorted(
+            self.stats().items(), key=lambda item: item[1][sort_by], reverse=True
+        )[:limit]
+        rows = [
+            f"{'function':<32}{'calls':>8}{'total (ms)':>12}{'kernel (ms)':>13}"
+            f"{'wrapper (ms)':>14}{'bytes':>12}  most common inputs"
+        ]
+        for name, entry in stats:
+            inputs = entry["inputs"].most_common(1)[0][0]
+            rows.append(
+                f"{name:<32}{entry['calls']:>8}{entry['total_time'] * 1e3:>12.3f}"
+                f"{entry['kernel_time'] * 1e3:>13.3f}"
+                f"{entry['wrapper_time'] * 1e3:>14.3f}{entry['bytes']:>12}  "
+                + ", ".join(f"{dtype}{list(shape)}" for shape, dtype in inputs)
+            )
+        return "\n".join(rows)
+
+    def export_chrome_trace(self, path):
+        """
+        Write the recorded calls as a Chrome trace JSON file, with one event per call
+        and a nested event for the time spent in the backend kernel.
+
+        Parameters
+        ----------
+        path
+            The path of the file to write the trace to.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for (
+            name,
+            start,
+            dur,
+            kernel_start,
+            kernel_dur,
+            tid,
+            inputs,
+            outputs,
+        ) in self.events:
+            trace_events.append(
+                {
+                    "name": name,
+                    "cat": "op",
+                    "ph": "X",
+                    "ts": (start - self._start_ns) / 1e3,
+                    "dur": dur / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {
+                        "inputs": [f"{dtype}{list(shape)}" for shape, dtype in inputs],
+                        "outputs": [
+                            f"{dtype}{list(shape)}" for shape, dtype in outputs
+                        ],
+                    },
+                }
+            )
+            if kernel_start is not None:
+                trace_events.append(
+                    {
+                        "name": f"{name} (kernel)",
+                        "cat": "kernel",
+                        "ph": "X",
+                        "ts": (kernel_start - self._start_ns) / 1e3,
+                        "dur": kernel_dur / 1e3,
+                        "pid": pid,
+                        "tid": tid,
+                    }
+                )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+def _is_wrapped(fn):
+    import ivy
+
+    return isinstance(fn, types.FunctionType) and any(
+        hasattr(fn, attr) for attr in ivy.func_wrapper.FN_DECORATORS
+    )
+
+
+def _unwrap_ivy_wrappers(fn):
+    # only the ivy wrappers are removed, decorators of the backend function are kept
+    while _is_wrapped(fn) and hasattr(fn, "__wrapped__"):
+        fn = fn.__wrapped__
+    return fn
+
+
+def _array_specs(values):
+    # the shapes and dtypes of the arrays, read from their attributes directly as
+    # calling ivy functions here would record them as well
+    import ivy
+
+    return tuple(
+        (tuple(x.shape), str(x.dtype))
+        for x in values
+        if isinstance(x, (ivy.Array, ivy.NativeArray))
+    )
+
+
+def _dtype_nbytes(dtype):
+    if "bool" in dtype:
+        return 1
+    bits = re.search(r"\d+", dtype)
+    return int(bits.group()) // 8 if bits else 0
@@ -0,0 +1,151 @@
+"""
+Zero-copy transport of nested numpy arrays between processes.
+
+The sender writes the array leaves of a nest into one shared memory block and sends
+the small, picklable ``SharedMemoryHandle`` describing it, and the receiver rebuilds
+the nest from numpy arrays viewing the block, without copying or pickling the data.
+"""
+
+import ctypes
+from collections.abc import Mapping
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+class _SharedArray:
+    # exposes an array in a shared memory block through the array interface, so that
+    # the numpy arrays built from it keep the block mapped for as long as they live
+    def __init__(self, shm, address, shape, typestr):
+        self._shm = shm
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": typestr,
+            "data": (address, False),
+            "version": 3,
+        }
+
+
+def _flatten(nest, path=()):
+    if isinstance(nest, Mapping):
+        for k, v in nest.items():
+            yield from _flatten(v, path + (k,))
+    else:
+        yield path, nest
+
+
+def _unflatten(leaves):
+    nest = {}
+    for path, value in leaves:
+        if not path:
+            # the nest is a single leaf rather than a mapping
+            return value
+        d = nest
+        for key in path[:-1]:
+            d = d.setdefault(key, {})
+        d[path[-1]] = value
+    return nest
+
+
+class SharedMemoryHandle:
+    """
+    Picklable description of a nest whose array leaves are in shared memory.
+
+    The handle is created by ``to_shared_memory`` and consumed by
+    ``from_shared_memory``, which unlinks the shared memory block, so it can only
+    be loaded once. A handle which is not going to be loaded should be released.
+    """
+
+    def __init__(self, name, leaves):
+        self.name = name
+        # (path, (shape, dtype, offset), None) for the array leaves, in the block,
+        # and (path, None, value) for the other leaves, pickled along with the handle
+        self.leaves = leaves
+
+    def release(self):
+        """Free the shared memory block without loading the nest."""
+        shm = shared_memory.SharedMemory(name=self.name)
+        shm.close()
+        shm.unlink()
+
+
+def to_shared_memory(nest):
+    """
+    Copy the array leaves of a nest into a new shared memory block.
+
+    Parameters
+    ----------
+    nest
+        A (nested) mapping, such as a dict or an ivy Container, with numpy arrays
+        and picklable values as leaves, or a single numpy array.
+
+    Returns
+    -------
+    ret
+        The handle describing the nest, to send to the receiving process.
+
+    The block is not tracked by the resource tracker of this process, which would
+    otherwise unlink it when this process exits, before it is loaded. A handle which
+    is not loaded with ``from_shared_memory`` must therefore be released with
+    ``SharedMemoryHandle.release``, or its block is leaked until the system restarts.
+    """
+    leaves = []
+    arrays = []
+    size = 0
+    for path, leaf in _flatten(nest):
+        # arrays of python objects only hold pointers into this process, so they are
+        # pickled along with the handle like the other leaves
+        if not isinstance(leaf, np.ndarray) or leaf.dtype.hasobject:
+            leaves.append((path, None, leaf))
+            continue
+        leaf = np.ascontiguousarray(leaf)
+        # align every array to 64 bytes, as the receiving backend may expect
+        size = -(-size // 64) * 64
+        leaves.append((path, (leaf.shape, leaf.dtype.str, size), None))
+        arrays.append((leaf, size))
+        size += leaf.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    # the block outlives this process's handle to it, and is unlinked by the receiver
+    resource_tracker.unregister(shm._name, "shared_memory")
+    for leaf, offset in arrays:
+        np.ndarray(leaf.shape, leaf.dtype, buffer=shm.buf, offset=offset)[...] = leaf
+    shm.close()
+    return SharedMemoryHandle(shm.name, leaves)
+
+
+def from_shared_memory(handle):
+    """
+    Rebuild a nest from the handle created by ``to_shared_memory``.
+
+    The array leaves are numpy arrays viewing the shared memory block, which stays
+    mapped until all of them are deleted. The block is unlinked, so the handle can't
+    be loaded again.
+
+    Parameters
+    ----------
+    handle
+        The handle describing the nest.
+
+    Returns
+    -------
+    ret
+        The nest, as (nested) dicts if it was a mapping.
+    """
+    shm = shared_memory.SharedMemory(name=handle.name)
+    shm.unlink()
+    # take the address of the block without keeping a buffer exported from it, so
+    # that the block is unmapped once the last array viewing it is deleted
+    c_buf = ctypes.c_char.from_buffer(shm.buf)
+    address = ctypes.addressof(c_buf)
+    del c_buf
+    return _unflatten(
+        (
+            path,
+            (
+                value
+                if spec is None
+                else np.asarray(_SharedArray(shm, address + spec[2], spec[0], spec[1]))
+            ),
+        )
+        for path, spec, value in handle.leaves
+    )
@@ -0,0 +1,360 @@
+"""
+Tensor store, a checkpoint format of raw array buffers described by a json header.
+
+Each file of a store starts with the length of its header as an 8 byte little-endian
+integer, followed by the json header and the array buffers, each aligned to 64 bytes.
+The header maps the key-chain of each array to its ``dtype``, ``shape`` and the
+``data_offsets`` of its buffer, relative to the end of the header, which is padded
+with spaces so that the buffers start aligned. Large stores are split into shards,
+written in parallel, and listed by an index file holding no arrays.
+
+Reading memory-maps the files, so that each array is only read from disk when it is
+loaded, and the arrays of a numpy store can be used without copying them.
+"""
+
+import concurrent.futures
+import json
+import os
+import struct
+import time
+from collections.abc import Mapping
+
+import numpy as np
+
+import ivy
+
+_ALIGNMENT = 64
+_FORMAT = "ivy_tensor_store"
+_VERSION = 1
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _flatten(nest, path=()):
+    if isinstance(nest, Mapping):
+        for k, v in nest.items():
+            yield from _flatten(v, path + (k,))
+    else:
+        yield "/".join(path), nest
+
+
+def _unflatten(items):
+    nest = {}
+    for key, value in items:
+        d = nest
+        *keys, last = key.split("/")
+        for k in keys:
+            d = d.setdefault(k, {})
+        d[last] = value
+    return nest
+
+
+def _to_buffer(x):
+    # the numpy array holding the bytes of an array, and the dtype to restore
+    dtype = ivy.as_ivy_dtype(x.dtype) if ivy.is_array(x) else str(np.asarray(x).dtype)
+    if dtype == "bfloat16":
+        # numpy has no bfloat16, whose bits are the upper half of the float32 bits
+        x = ivy.to_numpy(ivy.astype(x, "float32"))
+        return (x.view(np.uint32) >> 16).astype(np.uint16), dtype
+    x = ivy.to_numpy(x) if ivy.is_array(x) else np.asarray(x)
+    # unlike ascontiguousarray, asarray keeps the shape of 0-d arrays
+    return np.asarray(x, order="C"), dtype
+
+
+def _from_buffer(buffer, dtype, shape):
+    buffer = np.asarray(buffer)
+    if dtype == "bfloat16":
+        x = (buffer.view(np.uint16).astype(np.uint32) << 16).view(np.float32)
+        return x.reshape(shape), dtype
+    return buffer.view(np.dtype(dtype)).reshape(shape), None
+
+
+def _header_bytes(header):
+    header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    padded = _aligned(8 + len(header)) - 8
+    return struct.pack("<Q", padded) + header.ljust(padded, b" ")
+
+
+def _write_file(path, entries, metadata):
+    # entries are (key, buffer, dtype), written one after the other
+    header = {"__metadata__": metadata}
+    offset = 0
+    for key, buffer, dtype in entries:
+        offset = _aligned(offset)
+        header[key] = {
+            "dtype": dtype,
+            "shape": list(buffer.shape),
+            "data_offsets": [offset, offset + buffer.nbytes],
+        }
+        offset += buffer.nbytes
+    with open(path, "wb") as f:
+        f.write(_header_bytes(header))
+        start = f.tell()
+        for key, buffer, _ in entries:
+            f.seek(start + header[key]["data_offsets"][0])
+            # writing a memoryview releases the GIL, letting shards be written in
+            # parallel
+            f.write(memoryview(buffer.reshape(-1)).cast("B"))
+        f.truncate(start + offset)
+
+
+def _read_header(path):
+    with open(path, "rb") as f:
+        (length,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(length))
+    metadata = header.pop("__metadata__", {})
+    if metadata.get("format") != _FORMAT:
+        raise ivy.utils.exceptions.IvyException(f"{path} is not a tensor store")
+    return header, metadata, 8 + length
+
+
+def _shard_path(path, i, num_shards):
+    root, ext = os.path.splitext(path)
+    return f"{root}-{i + 1:05d}-of-{num_shards:05d}{ext}"
+
+
+def _bandwidth(num_bytes, seconds):
+    return {
+        "bytes": num_bytes,
+        "seconds": seconds,
+        "bytes_per_second": num_bytes / seconds if seconds else float("inf"),
+    }
+
+
+def save_tensor_store(nest, path, /, *, shard_size=2**30, num_workers=None):
+    """
+    Save the arrays of a nest as a tensor store.
+
+    Parameters
+    ----------
+    nest
+        A (nested) mapping, such as a dict or an ivy Container, with arrays as leaves.
+        Numbers and numpy arrays are saved as arrays too.
+    path
+        The file to save the store to. If the store is split into several shards,
+        the shards are saved next to it, with the shard number appended to their
+        name, and ``path`` is the index listing them.
+    shard_size
+        The number of bytes of arrays after which to start a new shard, an array
+        larger than it being a shard of its own. Default is ``2**30``. ``None``
+        saves all the arrays in a single file.
+    num_workers
+        The number of threads writing the shards in parallel. Default is ``None``,
+        which uses up to one thread per CPU.
+
+    Returns
+    -------
+    ret
+        A dict with the ``bytes`` saved, the ``seconds`` it took and the
+        ``bytes_per_second`` of the saving.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3])})
+    >>> stats = save_tensor_store(x, "weights.ivyt")
+    >>> load_tensor_store("weights.ivyt")
+    {
+        a: ivy.array([1., 2.]),
+        b: {
+            c: ivy.array([3])
+        }
+    }
+    """
+    start = time.perf_counter()
+    shards = [[]]
+    shard_bytes = 0
+    for key, leaf in _flatten(nest):
+        buffer, dtype = _to_buffer(leaf)
+        if (
+            shard_size is not None
+            and shards[-1]
+            and shard_bytes + buffer.nbytes > (shard_size)
+        ):
+            shards.append([])
+            shard_bytes = 0
+        shards[-1].append((key, buffer, dtype))
+        shard_bytes += buffer.nbytes
+    metadata = {"format": _FORMAT, "version": _VERSION}
+    dirname = os.path.dirname(path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    if len(shards) == 1:
+        _write_file(path, shards[0], metadata)
+    else:
+        paths = [_shard_path(path, i, len(shards)) for i in range(len(shards))]
+        with concurrent.futures.ThreadPoolExecutor(
+            min(len(shards), num_workers or os.cpu_count() or 1)
+        ) as executor:
+            for future in [
+                executor.submit(_write_file, p, entries, metadata)
+                for p, entries in zip(paths, shards)
+            ]:
+                future.result()
+        _write_file(
+            path, [], dict(metadata, shards=[os.path.basename(p) for p in paths])
+        )
+    num_bytes = sum(buffer.nbytes for entries in shards for _, buffer, _ in entries)
+    return _bandwidth(num_bytes, time.perf_counter() - start)
+
+
+class TensorStore:
+    """
+    Lazy reader of a tensor store saved by ``save_tensor_store``.
+
+    The files of the store are memory-mapped when it is opened, and an array is only
+    read when it is loaded. The time spent loading arrays is reported by ``stats``.
+
+    Example
+    -------
+        store = TensorStore("weights.ivyt")
+        w = store.load("layer0/w")
+        print(store.stats())
+    """
+
+    def __init__(self, path, /):
+        """
+        Open a tensor store.
+
+        Parameters
+        ----------
+        path
+            The file the store was saved to.
+        """
+        header, metadata, data_start = _read_header(path)
+        files = [(path, header, data_start)]
+        for shard in metadata.get("shards", []):
+            shard_path = os.path.join(os.path.dirname(path), shard)
+            shard_header, _, shard_data_start = _read_header(shard_path)
+            files.append((shard_path, shard_header, shard_data_start))
+        self.path = path
+        self._entries = {}
+        for file_path, file_header, file_data_start in files:
+            if not file_header:
+                continue
+            # copy-on-write, so that the arrays viewing the file can be modified
+            # without modifying it
+            mmap = np.memmap(file_path, dtype=np.uint8, mode="c")
+            for key, entry in file_header.items():
+                self._entries[key] = (mmap, file_data_start, entry)
+        self._stats = [0, 0.0]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def keys(self):
+        """Get the key-chains of the arrays in the store, in the order they were
+        saved."""
+        return list(self._entries)
+
+    def shape(self, key, /):
+        """Get the shape of an array in the store without loading it."""
+        return tuple(self._entries[key][2]["shape"])
+
+    def dtype(self, key, /):
+        """Get the dtype of an array in the store without loading it."""
+        return self._entries[key][2]["dtype"]
+
+    def load(self, key, /, *, device=None, to_ivy=True):
+        """
+        Load an array of the store.
+
+        Parameters
+        ----------
+        key
+            The key-chain of the array.
+        device
+            The device to load the array onto. Default is ``None``, which uses the
+            default device.
+        to_ivy
+            Whether to return an ivy array, rather than the numpy array viewing the
+            memory-mapped file. Default is ``True``.
+
+        Returns
+        -------
+        ret
+            The array.
+        """
+        if key not in self._entries:
+            raise ivy.utils.exceptions.IvyException(
+                f"{key} is not in the tensor store {self.path}"
+            )
+        start = time.perf_counter()
+        mmap, data_start, entry = self._entries[key]
+        begin, end = entry["data_offsets"]
+        x, dtype = _from_buffer(
+            mmap[data_start + begin : data_start + end], entry["dtype"], entry["shape"]
+        )
+        if to_ivy:
+            x = ivy.asarray(x, device=device)
+            if dtype is not None:
+                x = ivy.astype(x, dtype)
+        self._stats[0] += end - begin
+        self._stats[1] += time.perf_counter() - start
+        return x
+
+    def to_container(self, *, prefix=None, device=None):
+        """
+        Load all the arrays of the store.
+
+        Parameters
+        ----------
+        prefix
+            If given, only load the arrays under this key-chain, relative to it.
+            Default is ``None``, which loads all the arrays.
+        device
+            The device to load the arrays onto. Default is ``None``, which uses the
+            default device.
+
+        Returns
+        -------
+        ret
+            The container of the arrays, nested by their key-chains.
+        """
+        start = "" if prefix is None else prefix + "/"
+        return ivy.Container(
+            _unflatten(
+                (key[len(start) :], self.load(key, device=device))
+                for key in self._entries
+                if key.startswith(start)
+            )
+        )
+
+    def stats(self):
+        """
+        Get the bandwidth of the loading.
+
+        Returns
+        -------
+        ret
+            A dict with the ``bytes`` loaded so far, the ``seconds`` spent loading
+            them and the ``bytes_per_second`` of the loading.
+        """
+        return _bandwidth(*self._stats)
+
+
+def load_tensor_store(path, /, *, device=None):
+    """
+    Load all the arrays of a tensor store saved by ``save_tensor_store``.
+
+    Parameters
+    ----------
+    path
+        The file the store was saved to.
+    device
+        The device to load the arrays onto. Default is ``None``, which uses the
+        default device.
+
+    Returns
+    -------
+    ret
+        The container of the arrays.
+    """
+    return TensorStore(path).to_container(device=device)
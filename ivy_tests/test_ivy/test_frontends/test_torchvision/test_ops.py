@@ -12,6 +12,17 @@ from ivy_tests.test_ivy.helpers import handle_frontend_test
 # --------------- #
 
 
+@st.composite
+def _batched_nms_helper(draw):
+    dts, boxes, scores, iou_threshold = draw(_nms_helper())
+    idxs = draw(
+        helpers.array_values(
+            dtype="int64", shape=(boxes.shape[0],), min_value=0, max_value=3
+        )
+    )
+    return dts + ["int64"], boxes, scores, idxs, iou_threshold
+
+
 @st.composite
 def _nms_helper(draw):
     img_width = draw(st.integers(250, 1250))
@@ -82,6 +93,65 @@ def _roi_align_helper(draw):
 # ------------ #
 
 
+# batched_nms
+@handle_frontend_test(
+    fn_tree="torchvision.ops.batched_nms",
+    dts_boxes_scores_idxs_iou=_batched_nms_helper(),
+    test_with_out=st.just(False),
+)
+def test_torchvision_batched_nms(
+    *,
+    dts_boxes_scores_idxs_iou,
+    on_device,
+    fn_tree,
+    frontend,
+    test_flags,
+    backend_fw,
+):
+    dts, boxes, scores, idxs, iou = dts_boxes_scores_idxs_iou
+    helpers.test_frontend_function(
+        input_dtypes=dts,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        boxes=boxes,
+        scores=scores,
+        idxs=idxs,
+        iou_threshold=iou,
+    )
+
+
+# box_iou
+@handle_frontend_test(
+    fn_tree="torchvision.ops.box_iou",
+    boxes1=_nms_helper(),
+    boxes2=_nms_helper(),
+    test_with_out=st.just(False),
+)
+def test_torchvision_box_iou(
+    *,
+    boxes1,
+    boxes2,
+    on_device,
+    fn_tree,
+    frontend,
+    test_flags,
+    backend_fw,
+):
+    helpers.test_frontend_function(
+        input_dtypes=["float32", "float32"],
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        boxes1=boxes1[1],
+        boxes2=boxes2[1],
+    )
+
+
 # nms
 @handle_frontend_test(
     fn_tree="torchvision.ops.nms",
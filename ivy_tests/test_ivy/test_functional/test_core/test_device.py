@@ -526,6 +526,7 @@ def test_profiler(*, backend_fw):
     dtype=helpers.get_dtypes("numeric", full=False),
     chunk_size=helpers.ints(min_value=1, max_value=3),
     axis=_axis(),
+    num_workers=helpers.ints(min_value=1, max_value=3),
 )
 def test_split_func_call(
     *,
@@ -533,6 +534,7 @@ def test_split_func_call(
     dtype,
     chunk_size,
     axis,
+    num_workers,
     test_flags,
     backend_fw,
 ):
@@ -553,7 +555,12 @@ def test_split_func_call(
 
         # predictions
         a, b, c = ivy_backend.split_func_call(
-            func, [x1, x2], "concat", chunk_size=chunk_size, input_axes=axis
+            func,
+            [x1, x2],
+            "concat",
+            chunk_size=chunk_size,
+            input_axes=axis,
+            num_workers=num_workers,
         )
 
         # true
@@ -639,6 +646,67 @@ def test_split_func_call_with_cont_input(
         )
 
 
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_split_func_call_reductions(backend_fw):
+    # chunks of unequal sizes, 3, 3, 3 and 1
+    x = np.arange(10, dtype="float64").reshape((10, 1)) ** 2
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.array(x)
+        for num_workers in [1, 2]:
+            for mode, reduction in [
+                ("mean", ivy_backend.mean),
+                ("sum", ivy_backend.sum),
+            ]:
+                ret = ivy_backend.split_func_call(
+                    lambda a: reduction(a),
+                    [x],
+                    mode,
+                    chunk_size=3,
+                    num_workers=num_workers,
+                )
+                helpers.assert_all_close(
+                    ivy_backend.to_numpy(ret),
+                    ivy_backend.to_numpy(reduction(x)),
+                    backend=backend_fw,
+                )
+
+
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_split_func_call_tune_chunk_size(backend_fw):
+    x = np.arange(64, dtype="float32").reshape((64, 1))
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.array(x)
+        factor = ivy_backend.split_factor()
+        # chunks of at most 1 + round(63 * 0.25) = 17 rows
+        ivy_backend.set_split_factor(0.25)
+        chunk_sizes = []
+
+        def func(a):
+            chunk_sizes.append(a.shape[0])
+            return a * 2
+
+        try:
+            for tune_chunk_size in [False, True]:
+                for _ in range(6):
+                    chunk_sizes.clear()
+                    ret = ivy_backend.split_func_call(
+                        func, [x], "concat", tune_chunk_size=tune_chunk_size
+                    )
+                    helpers.assert_all_close(
+                        ivy_backend.to_numpy(ret),
+                        ivy_backend.to_numpy(x * 2),
+                        backend=backend_fw,
+                    )
+                    assert sum(chunk_sizes) == 64
+                    # the size given by the split factor is never exceeded, and is
+                    # used as it is without tuning
+                    assert max(chunk_sizes) <= 17
+                    if not tune_chunk_size:
+                        assert chunk_sizes[0] == 17
+        finally:
+            ivy_backend.set_split_factor(factor)
+
+
 # to_dev
 @handle_test(
     fn_tree="functional.ivy.to_device",
@@ -186,6 +186,26 @@ def test_astype(
     )
 
 
+# autocast
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_autocast(backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.array(np.ones((2, 2), dtype="float32"))
+        y = ivy_backend.array(np.ones((2, 2), dtype="float64"))
+        assert ivy_backend.autocast_dtype() is None
+        with ivy_backend.Autocast("float16"):
+            assert ivy_backend.autocast_dtype() == "float16"
+            # low precision functions compute in the autocast dtype
+            z = ivy_backend.matmul(x, x)
+            assert ivy_backend.dtype(z) == "float16"
+            # reductions of low precision inputs compute in float32
+            assert ivy_backend.dtype(ivy_backend.sum(z)) == "float32"
+            # float64 inputs are left in float64
+            assert ivy_backend.dtype(ivy_backend.matmul(y, y)) == "float64"
+        assert ivy_backend.autocast_dtype() is None
+        assert ivy_backend.dtype(ivy_backend.matmul(x, x)) == "float32"
+
+
 @handle_test(
     fn_tree="functional.ivy.broadcast_arrays",
     arrays=broadcastable_arrays(dtypes_shared("num_arrays")),
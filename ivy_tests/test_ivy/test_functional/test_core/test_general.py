@@ -12,6 +12,7 @@ from collections.abc import Sequence
 
 # local
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import ivy
 
 import ivy_tests.test_ivy.helpers as helpers
@@ -1173,6 +1174,25 @@ def test_get_tmp_dir():
     assert ret == "/tmp"
 
 
+def test_global_modes_with_threading():
+    ivy.set_array_mode(False)
+    ivy.set_min_base(1e-3)
+
+    def thread_fn():
+        # a new thread starts from the default modes, and its updates stay local
+        ret = [ivy.array_mode, ivy.min_base, len(ivy.array_mode_stack)]
+        ivy.set_min_base(1e-2)
+        return ret + [ivy.min_base]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(thread_fn).result() == [True, 1e-05, 0, 1e-2]
+    assert ivy.array_mode is False
+    assert ivy.min_base == 1e-3
+    ivy.unset_array_mode()
+    ivy.unset_min_base()
+    assert ivy.array_mode is True
+
+
 # has_nans
 @handle_test(
     fn_tree="functional.ivy.has_nans",
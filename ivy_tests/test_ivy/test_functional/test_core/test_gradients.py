@@ -176,6 +176,46 @@ def test_adam_update(
     )
 
 
+# checkpoint
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_checkpoint(dtype, backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        xs = ivy_backend.Container(
+            {
+                "x": ivy_backend.array([[4.6, 2.1, 5], [2.8, 1.3, 6.2]], dtype=dtype),
+                "w": ivy_backend.array([0.1, 0.2, 0.3], dtype=dtype),
+            }
+        )
+        num_calls = [0]
+
+        def func(x, params):
+            num_calls[0] += 1
+            return {"y": ivy_backend.tanh(ivy_backend.sin(x) * params["w"]), "n": 3}
+
+        def loss(xs, fn):
+            ret = fn(xs.x, {"w": xs.w})
+            assert ret["n"] == 3
+            return ivy_backend.sum(ret["y"] ** 2)
+
+        ret, grads = ivy_backend.execute_with_gradients(lambda xs: loss(xs, func), xs)
+        ret_checkpointed, grads_checkpointed = ivy_backend.execute_with_gradients(
+            lambda xs: loss(xs, ivy_backend.checkpoint(func)), xs
+        )
+        assert np.allclose(
+            ivy_backend.to_numpy(ret), ivy_backend.to_numpy(ret_checkpointed)
+        )
+        if backend_fw == "numpy":
+            return
+        for grad, grad_checkpointed in zip(
+            grads.cont_flatten()[0], grads_checkpointed.cont_flatten()[0]
+        ):
+            assert np.allclose(
+                ivy_backend.to_numpy(grad), ivy_backend.to_numpy(grad_checkpointed)
+            )
+        # the activations are recomputed in the gradient pass
+        assert num_calls[0] >= 3
+
+
 # execute_with_gradients
 @handle_test(
     fn_tree="functional.ivy.execute_with_gradients",
@@ -228,6 +268,50 @@ def test_execute_with_gradients(
     )
 
 
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_execute_with_gradients_loss_scaling(dtype, backend_fw):
+    if backend_fw == "numpy":
+        return
+
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        scaler = ivy_backend.LossScaler(init_scale=1024.0, growth_interval=2)
+        xs = ivy_backend.Container(
+            {"w": ivy_backend.array([1.0, 2.0, 3.0], dtype=dtype)}
+        )
+
+        def func(xs):
+            return ivy_backend.sum(xs.w * xs.w)
+
+        for _ in range(2):
+            ret, grads = ivy_backend.execute_with_gradients(
+                func, xs, loss_scaler=scaler
+            )
+            # the loss and the gradients are returned unscaled
+            assert np.allclose(ivy_backend.to_numpy(ret), 14.0)
+            assert np.allclose(ivy_backend.to_numpy(grads.w), [2.0, 4.0, 6.0])
+            assert not scaler.found_inf
+        assert scaler.scale == 2048.0
+
+        # the loss is returned as func computed it, even where the scaled loss overflows
+        ret, _ = ivy_backend.execute_with_gradients(
+            lambda xs: func(xs) * 10,
+            xs,
+            loss_scaler=ivy_backend.LossScaler(init_scale=2.0**16),
+        )
+        assert np.allclose(ivy_backend.to_numpy(ret), 140.0)
+
+        def overflow(xs):
+            return ivy_backend.sum(xs.w * xs.w) * float("inf")
+
+        ivy_backend.execute_with_gradients(overflow, xs, loss_scaler=scaler)
+        assert scaler.found_inf
+        assert scaler.scale == 1024.0
+        # the optimizer step is skipped when the gradients overflowed
+        optimizer = ivy_backend.SGD(lr=0.1)
+        v = scaler.step(optimizer, xs, grads)
+        assert np.allclose(ivy_backend.to_numpy(v.w), [1.0, 2.0, 3.0])
+
+
 # grad
 @pytest.mark.parametrize(
     "x", [[[4.6, 2.1, 5], [2.8, 1.3, 6.2]], [[4.6, 2.1], [5, 2.8], [1.3, 6.2]]]
@@ -283,6 +283,20 @@ def test_nested_argwhere(nest):
     assert indices[3] == ["b", "c", 0, 1, 0]
 
 
+# nested_argwhere_w_stop_after_n_found
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
+)
+@pytest.mark.parametrize("stop_after_n_found", [1, 3])
+def test_nested_argwhere_w_stop_after_n_found(nest, stop_after_n_found):
+    indices = ivy.nested_argwhere(
+        nest, lambda x: x < 5, stop_after_n_found=stop_after_n_found
+    )
+    assert (
+        indices == [["a", 0, 0], ["a", 1, 0], ["b", "c", 0, 0, 0]][:stop_after_n_found]
+    )
+
+
 # nested_argwhere_w_nest_checks
 @pytest.mark.parametrize(
     "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
@@ -1,14 +1,16 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import itertools
 from hypothesis import strategies as st, assume
 import ivy
 import numpy as np
+import pytest
 
 
 # local
 import ivy_tests.test_ivy.helpers as helpers
-from ivy_tests.test_ivy.helpers import handle_test
+from ivy_tests.test_ivy.helpers import handle_test, BackendHandler
 from ivy.functional.ivy.layers import _deconv_length
 
 
@@ -1243,6 +1245,114 @@ def test_conv_general_transpose(
     )
 
 
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_conv_numpy_engine(backend_fw):
+    # the im2col and fft convolutions of the numpy backend, against the sum over the
+    # kernel offsets of the strided windows of the padded input
+    if backend_fw != "numpy":
+        return
+    import importlib
+    from unittest import mock
+
+    # the experimental layers shadow the module as an attribute of the backend
+    numpy_layers = importlib.import_module("ivy.functional.backends.numpy.layers")
+
+    def _reference(x, filters, strides, pads, dilations, groups):
+        dims = x.ndim - 2
+        x = np.pad(x, [(0, 0), *pads, (0, 0)])
+        kernel_shape = filters.shape[:dims]
+        out_shape = [
+            (x.shape[i + 1] - (kernel_shape[i] - 1) * dilations[i] - 1) // strides[i]
+            + 1
+            for i in range(dims)
+        ]
+        input_dim, output_dim = filters.shape[-2:]
+        group_dim = output_dim // groups
+        res = np.zeros((x.shape[0], *out_shape, output_dim))
+        for offset in itertools.product(*[range(k) for k in kernel_shape]):
+            window = x[
+                (
+                    slice(None),
+                    *[
+                        slice(o * d, o * d + (n - 1) * s + 1, s)
+                        for o, d, n, s in zip(offset, dilations, out_shape, strides)
+                    ],
+                )
+            ]
+            for g in range(groups):
+                res[..., g * group_dim : (g + 1) * group_dim] += (
+                    window[..., g * input_dim : (g + 1) * input_dim]
+                    @ filters[offset][:, g * group_dim : (g + 1) * group_dim]
+                )
+        return res
+
+    rng = np.random.default_rng(0)
+    # x shape, filters shape, strides, padding, dilations, groups, the explicit
+    # padding and whether the fft is used
+    cases = [
+        ((3, 17, 2), (4, 2, 4), 3, [(2, 1)], 2, 1, [(2, 1)], False),
+        ((2, 9, 8, 4), (3, 3, 4, 6), 1, "SAME", 1, 1, [(1, 1), (1, 1)], False),
+        ((2, 9, 8, 4), (3, 2, 2, 6), (2, 1), [(1, 2), (0, 1)], 1, 2, None, False),
+        # depthwise
+        ((2, 9, 8, 4), (3, 3, 1, 4), 1, "VALID", (2, 1), 4, [(0, 0), (0, 0)], False),
+        ((2, 6, 5, 4, 2), (2, 3, 2, 2, 3), (1, 2, 1), 1, 1, 1, [(1, 1)] * 3, False),
+        ((2, 20, 20, 3), (9, 9, 3, 2), 1, "SAME", 1, 1, [(4, 4), (4, 4)], True),
+        ((2, 20, 21, 4), (9, 10, 2, 4), 1, 3, 1, 2, [(3, 3), (3, 3)], True),
+        # the fft is only used with unit strides and dilations
+        ((2, 20, 20, 3), (9, 9, 3, 2), 1, "VALID", 2, 1, [(0, 0), (0, 0)], False),
+    ]
+    for x_shape, f_shape, strides, padding, dilations, groups, pads, fft in cases:
+        dims = len(x_shape) - 2
+        x = rng.standard_normal(x_shape)
+        filters = rng.standard_normal(f_shape)
+        pads = ivy.default(pads, padding)
+        expected = _reference(
+            x,
+            filters,
+            [strides] * dims if isinstance(strides, int) else strides,
+            pads,
+            [dilations] * dims if isinstance(dilations, int) else dilations,
+            groups,
+        )
+        # the batch is also split into chunks of a single sample
+        for chunk_bytes in [numpy_layers._IM2COL_CHUNK_BYTES, 1]:
+            with mock.patch.object(
+                numpy_layers, "_IM2COL_CHUNK_BYTES", chunk_bytes
+            ), mock.patch.object(
+                numpy_layers, "_conv_fft", wraps=numpy_layers._conv_fft
+            ) as conv_fft:
+                ret = numpy_layers._conv(
+                    x, filters, strides, padding, dims, dilations, groups
+                )
+            assert conv_fft.called == fft
+            assert ret.dtype == x.dtype
+            assert np.allclose(ret, expected, rtol=1e-6, atol=1e-6)
+
+    # the non-finite values only reach the outputs of their windows, the large
+    # kernels being convolved without the fft
+    x = rng.standard_normal((1, 20, 20, 2))
+    filters = rng.standard_normal((9, 9, 2, 3))
+    x[0, 0, 0, 0] = np.inf
+    nan_filters = filters.copy()
+    nan_filters[4, 4, 1, 2] = np.nan
+    for x, filters in [(x, filters), (np.abs(x), nan_filters)]:
+        expected = _reference(x, filters, [1, 1], [(4, 4), (4, 4)], [1, 1], 1)
+        with mock.patch.object(
+            numpy_layers, "_conv_fft", wraps=numpy_layers._conv_fft
+        ) as conv_fft:
+            ret = numpy_layers._conv(x, filters, 1, "SAME", 2, 1)
+        assert not conv_fft.called
+        assert not np.isnan(ret).all()
+        assert np.allclose(ret, expected, rtol=1e-6, atol=1e-6, equal_nan=True)
+
+    # the products of integers are summed in the dtype of np.sum
+    x = rng.integers(-5, 5, (2, 7, 6, 2)).astype("int32")
+    filters = rng.integers(-5, 5, (3, 3, 2, 4)).astype("int32")
+    ret = numpy_layers._conv(x, filters, 1, "VALID", 2, 1)
+    assert ret.dtype == np.sum(x).dtype
+    assert np.array_equal(ret, _reference(x, filters, [1, 1], [(0, 0)] * 2, [1, 1], 1))
+
+
 # depthwise_conv2d
 @handle_test(
     fn_tree="functional.ivy.depthwise_conv2d",
@@ -1373,6 +1483,60 @@ def test_lstm_update(*, dtype_lstm, test_flags, backend_fw, fn_name, on_device):
     )
 
 
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_lstm_bidirectional_packed(backend_fw):
+    # two bidirectional layers over sequences of different lengths, padded to 6
+    rng = np.random.default_rng(0)
+    lengths = [6, 2, 4]
+    x = rng.standard_normal((3, 6, 5))
+    init_h, init_c = rng.standard_normal((2, 4, 3, 4))
+    kernels = [rng.standard_normal((n, 16)) * 0.5 for n in [5, 5, 8, 8]]
+    recurrent_kernels = rng.standard_normal((4, 4, 16)) * 0.5
+    biases = rng.standard_normal((4, 16)) * 0.1
+
+    def _sigmoid(x):
+        return 1 / (1 + np.exp(-x))
+
+    def _expected(x, i, b):
+        # each direction of each layer, over a single sequence without padding
+        h, c = init_h[i, b], init_c[i, b]
+        hs = []
+        for x_t in x[::-1] if i % 2 else x:
+            it, ft, gt, ot = np.split(
+                x_t @ kernels[i] + h @ recurrent_kernels[i] + biases[i], 4, axis=-1
+            )
+            c = _sigmoid(ft) * c + _sigmoid(it) * np.tanh(gt)
+            h = _sigmoid(ot) * np.tanh(c)
+            hs.append(h)
+        return np.stack(hs[::-1] if i % 2 else hs), h, c
+
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        ret, h_n, c_n = ivy_backend.lstm(
+            ivy_backend.array(x),
+            ivy_backend.array(init_h),
+            ivy_backend.array(init_c),
+            [ivy_backend.array(k) for k in kernels],
+            [ivy_backend.array(k) for k in recurrent_kernels],
+            biases=[ivy_backend.array(b) for b in biases],
+            lengths=lengths,
+            bidirectional=True,
+        )
+        ret, h_n, c_n = [ivy_backend.to_numpy(a) for a in [ret, h_n, c_n]]
+    assert ret.shape == (3, 6, 8)
+    for b, length in enumerate(lengths):
+        x_b = x[b, :length]
+        for layer in range(2):
+            outputs = []
+            for i in [2 * layer, 2 * layer + 1]:
+                hs, h, c = _expected(x_b, i, b)
+                assert np.allclose(h_n[i, b], h, atol=1e-6)
+                assert np.allclose(c_n[i, b], c, atol=1e-6)
+                outputs.append(hs)
+            x_b = np.concatenate(outputs, axis=-1)
+        assert np.allclose(ret[b, :length], x_b, atol=1e-6)
+        assert np.all(ret[b, length:] == 0)
+
+
 # multi_head_attention
 @handle_test(
     fn_tree="functional.ivy.multi_head_attention",
@@ -1455,6 +1619,68 @@ def test_multi_head_attention(
     )
 
 
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_multi_head_attention_kv_cache(backend_fw):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((2, 6, 8)).astype("float32")
+    in_proj_weights = rng.standard_normal((24, 8)).astype("float32") * 0.3
+    out_proj_weights = rng.standard_normal((8, 8)).astype("float32") * 0.3
+
+    def _expected(x):
+        # causal attention over 2 heads of 4 features
+        q, k, v = [
+            y.reshape(len(x), -1, 2, 4).transpose(0, 2, 1, 3)
+            for y in np.split(x @ in_proj_weights.T, 3, axis=-1)
+        ]
+        sim = q @ k.swapaxes(-1, -2) / 2
+        sim = np.where(np.tril(np.ones(sim.shape[-2:])), sim, -np.inf)
+        attn = np.exp(sim - sim.max(-1, keepdims=True))
+        ret = attn / attn.sum(-1, keepdims=True) @ v
+        return ret.transpose(0, 2, 1, 3).reshape(x.shape) @ out_proj_weights.T
+
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+
+        def _attention(x, **kwargs):
+            ret = ivy_backend.multi_head_attention(
+                ivy_backend.array(x),
+                num_heads=2,
+                in_proj_weights=ivy_backend.array(in_proj_weights),
+                out_proj_weights=ivy_backend.array(out_proj_weights),
+                is_causal=True,
+                **kwargs,
+            )
+            return ivy_backend.to_numpy(ret)
+
+        expected = _expected(x)
+        assert np.allclose(_attention(x), expected, atol=1e-5)
+        cache = ivy_backend.KVCache(1, 3, 6, 2, 4)
+        slots = [cache.add_sequence() for _ in range(3)]
+        cache.evict(slots[1])
+        # prompts of 2 and 4 tokens, padded to 4
+        ret = _attention(
+            x[:, :4],
+            key_padding_mask=ivy_backend.array([[0, 0, 1, 1], [0, 0, 0, 0]]) > 0,
+            kv_cache=cache,
+            kv_cache_slots=[slots[2], slots[0]],
+        )
+        assert np.allclose(ret[0, :2], expected[0, :2], atol=1e-5)
+        assert np.allclose(ret[1], expected[1, :4], atol=1e-5)
+        assert cache.lengths() == [4, 0, 2]
+        # then one token at a time
+        for i in range(2):
+            ret = _attention(
+                np.stack([x[0, 2 + i], x[1, 4 + i]])[:, None],
+                kv_cache=cache,
+                kv_cache_slots=[slots[2], slots[0]],
+            )
+            assert np.allclose(ret[0, 0], expected[0, 2 + i], atol=1e-5)
+            assert np.allclose(ret[1, 0], expected[1, 4 + i], atol=1e-5)
+        assert cache.lengths() == [6, 0, 4]
+        assert cache.add_sequence() == slots[1]
+        with pytest.raises(ivy_backend.utils.exceptions.IvyException):
+            _attention(x[:1, :1], kv_cache=cache, kv_cache_slots=[slots[0]])
+
+
 @handle_test(
     fn_tree="functional.ivy.nms",
     inputs=_nms_helper(),
@@ -1484,6 +1710,71 @@ def test_nms(
     )
 
 
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_nms_batched(backend_fw):
+    # more boxes than are suppressed at once, of few distinct scores for ties
+    rng = np.random.default_rng(0)
+    num_boxes = 600
+    corners = rng.integers(0, 200, (num_boxes, 2))
+    boxes = np.concatenate([corners, corners + rng.integers(1, 40, (num_boxes, 2))], 1)
+    boxes = boxes.astype(np.float32)
+    scores = rng.integers(0, 20, num_boxes).astype(np.float32) / 20
+    group_ids = rng.integers(0, 3, num_boxes)
+
+    def _iou(box, others):
+        sides = np.maximum(
+            0, np.minimum(box[2:], others[:, 2:]) - np.maximum(box[:2], others[:, :2])
+        )
+        inter = sides[:, 0] * sides[:, 1]
+        area = (box[2] - box[0]) * (box[3] - box[1])
+        areas = (others[:, 2] - others[:, 0]) * (others[:, 3] - others[:, 1])
+        return inter / (area + areas - inter)
+
+    def _expected(iou_threshold, score_threshold, groups):
+        keep = []
+        for i in np.argsort(-scores, kind="stable"):
+            kept = np.array([j for j in keep if groups[j] == groups[i]], dtype=np.int64)
+            if scores[i] > score_threshold and not np.any(
+                _iou(boxes[i], boxes[kept]) > iou_threshold
+            ):
+                keep.append(i)
+        return keep
+
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.array(boxes)
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(ivy_backend.box_iou(x[:5], x)),
+            np.stack([_iou(box, boxes) for box in boxes[:5]]),
+            backend=backend_fw,
+        )
+        for iou_threshold, score_threshold in [(0.5, float("-inf")), (0.2, 0.42)]:
+            expected = _expected(iou_threshold, score_threshold, np.zeros(num_boxes))
+            ret = ivy_backend.nms(
+                x,
+                ivy_backend.array(scores),
+                iou_threshold=iou_threshold,
+                score_threshold=score_threshold,
+            )
+            assert ivy_backend.to_numpy(ret).tolist() == expected
+            ret = ivy_backend.nms(
+                x,
+                ivy_backend.array(scores),
+                iou_threshold=iou_threshold,
+                max_output_size=10,
+                score_threshold=score_threshold,
+            )
+            assert ivy_backend.to_numpy(ret).tolist() == expected[:10]
+            ret = ivy_backend.batched_nms(
+                x,
+                ivy_backend.array(scores),
+                ivy_backend.array(group_ids),
+                iou_threshold=iou_threshold,
+                score_threshold=score_threshold,
+            )
+            expected = _expected(iou_threshold, score_threshold, group_ids)
+            assert ivy_backend.to_numpy(ret).tolist() == expected
+
+
 @handle_test(
     fn_tree="functional.ivy.roi_align",
     inputs=_roi_align_helper(),
@@ -1562,3 +1853,29 @@ def test_scaled_dot_product_attention(
         is_causal=is_causal,
         training=training,
     )
+
+
+@handle_test(fn_tree="functional.ivy.exists")  # dummy fn_tree
+def test_scaled_dot_product_attention_blockwise(backend_fw):
+    # the sequences span several tiles of queries and keys
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal((2, 700, 8)).astype("float32")
+    key = rng.standard_normal((2, 600, 8)).astype("float32")
+    value = rng.standard_normal((2, 600, 4)).astype("float32")
+    mask = rng.random((700, 600)) > 0.5
+    # a fully masked out query attends to all the keys
+    mask[3] = False
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        for mask_, is_causal in [(mask, False), (np.tril(np.ones_like(mask)), True)]:
+            ret = ivy_backend.scaled_dot_product_attention(
+                ivy_backend.array(query),
+                ivy_backend.array(key),
+                ivy_backend.array(value),
+                scale=0.5,
+                mask=None if is_causal else ivy_backend.array(mask_),
+                is_causal=is_causal,
+            )
+            sim = np.where(mask_, query @ key.swapaxes(-1, -2) * 0.5, -1e30)
+            attn = np.exp(sim - sim.max(-1, keepdims=True))
+            expected = attn / attn.sum(-1, keepdims=True) @ value
+            assert np.allclose(ivy_backend.to_numpy(ret), expected, atol=1e-5)
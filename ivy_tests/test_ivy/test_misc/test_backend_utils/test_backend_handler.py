@@ -59,6 +59,39 @@ def test_choose_random_backend(excluded):
         assert backend in backends_list
 
 
+@pytest.mark.parametrize(
+    ("backend", "array_type"),
+    available_array_types_input,
+)
+def test_backend_cache(backend, array_type):
+    ivy.unset_backend()
+    ivy.utils.backend.clear_backend_cache()
+    expected = importlib.import_module(_backend_dict[backend])
+    # the first array found determines the backend, scalars are cached as None
+    assert ivy.current_backend(1.0, [array_type], x=array_type) is expected
+    assert ivy.current_backend(array_type) is expected
+    cache_info = ivy.utils.backend.backend_cache_info()
+    assert cache_info == {"hits": 1, "misses": 2, "size": 2}
+
+
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_backend_namespace_cache(backend):
+    ivy.unset_backend()
+    ivy.utils.backend.clear_backend_namespace_cache()
+    ivy.set_backend(backend)
+    wrapped_fns = (ivy.sum, ivy.functional.sum, ivy.random_uniform)
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    # switching back to a backend reuses its cached namespace
+    assert (ivy.sum, ivy.functional.sum, ivy.random_uniform) == wrapped_fns
+    ivy.previous_backend()
+    ivy.set_backend(backend)
+    assert (ivy.sum, ivy.functional.sum, ivy.random_uniform) == wrapped_fns
+    assert ivy.current_backend_str() == backend
+    assert ivy.to_scalar(ivy.sum(ivy.array([1.0, 2.0]))) == 3.0
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     ("backend", "array_type"),
     available_array_types_input,
@@ -172,6 +205,18 @@ def test_dynamic_backend_setter():
     assert isinstance(a.data, torch.Tensor)
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_lazy_import(backend):
+    assert ivy.utils.lazy_import("not_an_installed_module") is None
+    imported = []
+    backend_module = ivy.utils.lazy_import(_backend_dict[backend], imported.append)
+    assert not imported
+    assert backend_module.current_backend_str() == backend
+    assert imported == [importlib.import_module(_backend_dict[backend])]
+    # backends are also imported on first access of ivy.functional.backends
+    assert getattr(ivy.functional.backends, backend) is imported[0]
+
+
 @pytest.mark.parametrize("backend", _available_frameworks())
 def test_previous_backend(backend):
     if not ivy.backend_stack:
@@ -32,6 +32,19 @@ def test_memory_id(name, traced_backends):
         )
 
 
+def test_prebuild_backend(backend_fw):
+    ivy.utils.backend.prebuild_backend(backend_fw)
+    prebuilt_local_ivy = ivy.utils.backend.handler._prebuilt_backends[backend_fw][-1]
+    local_ivy = ivy.with_backend(backend_fw, cached=False)
+    assert local_ivy is prebuilt_local_ivy
+    assert local_ivy.is_local()
+    build_info = ivy.utils.backend.with_backend_build_info()
+    assert build_info["pool"][backend_fw] == 0
+    assert build_info["builds"][-1][0] == backend_fw
+    # the pool is empty again, so a new local ivy is built
+    assert ivy.with_backend(backend_fw, cached=False) is not local_ivy
+
+
 def test_prevent_access(backend_fw):
     local_ivy = ivy.with_backend(backend_fw)
     with pytest.raises(RuntimeError):
@@ -62,3 +75,16 @@ def traced_backends():
         _b = ivy.with_backend(b)
         traced_backends.append(_b)
     return traced_backends
+
+
+def test_with_backend_disk_cache_key(tmp_path, monkeypatch):
+    from ivy.utils.backend import ast_helpers
+
+    monkeypatch.setattr(ast_helpers, "_compiled_modules_cache_dir", str(tmp_path))
+    filename = ast_helpers.__file__
+    compiled_obj = compile("x = 1", filename, "exec")
+    ast_helpers._save_cached_module(filename, compiled_obj)
+    assert ast_helpers._load_cached_module(filename) == compiled_obj
+    # the modules cached by other versions of the transformations are not reused
+    monkeypatch.setattr(ast_helpers, "_compiled_modules_cache_key", "0" * 16)
+    assert ast_helpers._load_cached_module(filename) is None
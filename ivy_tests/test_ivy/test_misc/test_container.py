@@ -1057,6 +1057,42 @@ def test_container_from_flat_list(on_device):
     assert np.allclose(ivy.to_numpy(container.b.d), np.array([6]))
 
 
+def test_container_flatten(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device), "d": {}, "e": 3},
+        },
+        print_limit=5,
+    )
+    leaves, treedef = container.cont_flatten()
+    assert treedef.key_chains == ["a", "b/c", "b/e"]
+    assert treedef.num_leaves == 3
+    assert leaves[2] == 3
+    # the tree definition rebuilds containers of the same structure and config
+    rebuilt = treedef.unflatten([4, 5, 6])
+    assert isinstance(rebuilt.b.d, Container) and not rebuilt.b.d
+    assert rebuilt.cont_to_dict() == {"a": 4, "b": {"c": 5, "d": {}, "e": 6}}
+    assert rebuilt.cont_config == container.cont_config
+    assert rebuilt.b.cont_config == container.b.cont_config
+    assert "d" not in treedef.unflatten([4, 5, 6], prune_empty=True).b
+    assert Container(a=1, b={"c": 2, "d": {}, "e": 3}).cont_flatten()[1] == treedef
+    assert Container(a=1, b={"c": 2, "e": 3}).cont_flatten()[1] != treedef
+    with pytest.raises(IvyException):
+        treedef.unflatten([4, 5])
+
+    # maps over the flat leaves match the recursive ones
+    other = container.cont_map(lambda x, _: x * 2)
+    ret = Container.cont_multi_map(
+        lambda xs, kc: (xs[0], xs[1], kc), [container, other]
+    )
+    assert ret.b.c == (container.b.c, other.b.c, "b/c")
+    assert "d" not in ret.b
+    ret = Container.cont_multi_map(lambda xs, _: xs[0] + xs[1], [container, 1])
+    assert np.array_equal(ivy.to_numpy(ret.b.c), np.array([3]))
+    assert ret.b.e == 4
+
+
 def test_container_from_kwargs(on_device):
     container = Container(
         a=ivy.array([1], device=on_device),
@@ -1810,6 +1846,21 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped.d.e), 2)
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
+    # containers mixed with other inputs, which func gets whole sub-containers with
+    container = Container(
+        {"m0": {"x": ivy.array([1], device=on_device)}, "z2": 3, "m1": {}}
+    )
+    container_mapped = ivy.Container.cont_multi_map(
+        lambda xs, kc: (kc, xs[1]), [container, 3]
+    )
+    assert container_mapped.m0 == ("m0", 3)
+    assert container_mapped.m1 == ("m1", 3)
+    assert container_mapped.z2 == ("z2", 3)
+
+    # operators with scalars keep the empty sub-containers, as comparisons do
+    assert "m1" in container + 3
+    assert "m1" in container > 1
+
 
 def test_container_num_arrays(on_device):
     dict_in = {
@@ -2970,6 +3021,56 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_container_from_disk_as_hdf5_contiguous(lazy, num_workers, tmp_path):
+    h5py = pytest.importorskip("h5py")
+    save_filepath = str(tmp_path / "container_on_disk.hdf5")
+    a = np.arange(12, dtype=np.float32).reshape(6, 2)
+    c = np.arange(6, dtype=np.int32)
+    # datasets written without maxshape are stored contiguously, and can be mapped
+    with h5py.File(save_filepath, "w") as h5_obj:
+        h5_obj["a"] = a
+        h5_obj.create_group("b")["c"] = c
+
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 4), lazy=lazy, num_workers=num_workers
+    )
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), a[1:4])
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), c[1:4])
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_container_hdf5_writer(background, on_device, tmp_path):
+    pytest.importorskip("h5py")
+    save_filepath = str(tmp_path / "container_on_disk.hdf5")
+    containers = [
+        Container(
+            {
+                "a": ivy.array([[float(i)]] * batch_size, device=on_device),
+                "b": {"c": ivy.array([i] * batch_size, device=on_device)},
+            }
+        )
+        for i, batch_size in enumerate([2, 3, 1])
+    ]
+    with Container.cont_hdf5_writer(
+        save_filepath, background=background, compression="gzip"
+    ) as writer:
+        for container in containers:
+            writer.append(container)
+
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    # the datasets are trimmed to the rows appended
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.a),
+        np.concatenate([ivy.to_numpy(c.a) for c in containers]),
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c),
+        np.concatenate([ivy.to_numpy(c.b.c) for c in containers]),
+    )
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2991,6 +3092,44 @@ def test_container_to_and_from_disk_as_json(on_device):
     os.remove(save_filepath)
 
 
+def _put_container_in_shared_memory(q):
+    container = Container(a=np.arange(6.0).reshape(2, 3), b={"c": np.ones(4), "d": 1})
+    q.put(container.cont_to_shared_memory())
+
+
+def test_container_to_and_from_shared_memory(on_device):
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {"c": ivy.array([5, 6], device=on_device), "d": "text"},
+        }
+    )
+    handle = container.cont_to_shared_memory()
+    # only the keys and layout are pickled, not the array data
+    assert len(pickle.dumps(handle)) < 1024
+    loaded_container = Container.cont_from_shared_memory(
+        pickle.loads(pickle.dumps(handle))
+    )
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+    assert loaded_container.b.d == "text"
+
+    # from another process
+    ctx = multiprocessing.get_context("fork")
+    q = ctx.Queue()
+    p = ctx.Process(target=_put_container_in_shared_memory, args=(q,))
+    p.start()
+    loaded_container = Container.cont_from_shared_memory(q.get(timeout=30))
+    p.join()
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.a), np.arange(6.0).reshape(2, 3)
+    )
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), np.ones(4))
+    assert loaded_container.b.d == 1
+
+
 def test_container_to_and_from_disk_as_pickled(on_device):
     save_filepath = "container_on_disk.pickled"
     dict_in = {
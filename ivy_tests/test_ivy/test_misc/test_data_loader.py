@@ -0,0 +1,139 @@
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pytest
+
+import ivy
+from ivy.utils.data_loader import DataLoader
+from ivy.utils.shared_memory import from_shared_memory, to_shared_memory
+
+
+def _put_in_shared_memory(q):
+    q.put(
+        to_shared_memory(
+            {"x": np.arange(3), "y": np.array(["text", {"z": 2}], dtype=object)}
+        )
+    )
+
+
+class _Dataset:
+    def __init__(self, size, fail_at=None):
+        self.size = size
+        self.fail_at = fail_at
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        if i == self.fail_at:
+            raise ValueError(f"failed to load sample {i}")
+        return {"x": np.full((3,), i, dtype="float32"), "meta": {"idx": i}}
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_data_loader(backend_fw, num_workers):
+    ivy.set_backend(backend_fw)
+    with DataLoader(
+        _Dataset(10), batch_size=4, shuffle=True, seed=1, num_workers=num_workers
+    ) as loader:
+        assert len(loader) == 3
+        epochs = [list(loader) for _ in range(2)]
+        for batches in epochs:
+            assert [b.x.shape[0] for b in batches] == [4, 4, 2]
+            idxs = np.concatenate([ivy.to_numpy(b.meta.idx) for b in batches])
+            assert sorted(idxs.tolist()) == list(range(10))
+            for b in batches:
+                assert isinstance(b.x, ivy.Array)
+                assert np.all(ivy.to_numpy(b.x) == ivy.to_numpy(b.meta.idx)[:, None])
+        # the samples are reshuffled every epoch
+        assert not np.array_equal(
+            ivy.to_numpy(epochs[0][0].meta.idx), ivy.to_numpy(epochs[1][0].meta.idx)
+        )
+
+        # stopping an epoch early doesn't affect the next one
+        for _ in loader:
+            break
+        assert len(list(loader)) == 3
+        stats = loader.stats()
+        assert stats["transfer"]["batches"] >= 9
+        assert stats["wait"]["batches"] == 10
+
+    # the order only depends on the seed and the epoch
+    loader = DataLoader(
+        _Dataset(10), batch_size=4, shuffle=True, seed=1, drop_last=True
+    )
+    assert len(loader) == 2
+    assert np.array_equal(
+        ivy.to_numpy(next(iter(loader)).meta.idx), ivy.to_numpy(epochs[0][0].meta.idx)
+    )
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_data_loader_error(backend_fw, num_workers):
+    ivy.set_backend(backend_fw)
+    with DataLoader(
+        _Dataset(10, fail_at=5), batch_size=2, num_workers=num_workers
+    ) as loader:
+        with pytest.raises(ivy.utils.exceptions.IvyException, match="sample 5"):
+            for _ in loader:
+                pass
+    ivy.previous_backend()
+
+
+def test_data_loader_worker_killed(backend_fw):
+    ivy.set_backend(backend_fw)
+    with DataLoader(_Dataset(20), batch_size=2, num_workers=2) as loader:
+        batches = iter(loader)
+        next(batches)
+        worker = loader._workers[0]
+        worker.kill()
+        worker.join()
+        # the batches sent to the dead worker never arrive, which is reported rather
+        # than waited for
+        with pytest.raises(ivy.utils.exceptions.IvyException, match="worker 0"):
+            for _ in batches:
+                pass
+        # and the next epoch starts new workers
+        assert len(list(loader)) == 10
+    ivy.previous_backend()
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/dev/shm"), reason="the shared memory blocks aren't listed"
+)
+def test_data_loader_releases_shared_memory(backend_fw):
+    ivy.set_backend(backend_fw)
+    blocks = set(os.listdir("/dev/shm"))
+    with DataLoader(
+        _Dataset(100), batch_size=2, num_workers=2, prefetch_depth=4
+    ) as loader:
+        # stopping early with batches in flight
+        for _ in loader:
+            break
+        # and losing a worker with batches loaded, killed once idle so that it isn't
+        # interrupted while writing a batch
+        batches = iter(loader)
+        next(batches)
+        time.sleep(0.5)
+        loader._workers[1].kill()
+        with pytest.raises(ivy.utils.exceptions.IvyException, match="worker 1"):
+            for _ in batches:
+                pass
+    assert set(os.listdir("/dev/shm")) <= blocks
+    ivy.previous_backend()
+
+
+def test_shared_memory_object_arrays():
+    # only the pointers to the objects of the sending process are in the array, which
+    # is pickled rather than copied into the block
+    ctx = multiprocessing.get_context("fork")
+    q = ctx.Queue()
+    p = ctx.Process(target=_put_in_shared_memory, args=(q,))
+    p.start()
+    nest = from_shared_memory(q.get(timeout=30))
+    p.join()
+    assert np.array_equal(nest["x"], np.arange(3))
+    assert list(nest["y"]) == ["text", {"z": 2}]
@@ -164,6 +164,22 @@ def test_inputs_to_native_arrays(backend_fw):
     ivy.previous_backend()
 
 
+@pytest.mark.parametrize("nested", [False, True])
+def test_inputs_to_native_arrays_with_out(nested, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0])
+    out = ivy.array([0.0])
+
+    def _fn(x, out=None):
+        x = x[0] if nested else x
+        assert isinstance(x, ivy.NativeArray)
+        # the out argument is left untouched
+        assert isinstance(out, ivy.Array)
+
+    ivy.inputs_to_native_arrays(_fn)([x] if nested else x, out=out)
+    ivy.previous_backend()
+
+
 def test_outputs_to_ivy_arrays(backend_fw):
     ivy.set_backend(backend_fw)
     assert isinstance(
@@ -209,3 +225,19 @@ def test_views(array_to_update, backend_fw):
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
     ivy.previous_backend()
+
+
+def test_fused_dispatch(backend_fw):
+    ivy.set_backend(backend_fw)
+    assert ivy.add.fused_wrappers[-1] == "handle_exceptions"
+    x = ivy.array([1.0, 2.0])
+    ret = ivy.add(x, x)
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ivy.add.__wrapped__(x, x)))
+    # inputs which aren't flat fall back to the full wrapper chain
+    ret = ivy.add(ivy.Container(a=x), x)
+    assert isinstance(ret, ivy.Container)
+    out = ivy.zeros((2,))
+    ret = ivy.add(x, x, out=out)
+    assert ret is out
+    ivy.previous_backend()
@@ -0,0 +1,36 @@
+import json
+
+import ivy
+from ivy.utils.profiler import OpProfiler
+
+
+def test_op_profiler(backend_fw, tmp_path):
+    ivy.set_backend(backend_fw)
+    add = ivy.add
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    with OpProfiler(ops=["add", "matmul"]) as prof:
+        assert ivy.add is not add
+        ivy.add(ivy.matmul(x, x), x)
+        ivy.add(x, x)
+    # the namespace is restored once the profiler stops
+    assert ivy.add is add
+    stats = prof.stats()
+    assert stats["add"]["calls"] == 2
+    assert stats["matmul"]["calls"] == 1
+    for entry in stats.values():
+        assert entry["kernel_time"] <= entry["total_time"]
+    assert stats["add"]["bytes"] == 2 * 4 * 4
+    assert stats["add"]["inputs"].most_common(1)[0][0] == (
+        ((2, 2), str(x.dtype)),
+        ((2, 2), str(x.dtype)),
+    )
+    assert "matmul" in prof.table()
+
+    # chrome trace with an op and a kernel event per call
+    path = tmp_path / "trace.json"
+    prof.export_chrome_trace(str(path))
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    assert [e["cat"] for e in events].count("op") == 3
+    assert [e["cat"] for e in events].count("kernel") == 3
+    ivy.previous_backend()
@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pytest
+
+import ivy
+from ivy.utils.tensor_store import TensorStore, load_tensor_store, save_tensor_store
+
+
+def _nest():
+    return ivy.Container(
+        {
+            "a": ivy.array(np.arange(6, dtype="float32").reshape(2, 3)),
+            "b": {
+                "c": ivy.array(np.array([1, 2], dtype="int64")),
+                "d": ivy.array([True, False]),
+            },
+            "e": ivy.array(np.array(3.5, dtype="float64")),
+        }
+    )
+
+
+@pytest.mark.parametrize("shard_size", [None, 16])
+def test_tensor_store(backend_fw, shard_size, tmp_path):
+    ivy.set_backend(backend_fw)
+    path = str(tmp_path / "weights.ivyt")
+    x = _nest()
+    stats = save_tensor_store(x, path, shard_size=shard_size, num_workers=2)
+    assert stats["bytes"] == 24 + 16 + 2 + 8
+    assert len(os.listdir(tmp_path)) == (1 if shard_size is None else 4)
+
+    y = load_tensor_store(path)
+    assert y.cont_all_key_chains() == x.cont_all_key_chains()
+    for a, b in zip(x.cont_flatten()[0], y.cont_flatten()[0]):
+        assert isinstance(b, ivy.Array)
+        assert b.dtype == a.dtype
+        assert np.array_equal(ivy.to_numpy(a), ivy.to_numpy(b))
+
+    # the arrays are loaded one at a time, without reading the others
+    store = TensorStore(path)
+    assert store.keys() == ["a", "b/c", "b/d", "e"]
+    assert store.shape("a") == (2, 3)
+    assert store.dtype("b/c") == "int64"
+    assert np.array_equal(ivy.to_numpy(store.load("b/c")), [1, 2])
+    assert store.stats()["bytes"] == 16
+    assert store.to_container(prefix="b").cont_all_key_chains() == ["c", "d"]
+    with pytest.raises(ivy.utils.exceptions.IvyException, match="not in"):
+        store.load("f")
+    ivy.previous_backend()
+
+
+def test_tensor_store_bfloat16(backend_fw, tmp_path):
+    if backend_fw == "numpy":
+        return
+    ivy.set_backend(backend_fw)
+    path = str(tmp_path / "weights.ivyt")
+    x = ivy.astype(ivy.array([1.5, -2.25, 3.0e38]), "bfloat16")
+    save_tensor_store({"x": x}, path)
+    y = load_tensor_store(path).x
+    assert y.dtype == "bfloat16"
+    assert ivy.all(y == x)
+    ivy.previous_backend()
+
+
+def test_tensor_store_invalid(tmp_path):
+    path = str(tmp_path / "weights.ivyt")
+    with open(path, "wb") as f:
+        f.write(b"\x02\x00\x00\x00\x00\x00\x00\x00{}")
+    with pytest.raises(ivy.utils.exceptions.IvyException, match="not a tensor"):
+        TensorStore(path)
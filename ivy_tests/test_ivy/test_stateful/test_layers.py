@@ -1304,6 +1304,7 @@ def test_linear_layer(
     ),
     weight_initializer=_sample_initializer(),
     num_layers=st.integers(min_value=1, max_value=3),
+    bidirectional=st.booleans(),
     return_sequence=st.booleans(),
     return_state=st.booleans(),
     init_with_v=st.booleans(),
@@ -1314,6 +1315,7 @@ def test_lstm_layer(
     output_channels,
     weight_initializer,
     num_layers,
+    bidirectional,
     return_sequence,
     return_state,
     init_with_v,
@@ -1339,6 +1341,7 @@ def test_lstm_layer(
             "output_channels": output_channels,
             "weight_initializer": weight_initializer,
             "num_layers": num_layers,
+            "bidirectional": bidirectional,
             "return_sequence": return_sequence,
             "return_state": return_state,
             "device": on_device,
@@ -4,6 +4,7 @@
 import os
 from hypothesis import given, strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
@@ -373,6 +374,120 @@ def test_module_save_and_load_as_pickled(
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("shard_size", [None, 1024])
+def test_module_save_and_load_tensors(shard_size, tmp_path, backend_fw):
+    ivy.set_backend(backend_fw)
+    save_filepath = str(tmp_path / "module.ivyt")
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 4), "float32")
+    module = TrainableModule(4, 3, hidden_size=16)
+    module.register_buffer("running_mean", ivy.array([1.0, 2.0]))
+    stats = module.save_tensors(save_filepath, shard_size=shard_size)
+    assert stats["bytes"] == sum(
+        a.size * 4 for a in module.v.cont_flatten()[0] + [module.running_mean]
+    )
+    num_files = len(os.listdir(tmp_path))
+    assert num_files == 1 if shard_size is None else num_files > 2
+
+    # the tensors are loaded into a module of the same structure
+    loaded_module = TrainableModule(4, 3, hidden_size=16)
+    stats = loaded_module.load_tensors(save_filepath)
+    assert stats["bytes"] > 0
+    assert ivy.Container.all(loaded_module.v == module.v).cont_all_true()
+    assert np.array_equal(
+        ivy.to_numpy(loaded_module.running_mean), ivy.to_numpy(module.running_mean)
+    )
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ivy.to_numpy(module(x)))
+
+    # the variables have to match those of the module
+    with pytest.raises(ivy.utils.exceptions.IvyException, match="shape"):
+        TrainableModule(4, 3, hidden_size=8).load_tensors(save_filepath)
+    with pytest.raises(ivy.utils.exceptions.IvyException, match="missing"):
+        ivy.Linear(4, 3).load_tensors(save_filepath)
+    ivy.previous_backend()
+
+
+def test_module_compile_forward(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 4), "float32")
+    module = TrainableModule(4, 3, hidden_size=16)
+    eager = ivy.to_numpy(module(x))
+    module.compile_forward(cache_size=2)
+    assert np.allclose(ivy.to_numpy(module(x)), eager, atol=1e-6)
+    assert np.allclose(ivy.to_numpy(module(x)), eager, atol=1e-6)
+    assert module.compile_stats() == dict(
+        hits=1, misses=1, recompiles=0, evictions=0, size=1
+    )
+
+    # the variables are inputs of the compiled forward pass
+    v = module.v.cont_map(lambda w, _: w * 2)
+    assert np.allclose(
+        ivy.to_numpy(module(x, v=v)),
+        ivy.to_numpy(TrainableModule(4, 3, hidden_size=16, v=v)(x)),
+        atol=1e-6,
+    )
+    assert module.compile_stats()["hits"] == 2
+
+    # a new signature recompiles, evicting the least recently used forward pass
+    module(x[:1])
+    module.eval()
+    module(x)
+    assert module.compile_stats() == dict(
+        hits=2, misses=3, recompiles=2, evictions=1, size=2
+    )
+
+    # the gradients flow through the compiled forward pass
+    if backend_fw != "numpy":
+        module.train()
+        loss_fn = lambda v: ivy.mean(module(x, v=v))
+        compiled_grads = ivy.execute_with_gradients(loss_fn, module.v)[1]
+        module.compile_forward(False)
+        grads = ivy.execute_with_gradients(loss_fn, module.v)[1]
+        assert ivy.Container.all(ivy.abs(compiled_grads - grads) < 1e-6).cont_all_true()
+    ivy.previous_backend()
+
+
+def test_module_compile_forward_save_and_load(tmp_path, backend_fw):
+    ivy.set_backend(backend_fw)
+    save_filepath = str(tmp_path / "module.pickled")
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 4), "float32")
+    module = ivy.Linear(4, 3)
+    module.compile_forward()
+    ret = ivy.to_numpy(module(x))
+    module.save(save_filepath)
+    loaded_module = ivy.Module.load(save_filepath)
+    # the compiled forward passes aren't saved, and are compiled again on the first call
+    assert loaded_module.compile_stats()["size"] == 0
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ret, atol=1e-6)
+    assert loaded_module.compile_stats()["size"] == 1
+    assert module.compile_stats()["size"] == 1
+    ivy.previous_backend()
+
+
+def test_module_load_without_compile_attributes(tmp_path, backend_fw):
+    ivy.set_backend(backend_fw)
+    save_filepath = str(tmp_path / "module.pickled")
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 4), "float32")
+    module = ivy.Linear(4, 3)
+    ret = ivy.to_numpy(module(x))
+    # a module pickled before checkpointing and compiled forward passes were added
+    for name in [
+        "_checkpoint",
+        "_compile_forward",
+        "_compile_cache_size",
+        "_compiled_forwards",
+        "_compile_stats",
+    ]:
+        del module.__dict__[name]
+    module.save(save_filepath)
+    loaded_module = ivy.Module.load(save_filepath)
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ret, atol=1e-6)
+    assert loaded_module.compile_stats()["size"] == 0
+    loaded_module.compile_forward()
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ret, atol=1e-6)
+    assert loaded_module.compile_stats()["size"] == 1
+    ivy.previous_backend()
+
+
 @given(dummy=st.booleans())
 def test_module_to_device(dummy, on_device):
     model = TrainableModule(5, 5)
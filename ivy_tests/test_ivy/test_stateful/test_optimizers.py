@@ -1,9 +1,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -318,3 +321,142 @@ def test_sgd_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+# foreach
+@pytest.mark.parametrize(
+    ("optimizer", "kwargs"),
+    [
+        ("SGD", {}),
+        ("LARS", {"decay_lambda": 0.1}),
+        ("Adam", {}),
+        ("AdamW", {"weight_decay": 0.1}),
+        ("LAMB", {"decay_lambda": 0.1}),
+    ],
+)
+def test_foreach_optimizer(backend_fw, optimizer, kwargs):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+
+    def _random_container():
+        return ivy.Container(
+            {
+                "a": {
+                    "w": ivy.array(rng.standard_normal((3, 4)).astype("float32")),
+                    "b": ivy.array(rng.standard_normal((4,)).astype("float32")),
+                },
+                "c": ivy.array(rng.standard_normal((5,)).astype("float64")),
+            }
+        )
+
+    v = _random_container()
+    per_leaf = getattr(ivy, optimizer)(lr=0.1, **kwargs)
+    foreach = getattr(ivy, optimizer)(lr=0.1, foreach=True, **kwargs)
+    v_per_leaf, v_foreach = v.cont_deep_copy(), v.cont_deep_copy()
+    for _ in range(3):
+        grads = _random_container()
+        v_per_leaf = per_leaf.step(v_per_leaf, grads.cont_deep_copy())
+        v_foreach = foreach.step(v_foreach, grads.cont_deep_copy())
+    for x, y, w in zip(
+        v_per_leaf.cont_flatten()[0], v_foreach.cont_flatten()[0], v.cont_flatten()[0]
+    ):
+        assert y.dtype == w.dtype
+        assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-5, atol=1e-6)
+    # the flat state of the foreach mode is written back to the state container
+    state = foreach.state
+    for x, y in zip(per_leaf.state.cont_flatten()[0], state.cont_flatten()[0]):
+        assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-5, atol=1e-6)
+    foreach.set_state(state)
+    v_foreach = foreach.step(v_foreach, grads)
+    v_per_leaf = per_leaf.step(v_per_leaf, grads)
+    assert np.allclose(
+        ivy.to_numpy(v_per_leaf.a.w), ivy.to_numpy(v_foreach.a.w), rtol=1e-5, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("optimizer", ["LARS", "LAMB"])
+def test_foreach_optimizer_layer_norms(backend_fw, optimizer):
+    ivy.set_backend(backend_fw)
+    # a small leaf of small values after a large one, whose norms the foreach mode
+    # must not lose against the norm of the large leaf
+    v = ivy.Container(
+        {
+            "a": ivy.array(np.ones((1000000,), dtype="float32")),
+            "b": ivy.array(np.full((10,), 1e-3, dtype="float32")),
+        }
+    )
+    grads = ivy.Container(
+        {
+            "a": ivy.array(np.ones((1000000,), dtype="float32")),
+            "b": ivy.array(np.full((10,), 1e-7, dtype="float32")),
+        }
+    )
+    v_per_leaf = getattr(ivy, optimizer)(lr=0.1).step(v.cont_deep_copy(), grads)
+    v_foreach = getattr(ivy, optimizer)(lr=0.1, foreach=True).step(
+        v.cont_deep_copy(), grads
+    )
+    for x, y in zip(v_per_leaf.cont_flatten()[0], v_foreach.cont_flatten()[0]):
+        assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("foreach", [False, True])
+def test_master_weights_optimizer(backend_fw, foreach):
+    ivy.set_backend(backend_fw)
+    v = ivy.Container({"w": ivy.array(np.ones((3,), dtype="float16"))})
+    grads = ivy.Container({"w": ivy.array(np.full((3,), 1e-4, dtype="float16"))})
+    # float16 can't represent the small steps away from 1, which are lost without
+    # the float32 master copy of the weights accumulating them
+    v_low = v.cont_deep_copy()
+    v_master = v.cont_deep_copy()
+    low = ivy.SGD(lr=1.0, foreach=foreach)
+    master = ivy.SGD(lr=1.0, foreach=foreach, master_weights=True)
+    for _ in range(10):
+        v_low = low.step(v_low, grads)
+        v_master = master.step(v_master, grads)
+    assert v_master.w.dtype == "float16"
+    assert np.allclose(ivy.to_numpy(v_low.w), 1.0)
+    assert np.allclose(ivy.to_numpy(v_master.w), 1.0 - 1e-3, atol=2e-4)
+
+
+@pytest.mark.parametrize("optimizer", ["SGD", "LARS", "Adam"])
+def test_master_weights_optimizer_state(backend_fw, optimizer):
+    ivy.set_backend(backend_fw)
+    v = ivy.Container({"w": ivy.array(np.ones((3,), dtype="float16"))})
+    grads = ivy.Container({"w": ivy.array(np.full((3,), 1e-4, dtype="float16"))})
+    kwargs = {"lr": 1.0} if optimizer == "SGD" else {"lr": 1e-4}
+    reference = getattr(ivy, optimizer)(master_weights=True, **kwargs)
+    v_reference = v.cont_deep_copy()
+    for _ in range(10):
+        v_reference = reference.step(v_reference, grads)
+    # the master weights are saved and restored with the rest of the state
+    saved = getattr(ivy, optimizer)(master_weights=True, **kwargs)
+    v_saved = v.cont_deep_copy()
+    for _ in range(5):
+        v_saved = saved.step(v_saved, grads)
+    assert "master_v" in saved.state
+    restored = getattr(ivy, optimizer)(master_weights=True, **kwargs)
+    restored.set_state(saved.state.cont_deep_copy())
+    assert np.allclose(
+        ivy.to_numpy(restored.state.master_v.w), ivy.to_numpy(saved.state.master_v.w)
+    )
+    if optimizer != "Adam":
+        # the step count of adam is not part of its state, so only the stateless
+        # optimizers continue exactly where they left off
+        for _ in range(5):
+            v_saved = restored.step(v_saved, grads)
+        assert np.allclose(ivy.to_numpy(v_saved.w), ivy.to_numpy(v_reference.w))
+        assert not np.allclose(ivy.to_numpy(v_saved.w), 1.0)
+    # and created again from the variables when their keys or dtypes change
+    sgd = ivy.SGD(lr=1.0, master_weights=True)
+    sgd.step(v.cont_deep_copy(), grads)
+    for v_new in [
+        ivy.Container({"b": ivy.array(np.ones((3,), dtype="float16"))}),
+        ivy.Container({"w": ivy.array(np.ones((3,), dtype="float32"))}),
+    ]:
+        grads_new = v_new.cont_map(lambda x, _: x * 1e-2)
+        v_new = sgd.step(v_new, grads_new)
+        assert "master_v" in sgd.state
+        assert sgd.state.master_v.cont_all_key_chains() == v_new.cont_all_key_chains()
+        assert v_new.cont_flatten()[0][0].dtype == grads_new.cont_flatten()[0][0].dtype
+        assert np.allclose(ivy.to_numpy(v_new.cont_flatten()[0][0]), 0.99, atol=1e-3)
+    ivy.previous_backend()
@@ -115,3 +115,43 @@ def test_sequential_same_as_class(input_array, dims, backend_fw):
         sequential_loss = _train(m_sequential, input_array)
         class_loss = _train(m_class, input_array)
         assert sequential_loss == class_loss
+
+
+@handle_method(
+    method_tree="Sequential.__call__",
+    input_array=st.lists(
+        st.floats(min_value=0, max_value=1, allow_nan=False, allow_infinity=False),
+        min_size=1,
+        max_size=5,
+    ),
+    dims=st.lists(st.integers(1, 10), min_size=4, max_size=4),
+    budget=st.integers(1, 200),
+)
+def test_sequential_checkpoint(input_array, dims, budget, backend_fw):
+    ivy.set_backend(backend_fw)
+    dims = [len(input_array)] + dims
+    layer_count = len(dims)
+    m_sequential = ivy.Sequential(
+        *[ivy.Linear(dims[i], dims[i + 1]) for i in range(layer_count - 1)]
+    )
+    m_checkpointed = ivy.Sequential(
+        *[ivy.Linear(dims[i], dims[i + 1]) for i in range(layer_count - 1)],
+        checkpoint_memory_budget=budget,
+    )
+
+    # copy weights
+    for i in range(layer_count - 1):
+        _copy_weights(
+            m_sequential.v.submodules[f"v{i}"], m_checkpointed.v.submodules[f"v{i}"]
+        )
+
+    input_array = ivy.array(input_array, dtype="float32")
+    assert ivy.allclose(m_sequential(input_array), m_checkpointed(input_array))
+    # the segments to checkpoint are picked on the first pass
+    assert len(m_checkpointed._checkpoint_segments) == 1
+
+    if backend_fw != "numpy":
+        sequential_loss = _train(m_sequential, input_array)
+        checkpointed_loss = _train(m_checkpointed, input_array)
+        assert ivy.allclose(ivy.stack(sequential_loss), ivy.stack(checkpointed_loss))
+    ivy.previous_backend()
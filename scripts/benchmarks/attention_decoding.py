@@ -0,0 +1,90 @@
+"""
+Measure the throughput of incremental decoding with multi-head attention layers.
+
+Builds a stack of ``--layers`` causal ``MultiHeadAttention`` layers of ``--width``
+features, and decodes ``--new-tokens`` tokens after prompts of ``--prompt-length``
+tokens for ``--batch`` concurrent sequences, each new token being the output of the
+last token. Reports the tokens per second decoded by re-running the layers over the
+whole sequences at each step, against appending the new tokens to a ``KVCache`` and
+only attending from them, along with the largest difference between their outputs.
+
+Usage: python scripts/benchmarks/attention_decoding.py --backend numpy --layers 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _decode(layers, prompt, new_tokens, cache):
+    x = prompt
+    tokens = []
+    start = time.perf_counter()
+    for _ in range(new_tokens):
+        h = x
+        for i, layer in enumerate(layers):
+            h = (
+                layer(h, is_causal=True)
+                if cache is None
+                else layer(h, is_causal=True, kv_cache=cache, kv_cache_layer=i)
+            )
+        # decoding is inference, so the graph of the previous steps isn't kept
+        token = ivy.stop_gradient(h[:, -1:], preserve_type=False)
+        tokens.append(ivy.to_numpy(token))
+        # without the cache, the layers run over the whole sequence again
+        x = ivy.concat([x, token], axis=1) if cache is None else token
+    seconds = time.perf_counter() - start
+    return np.concatenate(tokens, axis=1), prompt.shape[0] * new_tokens / seconds
+
+
+def benchmark(backend, layers, width, heads, batch, prompt_length, new_tokens):
+    ivy.set_backend(backend)
+    ivy.seed(seed_value=0)
+    model = [
+        ivy.MultiHeadAttention(width, num_heads=heads, training=False)
+        for _ in range(layers)
+    ]
+    prompt = ivy.array(
+        np.random.default_rng(0).random((batch, prompt_length, width), dtype="float32")
+    )
+    full, full_rate = _decode(model, prompt, new_tokens, None)
+    cache = ivy.KVCache(
+        layers, batch, prompt_length + new_tokens, heads, width // heads
+    )
+    cached, cached_rate = _decode(model, prompt, new_tokens, cache)
+    ivy.previous_backend()
+    return full_rate, cached_rate, float(np.abs(full - cached).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--width", type=int, default=256)
+    parser.add_argument("--heads", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=4)
+    parser.add_argument("--prompt-length", type=int, default=512)
+    parser.add_argument("--new-tokens", type=int, default=32)
+    args = parser.parse_args()
+    full, cached, diff = benchmark(
+        args.backend,
+        args.layers,
+        args.width,
+        args.heads,
+        args.batch,
+        args.prompt_length,
+        args.new_tokens,
+    )
+    print(
+        f"backend {args.backend}, {args.layers} layers, batch {args.batch}, prompt"
+        f" {args.prompt_length} tokens, {args.new_tokens} new tokens"
+    )
+    print(f"{'full (tokens/s)':>18}{'cached (tokens/s)':>20}{'max diff':>12}")
+    print(f"{full:>18.1f}{cached:>20.1f}{diff:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Measure how the time and memory of scaled dot product attention scale with length.
+
+Runs ``ivy.scaled_dot_product_attention`` on ``--batch`` sequences of each of the
+``--lengths``, with ``--features`` features, computing the similarities as one tile,
+as the full matrix, against a tile of ``--block-size`` queries and keys at a time,
+and reports the best time of ``--number`` runs along with the peak memory allocated
+by numpy during a run. With ``--causal``, the tiles past the diagonal are skipped. On
+backends with a fused kernel, its time is reported too.
+
+Usage: python scripts/benchmarks/attention_scaling.py --backend numpy --causal
+"""
+
+import argparse
+import importlib
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _measure(query, causal, number):
+    tracemalloc.start()
+    ivy.scaled_dot_product_attention(query, query, query, is_causal=causal)
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        ivy.scaled_dot_product_attention(query, query, query, is_causal=causal)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3, peak
+
+
+def benchmark(backend, lengths, batch, features, block_size, causal, number):
+    ivy.set_backend(backend)
+    layers = importlib.import_module("ivy.functional.ivy.layers")
+    sdpa = ivy.scaled_dot_product_attention
+    # the compositional implementation, rather than the fused kernel of the backend
+    compos = getattr(sdpa, "compos", None)
+    rng = np.random.default_rng(0)
+    rows = []
+    for length in lengths:
+        query = ivy.array(rng.random((batch, length, features), dtype="float32"))
+        row = [length]
+        if compos is not None:
+            ivy.scaled_dot_product_attention = compos
+        for size in [length, block_size]:
+            layers._ATTENTION_BLOCK_SIZE = size
+            row.extend(_measure(query, causal, number))
+        ivy.scaled_dot_product_attention = sdpa
+        row.append(_measure(query, causal, number)[0] if compos is not None else None)
+        rows.append(row)
+    layers._ATTENTION_BLOCK_SIZE = 512
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=[512, 1024, 2048, 4096]
+    )
+    parser.add_argument("--batch", type=int, default=4)
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--block-size", type=int, default=512)
+    parser.add_argument("--causal", action="store_true")
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    rows = benchmark(
+        args.backend,
+        args.lengths,
+        args.batch,
+        args.features,
+        args.block_size,
+        args.causal,
+        args.number,
+    )
+    print(
+        f"backend {args.backend}, batch {args.batch}, block size {args.block_size},"
+        f" causal {args.causal}"
+    )
+    print(
+        f"{'length':>8}{'full (ms)':>12}{'peak (MiB)':>12}{'tiled (ms)':>12}"
+        f"{'peak (MiB)':>12}{'fused (ms)':>12}"
+    )
+    for length, full, full_peak, tiled, tiled_peak, fused in rows:
+        fused = "-" if fused is None else f"{fused:.2f}"
+        print(
+            f"{length:>8}{full:>12.2f}{full_peak:>12.1f}{tiled:>12.2f}"
+            f"{tiled_peak:>12.1f}{fused:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure the latency of switching the global ivy backend.
+
+The first ``ivy.set_backend`` call for each backend builds and caches its wrapped
+namespace, later switches between the same backends reuse it.
+
+Usage: python scripts/benchmarks/backend_switch.py --backends numpy torch
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _time_ms(fn, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def benchmark(backends, number):
+    ivy.unset_backend()
+    ivy.utils.backend.clear_backend_namespace_cache()
+    rows = []
+    for backend in backends:
+        rows.append(
+            (
+                f"first set_backend({backend!r})",
+                _time_ms(lambda: ivy.set_backend(backend), 1),
+            )
+        )
+        ivy.previous_backend()
+
+    def switch():
+        for backend in backends:
+            ivy.set_backend(backend)
+        for _ in backends:
+            ivy.previous_backend()
+
+    rows.append(
+        (f"set + previous ({len(backends)} backends)", _time_ms(switch, number))
+    )
+    ivy.set_backend(backends[0])
+    rows.append(("unset_backend", _time_ms(ivy.unset_backend, 1)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    print(f"{'operation':<40}{'time (ms)':>12}")
+    for name, ms in benchmark(args.backends, args.number):
+        print(f"{name:<40}{ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measure the activations kept for the gradient pass of a Sequential, with and without
+checkpointing.
+
+Builds a stack of ``--layers`` pairs of a ``--width`` Linear layer and a GELU, and
+counts the bytes of the distinct tensors saved by torch for the backward pass of a
+forward pass through it, along with the time of a forward and backward pass, keeping
+all the activations against checkpointing under ``--budget`` MiB of activations.
+
+Usage: python scripts/benchmarks/checkpoint_memory.py --layers 16 --budget 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+import ivy
+
+
+def _saved_mib(model, x, v):
+    storages = {}
+
+    def _pack(t):
+        storages[t.untyped_storage().data_ptr()] = t.untyped_storage().nbytes()
+        return t
+
+    with torch.autograd.graph.saved_tensors_hooks(_pack, lambda t: t):
+        ivy.mean(model(x, v=v) ** 2)
+    weights = sum(w.size * 4 for w in v.cont_flatten()[0])
+    return (sum(storages.values()) - weights) / 2**20
+
+
+def _step_ms(model, x, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        ivy.execute_with_gradients(lambda v: ivy.mean(model(x, v=v) ** 2), model.v)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def benchmark(layers, width, batch, budget, number):
+    ivy.set_backend("torch")
+    x = ivy.array(np.random.default_rng(0).random((batch, width), dtype="float32"))
+    rows = []
+    for name, kwargs in [
+        ("keep all", {}),
+        ("checkpoint", {"checkpoint_memory_budget": int(budget * 2**20)}),
+    ]:
+        model = ivy.Sequential(
+            *[
+                layer
+                for _ in range(layers)
+                for layer in (ivy.Linear(width, width), ivy.GELU())
+            ],
+            **kwargs,
+        )
+        v = model.v.cont_map(
+            lambda w, _: ivy.array(ivy.to_native(w).detach().requires_grad_())
+        )
+        # the first pass measures the outputs of the submodules to pick the segments
+        model(x, v=v)
+        rows.append((name, _saved_mib(model, x, v), _step_ms(model, x, number)))
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--layers", type=int, default=16)
+    parser.add_argument("--width", type=int, default=512)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--budget", type=float, default=4.0)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    rows = benchmark(args.layers, args.width, args.batch, args.budget, args.number)
+    print(f"{2 * args.layers} submodules, budget {args.budget} MiB")
+    print(f"{'mode':<12}{'activations (MiB)':>20}{'step (ms)':>12}")
+    for name, mib, ms in rows:
+        print(f"{name:<12}{mib:>20.2f}{ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
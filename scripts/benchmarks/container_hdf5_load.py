@@ -0,0 +1,81 @@
+"""
+Measure the time of loading a container from an hdf5 file.
+
+Writes a file with ``--keys`` float32 datasets of ``--rows`` x ``--cols`` each, both
+as chunked datasets, as written by ``Container.cont_to_disk_as_hdf5``, and as
+contiguous datasets, then loads them with ``Container.cont_from_disk_as_hdf5``.
+
+Usage: python scripts/benchmarks/container_hdf5_load.py --rows 100000 --cols 64
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import h5py
+import numpy as np
+
+import ivy
+
+
+def _write(path, keys, rows, cols, chunked):
+    with h5py.File(path, "w") as f:
+        for i in range(keys):
+            data = np.random.uniform(size=(rows, cols)).astype("float32")
+            if chunked:
+                f.create_dataset(f"key_{i}", data=data, maxshape=(None, cols))
+            else:
+                f.create_dataset(f"key_{i}", data=data)
+
+
+def _time_ms(fn, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def benchmark(keys, rows, cols, number):
+    ivy.set_backend("numpy")
+    rows_out = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for layout in ("chunked", "contiguous"):
+            path = os.path.join(tmp_dir, f"{layout}.hdf5")
+            _write(path, keys, rows, cols, layout == "chunked")
+            for name, kwargs in (
+                ("eager", {}),
+                ("lazy", {"lazy": True}),
+                ("4 workers", {"num_workers": 4}),
+            ):
+                rows_out.append(
+                    (
+                        f"{layout}, {name}",
+                        _time_ms(
+                            lambda: ivy.Container.cont_from_disk_as_hdf5(
+                                path, **kwargs
+                            ),
+                            number,
+                        ),
+                    )
+                )
+    ivy.previous_backend()
+    return rows_out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    print(f"{'load':<28}{'time (ms)':>12}")
+    for name, ms in benchmark(args.keys, args.rows, args.cols, args.number):
+        print(f"{name:<28}{ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
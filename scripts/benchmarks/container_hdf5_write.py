@@ -0,0 +1,86 @@
+"""
+Measure the time of writing containers to an hdf5 file.
+
+Times ``Container.cont_to_disk_as_hdf5`` on a container with ``--keys`` float32
+leaves of ``--rows`` x ``--cols``, and appending it in ``--batches`` batches with
+``Container.cont_hdf5_writer``, in the foreground and from a background thread.
+
+Usage: python scripts/benchmarks/container_hdf5_write.py --rows 10000 --batches 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time_ms(fn, path, number):
+    times = []
+    for _ in range(number):
+        if os.path.exists(path):
+            os.remove(path)
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def benchmark(keys, rows, cols, batches, number):
+    ivy.set_backend("numpy")
+    cont = ivy.Container(
+        {
+            f"key_{i}": ivy.array(
+                np.random.uniform(size=(rows, cols)).astype("float32")
+            )
+            for i in range(keys)
+        }
+    )
+    batch_size = rows // batches
+    conts = [cont[i * batch_size : (i + 1) * batch_size] for i in range(batches)]
+
+    def _append(background):
+        with ivy.Container.cont_hdf5_writer(path, background=background) as writer:
+            for c in conts:
+                writer.append(c)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "cont.hdf5")
+        rows_out = [
+            (
+                "cont_to_disk_as_hdf5",
+                _time_ms(lambda: cont.cont_to_disk_as_hdf5(path), path, number),
+            ),
+            (
+                f"writer, {batches} batches",
+                _time_ms(lambda: _append(False), path, number),
+            ),
+            (
+                f"background, {batches} batches",
+                _time_ms(lambda: _append(True), path, number),
+            ),
+        ]
+    ivy.previous_backend()
+    return rows_out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--batches", type=int, default=100)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    print(f"{'write':<28}{'time (ms)':>12}")
+    for name, ms in benchmark(
+        args.keys, args.rows, args.cols, args.batches, args.number
+    ):
+        print(f"{name:<28}{ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
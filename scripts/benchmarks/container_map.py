@@ -0,0 +1,100 @@
+"""
+Measure the time of mapping functions over a large nested container.
+
+Builds a container shaped like the variables of a model, with ``--layers`` layers of
+``--sublayers`` sub-layers holding a weight and a bias each, and times maps over its
+flat leaves against the recursive implementation. The recursive implementation is
+still used by ``cont_map`` with ``map_sequences=True``, and by ``cont_multi_map`` with
+``prune_unapplied=True``, which are equivalent here as there are no sequences to map
+nor key-chains to prune.
+
+Usage: python scripts/benchmarks/container_map.py --layers 100 --sublayers 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _build(layers, sublayers):
+    return ivy.Container(
+        {
+            f"layer_{i}": {
+                f"sublayer_{j}": {
+                    "w": ivy.array(np.ones((4, 4), "float32")),
+                    "b": ivy.array(np.zeros(4, "float32")),
+                }
+                for j in range(sublayers)
+            }
+            for i in range(layers)
+        }
+    )
+
+
+def _time_ms(fn, number):
+    fn()
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def benchmark(layers, sublayers, number):
+    ivy.set_backend("numpy")
+    x = _build(layers, sublayers)
+    y = _build(layers, sublayers)
+    leaves, treedef = x.cont_flatten()
+    identity = lambda v, _: v
+    first = lambda vs, _: vs[0]
+    rows = [
+        (
+            "cont_map",
+            _time_ms(lambda: x.cont_map(identity, map_sequences=True), number),
+            _time_ms(lambda: x.cont_map(identity), number),
+        ),
+        (
+            "cont_multi_map",
+            _time_ms(
+                lambda: ivy.Container.cont_multi_map(
+                    first, [x, y], prune_unapplied=True
+                ),
+                number,
+            ),
+            _time_ms(lambda: ivy.Container.cont_multi_map(first, [x, y]), number),
+        ),
+        (
+            "unflatten, cached treedef",
+            None,
+            _time_ms(lambda: treedef.unflatten(leaves), number),
+        ),
+        (
+            "cont_all_key_chains",
+            None,
+            _time_ms(x.cont_all_key_chains, number),
+        ),
+    ]
+    ivy.previous_backend()
+    return len(leaves), rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--layers", type=int, default=100)
+    parser.add_argument("--sublayers", type=int, default=10)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    num_leaves, rows = benchmark(args.layers, args.sublayers, args.number)
+    print(f"{num_leaves} leaves")
+    print(f"{'op':<28}{'recursive (ms)':>16}{'flat (ms)':>12}")
+    for name, recursive, flat in rows:
+        recursive = f"{recursive:>16.2f}" if recursive is not None else f"{'':>16}"
+        print(f"{name:<28}{recursive}{flat:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measure the time of sending a container to another process through a queue.
+
+A worker process puts ``--number`` containers with ``--keys`` float32 arrays of
+``--rows`` x ``--cols`` each in a multiprocessing queue, either pickled as they are or
+as the handles returned by ``Container.cont_to_shared_memory``, and the main process
+gets and loads them.
+
+Usage: python scripts/benchmarks/container_shared_memory.py --rows 4096 --cols 256
+"""
+
+import argparse
+import multiprocessing
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _worker(q, keys, rows, cols, number, shared):
+    ivy.set_backend("numpy")
+    container = ivy.Container(
+        {
+            f"key_{i}": np.random.uniform(size=(rows, cols)).astype("float32")
+            for i in range(keys)
+        }
+    )
+    for _ in range(number):
+        q.put(container.cont_to_shared_memory() if shared else container)
+
+
+def _time_ms(keys, rows, cols, number, shared):
+    ctx = multiprocessing.get_context("fork")
+    q = ctx.Queue(maxsize=2)
+    p = ctx.Process(target=_worker, args=(q, keys, rows, cols, number, shared))
+    p.start()
+    first = q.get()
+    start = time.perf_counter()
+    for _ in range(number - 1):
+        item = q.get()
+        if shared:
+            ivy.Container.cont_from_shared_memory(item)
+    elapsed = time.perf_counter() - start
+    if shared:
+        ivy.Container.cont_from_shared_memory(first)
+    p.join()
+    return elapsed / (number - 1) * 1e3
+
+
+def benchmark(keys, rows, cols, number):
+    ivy.set_backend("numpy")
+    rows_out = [
+        (name, _time_ms(keys, rows, cols, number, shared))
+        for name, shared in (("pickled", False), ("shared memory", True))
+    ]
+    ivy.previous_backend()
+    return rows_out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=4096)
+    parser.add_argument("--cols", type=int, default=256)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    print(f"{'transport':<20}{'ms / container':>16}")
+    for name, ms in benchmark(args.keys, args.rows, args.cols, args.number):
+        print(f"{name:<20}{ms:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Measure the throughput of ``ivy.utils.data_loader.DataLoader``.
+
+Iterates over a synthetic dataset whose samples take ``--load-ms`` to load, with a
+training step taking ``--step-ms`` per batch, loading the batches inline, as a loop
+over the dataset would, and with the data loader for several numbers of workers.
+
+Usage: python scripts/benchmarks/data_loader.py --samples 512 --batch-size 32
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+from ivy.utils.data_loader import DataLoader, _collate
+
+
+class _Dataset:
+    def __init__(self, samples, shape, load_ms):
+        self.samples = samples
+        self.shape = shape
+        self.load_ms = load_ms
+
+    def __len__(self):
+        return self.samples
+
+    def __getitem__(self, i):
+        time.sleep(self.load_ms / 1e3)
+        return {
+            "image": np.random.uniform(size=self.shape).astype("float32"),
+            "label": i % 10,
+        }
+
+
+def _run(batches, step_ms):
+    start = time.perf_counter()
+    for batch in batches:
+        ivy.mean(batch.image)
+        time.sleep(step_ms / 1e3)
+    return time.perf_counter() - start
+
+
+def benchmark(samples, batch_size, shape, load_ms, step_ms, workers):
+    ivy.set_backend("numpy")
+    dataset = _Dataset(samples, shape, load_ms)
+    num_batches = -(-samples // batch_size)
+
+    def _inline():
+        for i in range(0, samples, batch_size):
+            batch = _collate(
+                [dataset[j] for j in range(i, min(i + batch_size, samples))]
+            )
+            yield ivy.Container(batch).cont_map(lambda x, _: ivy.asarray(x))
+
+    rows = [("inline", num_batches / _run(_inline(), step_ms), None)]
+    for num_workers in workers:
+        with DataLoader(
+            dataset, batch_size=batch_size, shuffle=True, num_workers=num_workers
+        ) as loader:
+            seconds = _run(loader, step_ms)
+            rows.append(
+                (f"{num_workers} workers", num_batches / seconds, loader.stats())
+            )
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--shape", type=int, nargs="+", default=[3, 64, 64])
+    parser.add_argument("--load-ms", type=float, default=0.5)
+    parser.add_argument("--step-ms", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    args = parser.parse_args()
+    print(f"{'loader':<14}{'batches/s':>12}{'load':>12}{'transfer':>12}{'wait':>12}")
+    for name, throughput, stats in benchmark(
+        args.samples,
+        args.batch_size,
+        tuple(args.shape),
+        args.load_ms,
+        args.step_ms,
+        args.workers,
+    ):
+        stages = [
+            f"{stats[s]['batches_per_second']:>12.1f}" if stats else f"{'':>12}"
+            for s in ("load", "transfer", "wait")
+        ]
+        print(f"{name:<14}{throughput:>12.1f}" + "".join(stages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measure the per-call overhead of ivy's function wrapping.
+
+Compares the fused dispatcher produced by ``ivy.set_backend`` against the full
+decorator chain it collapses (exposed as ``__wrapped__``) and the raw backend call,
+using small inputs so that the kernel time is negligible.
+
+Usage: python scripts/benchmarks/dispatch_overhead.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+OPS = {
+    "add": lambda fn, x: fn(x, x),
+    "multiply": lambda fn, x: fn(x, 2.0),
+    "sum": lambda fn, x: fn(x),
+    "matmul": lambda fn, x: fn(x, x),
+    "abs": lambda fn, x: fn(x),
+    # compositional functions, which keep their decorator stack
+    "stable_divide": lambda fn, x: fn(x, x),
+    "l1_loss": lambda fn, x: fn(x, x),
+}
+
+
+def _time_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def benchmark(backend, number, ops=tuple(OPS)):
+    ivy.set_backend(backend)
+    x = ivy.random_uniform(shape=(4, 4))
+    rows = []
+    for name in ops:
+        call = OPS[name]
+        fused = ivy.__dict__[name]
+        chain = getattr(fused, "__wrapped__", fused)
+        native_fn = ivy.current_backend().__dict__[name]
+        native_x = x.data
+        rows.append(
+            (
+                name,
+                _time_us(lambda: call(fused, x), number),
+                _time_us(lambda: call(chain, x), number),
+                _time_us(lambda: call(native_fn, native_x), number),
+            )
+        )
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--ops", nargs="+", default=list(OPS), choices=list(OPS))
+    args = parser.parse_args()
+    print(
+        f"{'backend':<12}{'op':<12}{'fused (us)':>12}{'chain (us)':>12}"
+        f"{'backend (us)':>14}{'speedup':>10}"
+    )
+    for backend in args.backends:
+        for name, fused, chain, native in benchmark(backend, args.number, args.ops):
+            print(
+                f"{backend:<12}{name:<12}{fused:>12.1f}{chain:>12.1f}"
+                f"{native:>14.1f}{chain / fused:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
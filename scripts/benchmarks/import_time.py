@@ -0,0 +1,74 @@
+"""
+Measure the startup cost of ivy.
+
+Times ``import ivy``, and ``ivy.set_backend`` for each backend, in fresh
+interpreters, reporting the best wall time and the number of modules imported.
+
+Usage: python scripts/benchmarks/import_time.py --backends numpy torch
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+_SNIPPET = """
+import sys, time, json, logging
+logging.disable(logging.WARNING)
+start = time.perf_counter()
+import ivy
+imported = time.perf_counter()
+modules = len(sys.modules)
+if {backend!r}:
+    ivy.set_backend({backend!r})
+done = time.perf_counter()
+print(json.dumps([imported - start, modules, done - imported, len(sys.modules)]))
+"""
+
+
+def _run(backend):
+    out = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(backend=backend)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def benchmark(backends, repeat):
+    rows = []
+    for backend in [""] + backends:
+        runs = [_run(backend) for _ in range(repeat)]
+        if not backend:
+            rows.append(
+                (
+                    "import ivy",
+                    min(r[0] for r in runs),
+                    runs[0][1],
+                )
+            )
+        else:
+            rows.append(
+                (
+                    f"set_backend({backend!r})",
+                    min(r[2] for r in runs),
+                    runs[0][3],
+                )
+            )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(f"{'operation':<28}{'time (ms)':>12}{'modules':>10}")
+    for name, seconds, modules in benchmark(args.backends, args.repeat):
+        print(f"{name:<28}{seconds * 1e3:>12.1f}{modules:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Measure the throughput of a multi-layer LSTM over long sequences.
+
+Runs ``ivy.lstm`` with ``--layers`` layers of ``--width`` features, optionally
+``--bidirectional``, over ``--batch`` sequences of each of the ``--lengths``, and
+reports the timesteps per second of the best of ``--number`` runs, for the
+compositional implementation and, on backends with one, the native kernel. With
+``--packed``, the sequences are of random lengths up to the given one.
+
+Usage: python scripts/benchmarks/lstm_throughput.py --backend torch --bidirectional
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _timesteps_per_second(fn, args, kwargs, timesteps, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return timesteps / min(times)
+
+
+def benchmark(backend, lengths, batch, width, layers, bidirectional, packed, number):
+    ivy.set_backend(backend)
+    lstm = ivy.lstm
+    # the compositional implementation, rather than the native kernel of the backend
+    compos = getattr(lstm, "compos", None)
+    rng = np.random.default_rng(0)
+    num_directions = 2 if bidirectional else 1
+    shapes = [
+        (width if i < num_directions else num_directions * width, 4 * width)
+        for i in range(layers * num_directions)
+    ]
+    kernels = [ivy.array(rng.random(s, dtype="float32") - 0.5) for s in shapes]
+    recurrent_kernels = [
+        ivy.array(rng.random((width, 4 * width), dtype="float32") - 0.5) for _ in shapes
+    ]
+    init = ivy.zeros((len(shapes), batch, width))
+    rows = []
+    for length in lengths:
+        x = ivy.array(rng.random((batch, length, width), dtype="float32"))
+        args = (x, init, init, kernels, recurrent_kernels)
+        kwargs = dict(
+            bidirectional=bidirectional,
+            lengths=rng.integers(1, length + 1, batch) if packed else None,
+        )
+        row = [length]
+        for fn in [compos or lstm, lstm if compos else None]:
+            row.append(
+                None
+                if fn is None
+                else _timesteps_per_second(fn, args, kwargs, batch * length, number)
+            )
+        rows.append(row)
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--width", type=int, default=128)
+    parser.add_argument("--layers", type=int, default=2)
+    parser.add_argument("--bidirectional", action="store_true")
+    parser.add_argument("--packed", action="store_true")
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    rows = benchmark(
+        args.backend,
+        args.lengths,
+        args.batch,
+        args.width,
+        args.layers,
+        args.bidirectional,
+        args.packed,
+        args.number,
+    )
+    print(
+        f"backend {args.backend}, batch {args.batch}, {args.layers} layers of"
+        f" {args.width}, bidirectional {args.bidirectional}, packed {args.packed}"
+    )
+    print(f"{'length':>8}{'compositional (steps/s)':>26}{'native (steps/s)':>20}")
+    for length, compos, native in rows:
+        native = "-" if native is None else f"{native:.0f}"
+        print(f"{length:>8}{compos:>26.0f}{native:>20}")
+
+
+if __name__ == "__main__":
+    main()
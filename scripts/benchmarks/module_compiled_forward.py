@@ -0,0 +1,68 @@
+"""
+Measure the latency of the forward pass of a Module, eager against compiled.
+
+Builds a stack of ``--layers`` pairs of a ``--width`` Linear layer and a GELU, and
+times its forward pass on batches of ``--batch`` samples, calling the ivy functions
+eagerly against running the forward pass compiled for the signature of the inputs,
+along with the time of the first, compiling, call and the statistics of the cache.
+
+Usage: python scripts/benchmarks/module_compiled_forward.py --backend torch --layers 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _call_ms(model, x, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        model(x)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def benchmark(backend, layers, width, batch, number):
+    ivy.set_backend(backend)
+    x = ivy.array(np.random.default_rng(0).random((batch, width), dtype="float32"))
+    model = ivy.Sequential(
+        *[
+            layer
+            for _ in range(layers)
+            for layer in (ivy.Linear(width, width), ivy.GELU())
+        ]
+    )
+    eager = _call_ms(model, x, number)
+    model.compile_forward()
+    start = time.perf_counter()
+    model(x)
+    first = (time.perf_counter() - start) * 1e3
+    compiled = _call_ms(model, x, number)
+    stats = model.compile_stats()
+    ivy.previous_backend()
+    return eager, first, compiled, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--width", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--number", type=int, default=100)
+    args = parser.parse_args()
+    eager, first, compiled, stats = benchmark(
+        args.backend, args.layers, args.width, args.batch, args.number
+    )
+    print(f"{2 * args.layers} submodules, backend {args.backend}")
+    print(f"{'eager (ms)':>12}{'first call (ms)':>18}{'compiled (ms)':>16}")
+    print(f"{eager:>12.3f}{first:>18.3f}{compiled:>16.3f}")
+    print(f"cache: {stats}")
+
+
+if __name__ == "__main__":
+    main()
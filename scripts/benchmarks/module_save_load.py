@@ -0,0 +1,86 @@
+"""
+Measure saving and loading the weights of a Module, pickled against a tensor store.
+
+Builds a Sequential of ``--layers`` Linear layers of width ``--width``, and times
+saving and loading it with ``Module.save`` and ``Module.load``, which pickle the
+whole Module, against ``Module.save_tensors`` and ``Module.load_tensors``, which
+save its arrays as a tensor store of shards of ``--shard-mib`` MiB.
+
+Usage: python scripts/benchmarks/module_save_load.py --backend torch --layers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import ivy
+
+
+def _time_s(fn, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(backend, layers, width, shard_mib, number):
+    ivy.set_backend(backend)
+    model = ivy.Sequential(*[ivy.Linear(width, width) for _ in range(layers)])
+    num_bytes = sum(w.size * 4 for w in model.v.cont_flatten()[0])
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        pickled = os.path.join(tmp, "model.pickled")
+        rows.append(
+            (
+                "pickle",
+                _time_s(lambda: model.save(pickled), number),
+                _time_s(lambda: ivy.Module.load(pickled), number),
+            )
+        )
+        store = os.path.join(tmp, "model.ivyt")
+
+        def _load():
+            model.load_tensors(store)
+            # load_tensors maps the arrays lazily, so touch them to read them
+            for w in model.v.cont_flatten()[0]:
+                ivy.sum(w)
+
+        rows.append(
+            (
+                "tensor store",
+                _time_s(
+                    lambda: model.save_tensors(
+                        store, shard_size=int(shard_mib * 2**20)
+                    ),
+                    number,
+                ),
+                _time_s(_load, number),
+            )
+        )
+    ivy.previous_backend()
+    return num_bytes, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--width", type=int, default=2048)
+    parser.add_argument("--shard-mib", type=float, default=32.0)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    num_bytes, rows = benchmark(
+        args.backend, args.layers, args.width, args.shard_mib, args.number
+    )
+    mib = num_bytes / 2**20
+    print(f"{mib:.1f} MiB of weights, backend {args.backend}")
+    print(f"{'format':<14}{'save (MiB/s)':>14}{'load (MiB/s)':>14}")
+    for name, save_s, load_s in rows:
+        print(f"{name:<14}{mib / save_s:>14.1f}{mib / load_s:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measure the time of the nest functions on large nests.
+
+Builds a nest with ``--leaves`` leaves, structured like the parameters of a model,
+a dict of layers each holding a list of (weight, bias) tuples.
+
+Usage: python scripts/benchmarks/nest_ops.py --leaves 10000
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _make_nest(leaves):
+    per_layer = 10
+    return {
+        f"layer_{i}": [(float(j), float(j + 1)) for j in range(0, per_layer, 2)]
+        for i in range(leaves // per_layer)
+    }
+
+
+def benchmark(leaves, number):
+    nest = _make_nest(leaves)
+    indices = ivy.nested_argwhere(nest, lambda x: isinstance(x, float))
+    ops = {
+        "nested_map": lambda: ivy.nested_map(lambda x: x, nest, shallow=False),
+        "nested_argwhere": lambda: ivy.nested_argwhere(
+            nest, lambda x: isinstance(x, float)
+        ),
+        "all_nested_indices": lambda: ivy.all_nested_indices(nest),
+        "multi_index_nest": lambda: ivy.multi_index_nest(nest, indices),
+    }
+    return [
+        (name, min(timeit.repeat(op, number=number, repeat=3)) / number * 1e3)
+        for name, op in ops.items()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--leaves", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    print(f"{'op':<22}{'time (ms)':>12}")
+    for name, ms in benchmark(args.leaves, args.number):
+        print(f"{name:<22}{ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
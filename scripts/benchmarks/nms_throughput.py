@@ -0,0 +1,84 @@
+"""
+Measure the time non-maximum suppression takes over many candidate boxes.
+
+Runs ``ivy.nms`` over each of the ``--num-boxes`` numbers of random boxes, and
+``ivy.batched_nms`` over the same boxes split among ``--groups`` groups, and reports
+the milliseconds per call of the best of ``--number`` runs. With the torch backend,
+``--sub-backend torchvision`` dispatches both to ``torchvision.ops``.
+
+Usage: python scripts/benchmarks/nms_throughput.py --backend torch --num-boxes 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _milliseconds_per_call(fn, args, kwargs, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return 1000 * min(times)
+
+
+def benchmark(backend, sub_backend, num_boxes, groups, iou_threshold, number):
+    ivy.set_backend(backend)
+    if sub_backend:
+        ivy.set_sub_backend(sub_backend)
+    rng = np.random.default_rng(0)
+    rows = []
+    for n in num_boxes:
+        # boxes of a few tens of pixels over an image of 1000x1000, like the candidate
+        # detections of a detector before suppression
+        corners = rng.random((n, 2), dtype="float32") * 960
+        sides = rng.random((n, 2), dtype="float32") * 60 + 5
+        boxes = ivy.array(np.concatenate([corners, corners + sides], axis=1))
+        scores = ivy.array(rng.random(n, dtype="float32"))
+        group_ids = ivy.array(rng.integers(0, groups, n))
+        kwargs = dict(iou_threshold=iou_threshold)
+        rows.append(
+            [
+                n,
+                _milliseconds_per_call(ivy.nms, (boxes, scores), kwargs, number),
+                _milliseconds_per_call(
+                    ivy.batched_nms, (boxes, scores, group_ids), kwargs, number
+                ),
+            ]
+        )
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--sub-backend", default=None)
+    parser.add_argument("--num-boxes", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--iou-threshold", type=float, default=0.5)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    rows = benchmark(
+        args.backend,
+        args.sub_backend,
+        args.num_boxes,
+        args.groups,
+        args.iou_threshold,
+        args.number,
+    )
+    print(
+        f"backend {args.backend}, sub-backend {args.sub_backend}, iou threshold"
+        f" {args.iou_threshold}, {args.groups} groups"
+    )
+    print(f"{'boxes':>8}{'nms (ms)':>14}{'batched_nms (ms)':>20}")
+    for n, nms_ms, batched_ms in rows:
+        print(f"{n:>8}{nms_ms:>14.1f}{batched_ms:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
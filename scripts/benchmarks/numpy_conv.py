@@ -0,0 +1,89 @@
+"""
+Measure the time and peak memory of the convolutions of the numpy backend.
+
+Runs ``ivy.conv_general_dilated`` over the shapes of common CNN layers, from the stem
+of a ResNet to depthwise, grouped, dilated and large kernel convolutions, on batches
+of ``--batch`` samples, and reports the best time of ``--number`` runs along with the
+peak memory allocated by numpy during a run. ``--method`` forces the im2col matmul
+(``gemm``) or the fft (``fft``) engine rather than picking one per layer (``auto``).
+
+Usage: python scripts/benchmarks/numpy_conv.py --batch 8 --method auto
+"""
+
+import argparse
+import importlib
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+# name, input size, input channels, output channels, kernel size, stride, dilation,
+# groups
+LAYERS = [
+    ("resnet stem 7x7/2", 224, 3, 64, 7, 2, 1, 1),
+    ("resnet 3x3", 56, 64, 64, 3, 1, 1, 1),
+    ("resnet 3x3/2", 56, 128, 128, 3, 2, 1, 1),
+    ("resnet 1x1", 14, 1024, 256, 1, 1, 1, 1),
+    ("resnext 3x3 g32", 28, 256, 256, 3, 1, 1, 32),
+    ("mobilenet dw 3x3", 112, 32, 32, 3, 1, 1, 32),
+    ("dilated 3x3 d2", 32, 64, 64, 3, 1, 2, 1),
+    ("large 15x15", 64, 32, 32, 15, 1, 1, 1),
+]
+
+
+def _run(x, filters, stride, dilation, groups):
+    return ivy.conv_general_dilated(
+        x,
+        filters,
+        stride,
+        "SAME",
+        dims=2,
+        feature_group_count=groups,
+        dilations=dilation,
+    )
+
+
+def benchmark(batch, method, number):
+    ivy.set_backend("numpy")
+    layers = importlib.import_module("ivy.functional.backends.numpy.layers")
+    layers._FFT_MIN_KERNEL_SIZE = {"auto": 81, "gemm": float("inf"), "fft": 1}[method]
+    rng = np.random.default_rng(0)
+    rows = []
+    for name, size, in_dim, out_dim, kernel, stride, dilation, groups in LAYERS:
+        if method == "fft" and stride * dilation > 1:
+            continue
+        x = ivy.array(rng.random((batch, size, size, in_dim), dtype="float32"))
+        filters = ivy.array(
+            rng.random((kernel, kernel, in_dim // groups, out_dim), dtype="float32")
+        )
+        tracemalloc.start()
+        _run(x, filters, stride, dilation, groups)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        times = []
+        for _ in range(number):
+            start = time.perf_counter()
+            _run(x, filters, stride, dilation, groups)
+            times.append(time.perf_counter() - start)
+        rows.append((name, min(times) * 1e3, peak))
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--method", default="auto", choices=["auto", "gemm", "fft"])
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    rows = benchmark(args.batch, args.method, args.number)
+    print(f"batch {args.batch}, method {args.method}")
+    print(f"{'layer':<20}{'time (ms)':>12}{'peak (MiB)':>14}")
+    for name, ms, peak in rows:
+        print(f"{name:<20}{ms:>12.2f}{peak:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure the step time of the optimizers, per variable against foreach.
+
+Builds variables and gradients shaped like those of a model, with ``--layers`` layers
+of a ``--width`` square weight and a bias each, and times the steps of each optimizer
+updating the variables one at a time against updating them as the flat buffers of the
+foreach mode.
+
+Usage: python scripts/benchmarks/optimizer_step.py --backend torch --layers 250
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _build(layers, width, rng):
+    return ivy.Container(
+        {
+            f"layer_{i}": {
+                "w": ivy.array(rng.standard_normal((width, width)).astype("float32")),
+                "b": ivy.array(rng.standard_normal((width,)).astype("float32")),
+            }
+            for i in range(layers)
+        }
+    )
+
+
+def _time_ms(optimizer, v, grads, number):
+    v = optimizer.step(v, grads)
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        v = optimizer.step(v, grads)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def benchmark(backend, layers, width, number):
+    ivy.set_backend(backend)
+    rng = np.random.default_rng(0)
+    v = _build(layers, width, rng)
+    grads = _build(layers, width, rng)
+    rows = []
+    for name in ["SGD", "LARS", "Adam", "AdamW", "LAMB"]:
+        cls = getattr(ivy, name)
+        rows.append(
+            (
+                name,
+                _time_ms(cls(lr=1e-3), v, grads, number),
+                _time_ms(cls(lr=1e-3, foreach=True), v, grads, number),
+            )
+        )
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--layers", type=int, default=250)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    rows = benchmark(args.backend, args.layers, args.width, args.number)
+    print(f"{2 * args.layers} variables, backend {args.backend}")
+    print(f"{'optimizer':<12}{'per variable (ms)':>20}{'foreach (ms)':>15}")
+    for name, per_variable, foreach in rows:
+        print(f"{name:<12}{per_variable:>20.2f}{foreach:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
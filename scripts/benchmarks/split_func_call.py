@@ -0,0 +1,79 @@
+"""
+Measure the time of ``ivy.split_func_call`` on a batched matmul for different numbers
+of workers.
+
+The speedup from more workers depends on the number of cores and on the backend
+releasing the GIL while computing each chunk.
+
+Usage: python scripts/benchmarks/split_func_call.py --backend numpy --workers 1 2 4
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+import ivy
+
+
+def benchmark(backend, batch, features, chunk_size, workers, number):
+    ivy.set_backend(backend)
+    x = ivy.array(np.random.uniform(size=(batch, features)).astype("float32"))
+    w = ivy.array(np.random.uniform(size=(features, features)).astype("float32"))
+
+    def func(x):
+        return ivy.tanh(ivy.matmul(x, w))
+
+    rows = [
+        (
+            "unsplit",
+            min(timeit.repeat(lambda: func(x), number=number, repeat=3)) / number,
+        )
+    ]
+    for num_workers in workers:
+        rows.append(
+            (
+                f"num_workers={num_workers}",
+                min(
+                    timeit.repeat(
+                        lambda: ivy.split_func_call(
+                            func,
+                            [x],
+                            "concat",
+                            chunk_size=chunk_size,
+                            num_workers=num_workers,
+                        ),
+                        number=number,
+                        repeat=3,
+                    )
+                )
+                / number,
+            )
+        )
+    ivy.previous_backend()
+    return [(name, seconds * 1e3) for name, seconds in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch", type=int, default=8192)
+    parser.add_argument("--features", type=int, default=512)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    print(f"{'call':<22}{'time (ms)':>12}")
+    for name, ms in benchmark(
+        args.backend,
+        args.batch,
+        args.features,
+        args.chunk_size,
+        args.workers,
+        args.number,
+    ):
+        print(f"{name:<22}{ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
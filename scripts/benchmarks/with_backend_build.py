@@ -0,0 +1,51 @@
+"""
+Measure the time ``ivy.with_backend`` takes to build a local ivy package.
+
+Each build runs in a fresh interpreter, first with an empty on-disk module cache
+and then with the cache written by the first run.
+
+Usage: python scripts/benchmarks/with_backend_build.py --backends numpy torch
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_SNIPPET = """
+import json, logging
+logging.disable(logging.WARNING)
+import ivy
+ivy.with_backend({backend!r})
+info = ivy.utils.backend.with_backend_build_info()
+print(json.dumps([info["builds"][-1][1], info["module_cache"]["hits"]]))
+"""
+
+
+def _run(backend, cache_dir):
+    out = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(backend=backend)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "IVY_WITH_BACKEND_CACHE_DIR": cache_dir},
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    args = parser.parse_args()
+    print(f"{'backend':<12}{'cold (ms)':>12}{'warm (ms)':>12}{'cached modules':>16}")
+    for backend in args.backends:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold, _ = _run(backend, cache_dir)
+            warm, hits = _run(backend, cache_dir)
+        print(f"{backend:<12}{cold * 1e3:>12.1f}{warm * 1e3:>12.1f}{hits:>16}")
+
+
+if __name__ == "__main__":
+    main()